@@ -34,6 +34,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import animation
 
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.render import Escena, mostrar_animacion, exportar_en_paralelo, renderizar_paralelo, EXPORTAR, activar_exportacion
+# Bloque DH y cinemática directa de una pose: DH() y fkine() viven en robotica.scara
+# (se importan aquí para que el examen las siga exponiendo); tabla_poses() da los
+# mismos puntos para toda la trayectoria de una vez
+from robotica.scara import DH, fkine, tabla_poses  # noqa: F401
+from robotica.perfilado import tramo
+from robotica.registro import guardar_trayectoria, RUTA as RUTA_TRAYECTORIA
+from robotica.configuracion import SCARA, desde_argv, ruta_variante
+from robotica.perfiles import rampa
+
 # ------------------ Utilidades ------------------
 def ask_float(prompt, default=None):
     while True:
@@ -45,67 +57,9 @@ def ask_float(prompt, default=None):
         except ValueError:
             print("Valor inválido, intenta de nuevo.")
 
-# ------------------ Bloque DH ------------------
-def DH(theta_deg, d, a, alpha_deg=0.0):
-    th = np.deg2rad(theta_deg)
-    al = np.deg2rad(alpha_deg)
-    c, s = np.cos(th), np.sin(th)
-    ca, sa = np.cos(al), np.sin(al)
-    return np.array([
-        [ c, -s*ca,  s*sa, a*c],
-        [ s,  c*ca, -c*sa, a*s],
-        [ 0,    sa,    ca,   d],
-        [ 0,     0,     0,   1]
-    ], dtype=float)
-
-# ------------------ Cinemática directa (con DH) ------------------
-def fkine(theta1, theta2, l_barra_abs, theta3,
-          A1, A2, BASE_HEIGHT, BRAZO_OFFSET_Z, R_PLATILLO):
-
-    Lp = 322.0  # pistón fijo
-
-    delta_z = float(l_barra_abs - BASE_HEIGHT)
-
-    T01 = DH(theta1, 0.0, A1, 0.0)
-    T12 = DH(theta2, BRAZO_OFFSET_Z + delta_z, A2, 0.0)
-    T23_R = DH(theta3, 0.0, 0.0, 0.0)
-
-    T02 = T01 @ T12
-    T03 = T02 @ T23_R
-
-    p_base = np.array([0,0,0])
-    p_eje  = np.array([0,0,BASE_HEIGHT])
-
-    p1 = (T01 @ np.array([0,0,BASE_HEIGHT,1]))[:3]
-    p2 = (T02 @ np.array([0,0,BASE_HEIGHT,1]))[:3]
-
-    p_piston_base = p2.copy()
-    p_barra_top = (T03 @ np.array([0,0,BASE_HEIGHT+Lp,1]))[:3]
-
-    t3 = np.deg2rad(theta3)
-    angs = np.linspace(0,2*np.pi,60)
-
-    circ_x = p_barra_top[0] + R_PLATILLO*np.cos(angs+t3)
-    circ_y = p_barra_top[1] + R_PLATILLO*np.sin(angs+t3)
-    circ_z = np.full_like(circ_x,p_barra_top[2])
-
-    punto_x = p_barra_top[0] + R_PLATILLO*np.cos(t3)
-    punto_y = p_barra_top[1] + R_PLATILLO*np.sin(t3)
-    punto_z = p_barra_top[2]
-
-    pmx,pmy,pmz = p_piston_base
-
-    return (p_base, p_eje, p1, p2, p_barra_top,
-            circ_x, circ_y, circ_z,
-            punto_x, punto_y, punto_z,
-            pmx, pmy, pmz)
-
 # ------------------ Dibujo ------------------
-def dibujar_robot(ax, p_base, p_eje, p1, p2, p_barra_top,
-                  circ_x, circ_y, circ_z,
-                  punto_x, punto_y, punto_z,
-                  pmx, pmy, pmz, lim):
-
+def configurar_ejes(ax, lim):
+    # Límites, etiquetas y cámara: se fijan una sola vez (no en cada fotograma)
     ax.set_xlim(-lim,lim)
     ax.set_ylim(-lim,lim)
     ax.set_zlim(0,max(1600,lim))
@@ -114,68 +68,111 @@ def dibujar_robot(ax, p_base, p_eje, p1, p2, p_barra_top,
     ax.set_facecolor('white')
     ax.view_init(elev=25,azim=45)
 
-    ax.scatter(*p_base,color='red',s=60)
-    ax.plot([p_base[0],p_eje[0]],[p_base[1],p_eje[1]],[p_base[2],p_eje[2]],color='red',linewidth=3)
+def dibujar_robot(escena, p_base, p_eje, p1, p2, p_barra_top,
+                  circ_x, circ_y, circ_z,
+                  punto_x, punto_y, punto_z,
+                  pmx, pmy, pmz):
+
+    escena.scatter(*p_base,color='red',s=60)
+    escena.plot([p_base[0],p_eje[0]],[p_base[1],p_eje[1]],[p_base[2],p_eje[2]],color='red',linewidth=3)
 
-    ax.plot([p_eje[0],p1[0]],[p_eje[1],p1[1]],[p_eje[2],p1[2]],color='blue',linewidth=5)
+    escena.plot([p_eje[0],p1[0]],[p_eje[1],p1[1]],[p_eje[2],p1[2]],color='blue',linewidth=5)
 
     p2_h = np.array([p2[0],p2[1],p1[2]])
-    ax.plot([p1[0],p2_h[0]],[p1[1],p2_h[1]],[p1[2],p2_h[2]],color='cyan',linewidth=5)
+    escena.plot([p1[0],p2_h[0]],[p1[1],p2_h[1]],[p1[2],p2_h[2]],color='cyan',linewidth=5)
     if abs(p2[2]-p2_h[2])>1e-6:
-        ax.plot([p2_h[0],p2[0]],[p2_h[1],p2[1]],[p2_h[2],p2[2]],color='cyan',linewidth=1.5)
+        escena.plot([p2_h[0],p2[0]],[p2_h[1],p2[1]],[p2_h[2],p2[2]],color='cyan',linewidth=1.5)
 
-    ax.plot([pmx,p_barra_top[0]],[pmy,p_barra_top[1]],[pmz,p_barra_top[2]],color='orange',linewidth=4)
+    escena.plot([pmx,p_barra_top[0]],[pmy,p_barra_top[1]],[pmz,p_barra_top[2]],color='orange',linewidth=4)
 
-    ax.plot(circ_x,circ_y,circ_z,color='green',linewidth=3)
-    ax.scatter(punto_x,punto_y,punto_z,color='red',s=40)
-    ax.scatter(p1[0],p1[1],p1[2],color='black',s=18)
-    ax.scatter(p2[0],p2[1],p2[2],color='black',s=18)
+    escena.plot(circ_x,circ_y,circ_z,color='green',linewidth=3)
+    escena.scatter(punto_x,punto_y,punto_z,color='red',s=40)
+    escena.scatter(p1[0],p1[1],p1[2],color='black',s=18)
+    escena.scatter(p2[0],p2[1],p2[2],color='black',s=18)
 
 # ------------------ Animación ------------------
 def animar_movimiento_unico(theta1_fixed,A1,A2,BAR_MIN,BAR_MAX,R_PLATILLO,BRAZO_OFFSET_Z,
-                            frames=240,theta2_final=90.0,theta3_total=360.0):
+                            frames=240,theta2_final=90.0,theta3_total=360.0,nombre=None):
 
     BASE_HEIGHT=776.0
 
     if BAR_MAX < BAR_MIN: BAR_MIN,BAR_MAX = BAR_MAX,BAR_MIN
 
-    l_vals = np.linspace(BAR_MAX,BAR_MIN,frames)
-    th2 = np.linspace(0,theta2_final,frames)
-    th3 = np.linspace(0,theta3_total,frames)
+    # Rampa de las 3 articulaciones (lineal por defecto; ROBOTICA_PERFIL=quintico, ...)
+    l_vals,th2,th3 = rampa([BAR_MAX,0,0],[BAR_MIN,theta2_final,theta3_total],frames).T
+
+    # Etapa 1: cinemática de TODA la trayectoria en una sola pasada (tabla de poses,
+    # mismos puntos que fkine() fotograma por fotograma)
+    with tramo('cinematica'):   # medible con ROBOTICA_PERFILADO
+        poses = tabla_poses(theta1_fixed,th2,l_vals,th3,
+                            A1,A2,BASE_HEIGHT,BRAZO_OFFSET_Z,R_PLATILLO)
+
+    # Barrido articular a disco (.rtray) si se pide con ROBOTICA_TRAYECTORIA
+    guardar_trayectoria(poses,'scara',
+                        dict(A1=A1,A2=A2,BAR_MIN=BAR_MIN,BAR_MAX=BAR_MAX,R_PLATILLO=R_PLATILLO,
+                             BRAZO_OFFSET_Z=BRAZO_OFFSET_Z,BASE_HEIGHT=BASE_HEIGHT),
+                        columnas=['theta1','theta2','l_barra','theta3'],
+                        ruta=ruta_variante(RUTA_TRAYECTORIA,nombre))
 
     fig = plt.figure(figsize=(10,8))
     ax = fig.add_subplot(111,projection='3d')
     lim = max(1600,A1+A2+300)
+    configurar_ejes(ax,lim)
+    escena = Escena(ax)   # artistas persistentes: se actualizan en cada fotograma
 
     def update(i):
-        ax.cla()
-        (p_base,p_eje,p1,p2,p_top,
-         cx,cy,cz,
-         px,py,pz,
-         pmx,pmy,pmz)=fkine(theta1_fixed,th2[i],l_vals[i],th3[i],
-                             A1,A2,BASE_HEIGHT,BRAZO_OFFSET_Z,R_PLATILLO)
-        dibujar_robot(ax,p_base,p_eje,p1,p2,p_top,
-                      cx,cy,cz,px,py,pz,pmx,pmy,pmz,lim)
+        # Etapa 2: el dibujo sólo lee la fila i de la tabla
+        escena.nuevo_fotograma()
+        q = poses[i]
+        dibujar_robot(escena,q['p_base'],q['p_eje'],q['p1'],q['p2'],q['p_top'],
+                      *q['circulo'],*q['punto'],*q['p2'])
+        escena.fin_fotograma()
         return []
 
-    ani = animation.FuncAnimation(fig,update,frames=frames,interval=40,
-                                  blit=False,repeat=False)
-    plt.show()
+    # En lote, cada variante exporta a su propio archivo (salida_<nombre>.gif)
+    salida = ruta_variante(EXPORTAR,nombre)
+
+    if exportar_en_paralelo():
+        # Exportación sin pantalla repartida entre procesos (ROBOTICA_PROCESOS)
+        renderizar_paralelo(fig,update,frames,fps=1000/40,ruta=salida)
+    else:
+        ani = animation.FuncAnimation(fig,update,frames=frames,interval=40,
+                                      blit=False,repeat=False)
+        mostrar_animacion(ani,fig,40,salida)   # ventana interactiva, o archivo si ROBOTICA_EXPORTAR
+    plt.close(fig)   # en lote no se acumulan figuras
 
 # ------------------ Main ------------------
 if __name__=="__main__":
     theta1_fixed = 30.0   # <<--- AQUÍ SE FIJA θ1 = 30°
-    A1 = ask_float("A1 [715]: ",715.0)
-    A2 = ask_float("A2 [850]: ",850.0)
-    BAR_MIN = ask_float("BAR_MIN [418.5]: ",418.5)
-    BAR_MAX = ask_float("BAR_MAX [880.0]: ",880.0)
-    R_PLATILLO = ask_float("R_PLATILLO [100.0]: ",100.0)
-    BRAZO_OFFSET_Z = ask_float("BRAZO_OFFSET_Z [-40.0]: ",-40.0)
-
-    frames = int(ask_float("Frames [240]: ",240))
-    theta2_final = ask_float("θ2_final [90]: ",90.0)
-    theta3_total = ask_float("θ3_total [360]: ",360.0)
-
-    animar_movimiento_unico(theta1_fixed,A1,A2,BAR_MIN,BAR_MAX,
-                             R_PLATILLO,BRAZO_OFFSET_Z,
-                             frames=frames,theta2_final=theta2_final,theta3_total=theta3_total)
+
+    # Sin argumentos se preguntan los datos.  En lote, sin preguntas: archivo(s)
+    # .json/.jsonl/.csv y/o CLAVE=valor (ver robotica.configuracion), p. ej.
+    #   python "EXAMEN 3ER PARCIAL.py" variantes.json frames=60
+    # En lote no se abre ninguna ventana: cada variante se exporta a
+    # ROBOTICA_EXPORTAR, o a scara.gif (scara_<nombre>.gif) si no se definió.
+    variantes = desde_argv(sys.argv[1:],SCARA)
+    if variantes is not None and not EXPORTAR:
+        EXPORTAR = activar_exportacion('scara.gif')
+    if variantes is None:
+        A1 = ask_float("A1 [715]: ",715.0)
+        A2 = ask_float("A2 [850]: ",850.0)
+        BAR_MIN = ask_float("BAR_MIN [418.5]: ",418.5)
+        BAR_MAX = ask_float("BAR_MAX [880.0]: ",880.0)
+        R_PLATILLO = ask_float("R_PLATILLO [100.0]: ",100.0)
+        BRAZO_OFFSET_Z = ask_float("BRAZO_OFFSET_Z [-40.0]: ",-40.0)
+
+        frames = int(ask_float("Frames [240]: ",240))
+        theta2_final = ask_float("θ2_final [90]: ",90.0)
+        theta3_total = ask_float("θ3_total [360]: ",360.0)
+
+        variantes = [dict(A1=A1,A2=A2,BAR_MIN=BAR_MIN,BAR_MAX=BAR_MAX,R_PLATILLO=R_PLATILLO,
+                          BRAZO_OFFSET_Z=BRAZO_OFFSET_Z,frames=frames,
+                          theta2_final=theta2_final,theta3_total=theta3_total,nombre=None)]
+
+    for v in variantes:
+        if v['nombre'] is not None:
+            print(f"Variante {v['nombre']}: "+", ".join(f"{k}={v[k]:g}" for k in SCARA))
+        animar_movimiento_unico(theta1_fixed,v['A1'],v['A2'],v['BAR_MIN'],v['BAR_MAX'],
+                                 v['R_PLATILLO'],v['BRAZO_OFFSET_Z'],
+                                 frames=v['frames'],theta2_final=v['theta2_final'],
+                                 theta3_total=v['theta3_total'],nombre=v['nombre'])
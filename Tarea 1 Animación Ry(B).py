@@ -2,12 +2,19 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from robotica.transformaciones import roty
+from robotica.render import Escena
 
 # create the fig and ax objects to handle figure and axes of the fixed frame
 fig,ax = plt.subplots()
 
 # Use 3d view 
 ax = plt.axes(projection = "3d")
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 
 
@@ -42,60 +49,38 @@ def fix_system(axis_length):
     ax.plot3D(zp, zp, z, color='green')
     
 
-def sind(t):
-    # sind function
-    # Computes the sin() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.sin(t*np.pi/180)
-    return res
-
-def cosd(t):
-    # sind function
-    # Computes the cos() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.cos(t*np.pi/180)
-    return res
-
-
-def RotZ(t):
-    Rz = np.array(([cosd(t),0,sind(t)],[0,1,0],[-sind(t),0,cosd(t)]))
-    return Rz
+def RotZ(t, out=None):
+    # Matriz de rotación 3x3 sobre el eje Y
+    return roty(t, out=out)
 
 def drawVector(v):
     deltaX = [0, v[0]]
     deltaY = [0, v[1]]
     deltaZ = [0, v[2]]
-    ax.plot3D(deltaX, deltaY, deltaZ,color='orange')
+    escena.plot(deltaX, deltaY, deltaZ,color='orange')
     #plt.draw()
     #plt.pause(0.001)
 
 def rotate(t): #Es un stop motion animation, borra cada que una posición cambia para representar el movimiento.
+    # Límites, cámara y ejes fijos: se dibujan una sola vez
+    setaxis(-1,1,-1,1,-1,1)
+    fix_system(1)
+
     n = 0 #Defino que sea cero, porque es la condicion inicial.
+    R = np.empty((3, 3)) #Buffer de la rotación, se reutiliza en cada paso.
     while n < t: #Mientras n sea menor o diferente a t se hará la animación.
-        ax.cla() #Limpia todo, es el que borra lo que paso antes de dibujar
-        # Set the view 
-        setaxis(-1,1,-1,1,-1,1) #Ajustar la camara 
-
-        # plot the axis
-        fix_system(1) #Dibuja las lineas.
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
 
         # draw vector1
         v1 = np.array([1,0,1])
         drawVector(v1) #Dibuja el vector inicial 
 
         # draw vector2
-        v2 = RotZ(n).dot(v1) #Rota el vector rotado el angulo que N indique.
+        v2 = RotZ(n, out=R).dot(v1) #Rota el vector rotado el angulo que N indique.
         drawVector(v2)
 
         n = n + 1 #Es el aumento automático de N hasta que N=T, 
-        plt.draw() #Que lo dibuje
-        plt.pause(0.001) #Es una pausa, para que se vea el efecto. Sin esto no veríamos nada.
+        escena.mostrar(0.001)  #Es una pausa, para que se vea el efecto. Sin esto no veríamos nada.
 
 #Aqui terminan las funciones
 
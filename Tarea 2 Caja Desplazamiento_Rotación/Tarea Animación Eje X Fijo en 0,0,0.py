@@ -2,10 +2,18 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import rotx_lote
+from robotica.render import Escena, exportar_en_paralelo, renderizar_paralelo
+from robotica.cuerpos import CAJA, fotogramas
 
 # Crear la figura y los ejes 3D
 fig, ax = plt.subplots()
 ax = plt.axes(projection="3d")  # Activar proyección 3D
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 
 #Función para ajustar la vista 3D
@@ -29,63 +37,11 @@ def fix_system(axis_length, linewidth=5):
     ax.plot3D(zp, zp, z, color='green', linewidth=linewidth) # Eje Z
 
 
-#Funciones trigonométricas en grados
-def sind(t):
-    return np.sin(t * np.pi / 180)  # Seno en grados
-
-def cosd(t):
-    return np.cos(t * np.pi / 180)  # Coseno en grados
-
-
-#Matriz de rotación alrededor del eje X
-def RotX(t):
-    # Matriz de rotación 3x3 sobre el eje X
-    Rx = np.array([
-        [1, 0, 0],
-        [0, cosd(t), -sind(t)],
-        [0, sind(t), cosd(t)]
-    ])
-    return Rx
-
-
-#Función para dibujar un vector entre dos puntos
-def drawVector(p_fin, p_init=[0, 0, 0], color='black', linewidth=1):
-    deltaX = [p_init[0], p_fin[0]]  # Componente X
-    deltaY = [p_init[1], p_fin[1]]  # Componente Y
-    deltaZ = [p_init[2], p_fin[2]]  # Componente Z
-    ax.plot3D(deltaX, deltaY, deltaZ, color=color, linewidth=linewidth)  # Dibujar línea
-
-
 #Función para dibujar la caja conectando sus 8 vértices
-def drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='black'):
-    # Dibujar los vértices como puntos
-    drawScatter(p1)
-    drawScatter(p2)
-    drawScatter(p3)
-    drawScatter(p4)
-    drawScatter(p5)
-    drawScatter(p6)
-    drawScatter(p7)
-    drawScatter(p8)
-
-    # Dibujar aristas de la caja conectando los vértices
-    drawVector(p1, p2, color=color)
-    drawVector(p2, p3, color=color)
-    drawVector(p3, p4, color=color)
-    drawVector(p4, p1, color=color)
-    drawVector(p5, p6, color=color)
-    drawVector(p6, p7, color=color)
-    drawVector(p7, p8, color=color)
-    drawVector(p8, p5, color=color)
-    drawVector(p4, p8, color=color)
-    drawVector(p1, p5, color=color)
-    drawVector(p3, p7, color=color)
-    drawVector(p2, p6, color=color)
-
-
-# Función para dibujar un punto (vértice) 
-def drawScatter(point, color='black', marker='o'):
-    ax.scatter(point[0], point[1], point[2], marker=marker, color=color)
+def drawBox(V, color='black'):
+    # 12 aristas y 8 vértices en sólo 2 artistas (ver robotica.render.Escena.caja)
+    # V: arreglo (8,3) con los vértices p1..p8, uno por fila
+    escena.caja(V, color=color, color_vertices='black')
 
 
 #Animación de rotación fija alrededor del eje X
@@ -95,42 +51,37 @@ def animate_rotation_X(steps=36):
     steps: número de pasos de la animación
     """
     # Definición de los puntos iniciales de la caja (en el origen)
-    p1_init = np.array([0, 0, 0])
-    p2_init = np.array([7, 0, 0])
-    p3_init = np.array([7, 0, 3])
-    p4_init = np.array([0, 0, 3])
-    p5_init = np.array([0, 2, 0])
-    p6_init = np.array([7, 2, 0])
-    p7_init = np.array([7, 2, 3])
-    p8_init = np.array([0, 2, 3])
+    # (cuerpos.CAJA: una fila por vértice p1..p8, se transforman todos con un solo producto)
+    caja_init = CAJA
 
-    n = 0  # Contador de pasos
-    while n <= steps:
-        ax.cla()  # Limpiar todo para el nuevo fotograma
+    # Límites, cámara y ejes fijos: se dibujan una sola vez
+    setaxis(-10, 10, -10, 10, -10, 10)
+    fix_system(10, 1)
 
-        # Dibujar ejes fijos
-        setaxis(-10, 10, -10, 10, -10, 10)
-        fix_system(10, 1)
+    # Matrices de rotación de TODOS los pasos (un grado por paso): (steps+1, 3, 3)
+    R = rotx_lote(np.arange(steps + 1))
 
-        # Calcular matriz de rotación para el paso actual
-        R = RotX(n)
+    # Caja rotada en cada fotograma con un solo producto: (steps+1, 8, 3)
+    cajas = fotogramas(caja_init, R)
 
-        # Aplicar rotación a cada vértice de la caja
-        p1 = R.dot(p1_init)
-        p2 = R.dot(p2_init)
-        p3 = R.dot(p3_init)
-        p4 = R.dot(p4_init)
-        p5 = R.dot(p5_init)
-        p6 = R.dot(p6_init)
-        p7 = R.dot(p7_init)
-        p8 = R.dot(p8_init)
+    if exportar_en_paralelo():
+        # Exportación sin pantalla repartida entre procesos (ROBOTICA_PROCESOS)
+        def fotograma(n):
+            escena.nuevo_fotograma()
+            drawBox(cajas[n], color='orange')
+            escena.fin_fotograma()
+        renderizar_paralelo(fig, fotograma, steps + 1, fps=10)
+        return
+
+    n = 0  # Contador de pasos
+    while n <= steps:
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
 
         # Dibujar la caja rotada
-        drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='orange')
+        drawBox(cajas[n], color='orange')
 
         n += 1  # Incrementar paso
-        plt.draw()  # Dibujar el fotograma actual
-        plt.pause(0.1)  # Pausa corta para efecto de animación
+        escena.mostrar(0.1)  # Pausa corta para efecto de animación
 
 
 #Ejecutar animación
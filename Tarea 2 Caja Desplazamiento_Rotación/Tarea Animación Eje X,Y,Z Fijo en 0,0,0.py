@@ -2,11 +2,19 @@
 import matplotlib.pyplot as plt  # Librería principal de gráficos
 from mpl_toolkits import mplot3d  # Herramientas 3D
 import numpy as np  # Librería para cálculos numéricos
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import rotx_lote, roty_lote, rotz_lote
+from robotica.render import Escena, exportar_en_paralelo, renderizar_paralelo
+from robotica.cuerpos import CAJA, fotogramas
 
 
 #Crear figura y ejes 3D
 fig, ax = plt.subplots()  # Crear ventana de gráficos
 ax = plt.axes(projection="3d")  # Activar proyección 3D
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 
 #Función para ajustar la vista 3D
@@ -29,73 +37,11 @@ def fix_system(axis_length, linewidth=5):
     ax.plot3D(zp, zp, z, color='green', linewidth=linewidth) # Dibujar eje Z en verde
 
 
-#Funciones trigonométricas en grados
-def sind(t):
-    return np.sin(t * np.pi / 180)  # Seno usando grados
-
-def cosd(t):
-    return np.cos(t * np.pi / 180)  # Coseno usando grados
-
-
-#Matrices de rotación para X, Y y Z
-def RotX(t):
-    return np.array([  # Matriz 3x3 para rotación sobre X
-        [1, 0, 0],
-        [0, cosd(t), -sind(t)],
-        [0, sind(t), cosd(t)]
-    ])
-
-def RotY(t):
-    return np.array([  # Matriz 3x3 para rotación sobre Y
-        [cosd(t), 0, sind(t)],
-        [0, 1, 0],
-        [-sind(t), 0, cosd(t)]
-    ])
-
-def RotZ(t):
-    return np.array([  # Matriz 3x3 para rotación sobre Z
-        [cosd(t), -sind(t), 0],
-        [sind(t), cosd(t), 0],
-        [0, 0, 1]
-    ])
-
-
-#Función para dibujar un vector entre dos puntos
-def drawVector(p_fin, p_init=[0, 0, 0], color='black', linewidth=1):
-    deltaX = [p_init[0], p_fin[0]]  # Diferencia X
-    deltaY = [p_init[1], p_fin[1]]  # Diferencia Y
-    deltaZ = [p_init[2], p_fin[2]]  # Diferencia Z
-    ax.plot3D(deltaX, deltaY, deltaZ, color=color, linewidth=linewidth)  # Dibujar línea 3D
-
-
 #Función para dibujar la caja conectando sus 8 vértices
-def drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='black'):
-    drawScatter(p1)  # Dibujar vértice 1
-    drawScatter(p2)  # Dibujar vértice 2
-    drawScatter(p3)  # Dibujar vértice 3
-    drawScatter(p4)  # Dibujar vértice 4
-    drawScatter(p5)  # Dibujar vértice 5
-    drawScatter(p6)  # Dibujar vértice 6
-    drawScatter(p7)  # Dibujar vértice 7
-    drawScatter(p8)  # Dibujar vértice 8
-
-    drawVector(p1, p2, color=color)  # Dibujar arista 1-2
-    drawVector(p2, p3, color=color)  # Dibujar arista 2-3
-    drawVector(p3, p4, color=color)  # Dibujar arista 3-4
-    drawVector(p4, p1, color=color)  # Dibujar arista 4-1
-    drawVector(p5, p6, color=color)  # Dibujar arista 5-6
-    drawVector(p6, p7, color=color)  # Dibujar arista 6-7
-    drawVector(p7, p8, color=color)  # Dibujar arista 7-8
-    drawVector(p8, p5, color=color)  # Dibujar arista 8-5
-    drawVector(p4, p8, color=color)  # Dibujar arista 4-8
-    drawVector(p1, p5, color=color)  # Dibujar arista 1-5
-    drawVector(p3, p7, color=color)  # Dibujar arista 3-7
-    drawVector(p2, p6, color=color)  # Dibujar arista 2-6
-
-
-#Función para dibujar un punto (vértice)
-def drawScatter(point, color='black', marker='o'):
-    ax.scatter(point[0], point[1], point[2], marker=marker, color=color)  # Dibujar punto 3D
+def drawBox(V, color='black'):
+    # 12 aristas y 8 vértices en sólo 2 artistas (ver robotica.render.Escena.caja)
+    # V: arreglo (8,3) con los vértices p1..p8, uno por fila
+    escena.caja(V, color=color, color_vertices='black')
 
 
 #Animación secuencial de rotación X -> Y -> Z
@@ -107,86 +53,53 @@ def animate_rotation_sequential(steps=10, pause_time=0.1):
     3) Rotación Z sobre posición final de Y
     """
     # Definir puntos iniciales de la caja
-    p1_init = np.array([0, 0, 0])
-    p2_init = np.array([7, 0, 0])
-    p3_init = np.array([7, 0, 3])
-    p4_init = np.array([0, 0, 3])
-    p5_init = np.array([0, 2, 0])
-    p6_init = np.array([7, 2, 0])
-    p7_init = np.array([7, 2, 3])
-    p8_init = np.array([0, 2, 3])
+    # (cuerpos.CAJA: una fila por vértice p1..p8, se transforman todos con un solo producto)
+    caja_init = CAJA
+
+    # Límites, cámara y ejes fijos: se dibujan una sola vez
+    setaxis(-10, 10, -10, 10, -10, 10)
+    fix_system(10, 1)
+
+    n = np.arange(steps + 1)  # Un grado por paso
+
+    # Cada fase se calcula con un solo producto para todos sus pasos:
+    # X sobre la caja inicial, Y sobre la posición final de X, Z sobre la final de Y
+    cajas_X = fotogramas(caja_init, rotx_lote(n))
+    cajas_Y = fotogramas(cajas_X[-1], roty_lote(n))
+    cajas_Z = fotogramas(cajas_Y[-1], rotz_lote(n))
+
+    if exportar_en_paralelo():
+        # Exportación sin pantalla repartida entre procesos (ROBOTICA_PROCESOS):
+        # las tres fases seguidas forman una sola secuencia de fotogramas
+        cajas = np.concatenate([cajas_X, cajas_Y, cajas_Z])
+        colores = ['orange'] * (steps + 1) + ['purple'] * (steps + 1) + ['magenta'] * (steps + 1)
+        def fotograma(k):
+            escena.nuevo_fotograma()
+            drawBox(cajas[k], color=colores[k])
+            escena.fin_fotograma()
+        renderizar_paralelo(fig, fotograma, len(cajas), fps=1 / pause_time)
+        return
 
     #Rotación sobre X
-    for n in range(steps + 1):
-        ax.cla()  # Limpiar fotograma anterior
-        setaxis(-10, 10, -10, 10, -10, 10)  # Ajustar vista
-        fix_system(10, 1)  # Dibujar ejes fijos
-
-        R = RotX(n)  # Calcular matriz de rotación X paso a paso
-
-        # Aplicar rotación X a cada vértice
-        p1 = R.dot(p1_init)
-        p2 = R.dot(p2_init)
-        p3 = R.dot(p3_init)
-        p4 = R.dot(p4_init)
-        p5 = R.dot(p5_init)
-        p6 = R.dot(p6_init)
-        p7 = R.dot(p7_init)
-        p8 = R.dot(p8_init)
-
-        drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='orange')  # Dibujar caja
-        plt.draw()
-        plt.pause(pause_time)  # Pausa para animación
-
-    # Guardar posición final de X
-    final_X = [p1, p2, p3, p4, p5, p6, p7, p8]
-
-    #Rotación sobre Y
-    for n in range(steps + 1):
-        ax.cla()
-        setaxis(-10, 10, -10, 10, -10, 10)
-        fix_system(10, 1)
-
-        R = RotY(n)  # Matriz de rotación Y paso a paso
-
-        # Aplicar rotación Y sobre posición final de X
-        p1 = R.dot(final_X[0])
-        p2 = R.dot(final_X[1])
-        p3 = R.dot(final_X[2])
-        p4 = R.dot(final_X[3])
-        p5 = R.dot(final_X[4])
-        p6 = R.dot(final_X[5])
-        p7 = R.dot(final_X[6])
-        p8 = R.dot(final_X[7])
-
-        drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='purple')
-        plt.draw()
-        plt.pause(pause_time)
-
-    # Guardar posición final de Y
-    final_Y = [p1, p2, p3, p4, p5, p6, p7, p8]
-
-    #Rotación sobre Z
-    for n in range(steps + 1):
-        ax.cla()
-        setaxis(-10, 10, -10, 10, -10, 10)
-        fix_system(10, 1)
-
-        R = RotZ(n)  # Matriz de rotación Z paso a paso
-
-        # Aplicar rotación Z sobre posición final de Y
-        p1 = R.dot(final_Y[0])
-        p2 = R.dot(final_Y[1])
-        p3 = R.dot(final_Y[2])
-        p4 = R.dot(final_Y[3])
-        p5 = R.dot(final_Y[4])
-        p6 = R.dot(final_Y[5])
-        p7 = R.dot(final_Y[6])
-        p8 = R.dot(final_Y[7])
-
-        drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color='magenta')
-        plt.draw()
-        plt.pause(pause_time)
+    for k in range(steps + 1):
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
+
+        drawBox(cajas_X[k], color='orange')  # Dibujar caja
+        escena.mostrar(pause_time)  # Pausa para animación
+
+    #Rotación sobre Y (parte de la posición final de X)
+    for k in range(steps + 1):
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
+
+        drawBox(cajas_Y[k], color='purple')
+        escena.mostrar(pause_time)
+
+    #Rotación sobre Z (parte de la posición final de Y)
+    for k in range(steps + 1):
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
+
+        drawBox(cajas_Z[k], color='magenta')
+        escena.mostrar(pause_time)
 
 
 #Ejecutar animación secuencial
@@ -1,7 +1,11 @@
 # Import libraries and packages
 import matplotlib.pyplot as plt      # Librería para graficar en 2D/3D
 from mpl_toolkits import mplot3d     # Permite graficar en 3D
-import numpy as np                   # Librería para cálculos con matrices y vectores
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import roty_h
 
 # Crear la figura y ejes
 fig,ax = plt.subplots()              
@@ -24,23 +28,9 @@ def fix_system(axis_length):
     ax.plot3D(zp, y, zp, color='blue')   # Dibuja eje Y en azul
     ax.plot3D(zp, zp, z, color='green')  # Dibuja eje Z en verde
 
-def sind(t):
-    # Calcula el seno de un ángulo en grados
-    return np.sin(t*np.pi/180)
-
-def cosd(t):
-    # Calcula el coseno de un ángulo en grados
-    return np.cos(t*np.pi/180)
-
-def RotY(t):
+def RotY(t, out=None):
     # Matriz 4x4 homogénea de rotación en Y
-    Ry = np.array([
-        [ cosd(t), 0, sind(t), 0],   # Fila 1
-        [ 0,       1, 0,       0],   # Fila 2
-        [-sind(t), 0, cosd(t), 0],   # Fila 3
-        [ 0,       0, 0,       1]    # Fila 4 (homogénea)
-    ])
-    return Ry                        # Devuelve la matriz 4x4
+    return roty_h(t, out=out)
 
 def drawVector(v):
     # Dibuja un vector 3D desde el origen
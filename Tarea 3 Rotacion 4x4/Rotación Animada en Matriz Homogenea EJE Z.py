@@ -2,10 +2,17 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import rotz_h
+from robotica.render import Escena
 
 # create the fig and ax objects to handle figure and axes of the fixed frame
 fig,ax = plt.subplots()
 ax = plt.axes(projection = "3d")  # Vista 3D
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 def setaxis(x1, x2, y1, y2, z1, z2):
     # Ajusta los límites visibles de la gráfica y la cámara
@@ -24,48 +31,36 @@ def fix_system(axis_length):
     ax.plot3D(zp, y, zp, color='blue')   # eje Y
     ax.plot3D(zp, zp, z, color='green')  # eje Z
 
-def sind(t):
-    # Calcula el seno en grados
-    return np.sin(t*np.pi/180)
-
-def cosd(t):
-    # Calcula el coseno en grados
-    return np.cos(t*np.pi/180)
-
-def RotZ(t):
+def RotZ(t, out=None):
     # Matriz 4x4 homogénea de rotación en Z
-    Rz = np.array([
-        [cosd(t), -sind(t), 0, 0],
-        [sind(t),  cosd(t), 0, 0],
-        [0,        0,       1, 0],
-        [0,        0,       0, 1]
-    ])
-    return Rz
+    return rotz_h(t, out=out)
 
 def drawVector(v):
     # Dibuja un vector 3D desde el origen
     deltaX = [0, v[0]]
     deltaY = [0, v[1]]
     deltaZ = [0, v[2]]
-    ax.plot3D(deltaX, deltaY, deltaZ,color='orange')
+    escena.plot(deltaX, deltaY, deltaZ,color='orange')
 
 def rotate(final_angle): 
     # Animación de rotación desde 0 hasta final_angle
+    # Límites, cámara y ejes fijos: se dibujan una sola vez
+    setaxis(-1,1,-1,1,-1,1)
+    fix_system(1)
+
+    T = np.empty((4, 4))  # Buffer de la matriz homogénea, se reutiliza en cada paso
     for ang in range(0, final_angle+1):
-        ax.cla()                    # Limpia la gráfica para el siguiente frame
-        setaxis(-1,1,-1,1,-1,1)    # Ajusta los límites de la vista
-        fix_system(1)               # Dibuja los ejes de referencia
+        escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
 
         # Vector inicial desde Y = 0 (origen)
         v1 = np.array([1,0,1,1])   # [X,Y,Z,1], Y=0 para que comience desde cero
         drawVector(v1[:3])          # Dibuja el vector inicial
 
         # Vector rotado en Z
-        v2 = RotZ(ang).dot(v1)
+        v2 = RotZ(ang, out=T).dot(v1)
         drawVector(v2[:3])          # Dibuja el vector rotado
 
-        plt.draw()                  # Refresca la gráfica
-        plt.pause(0.01)             # Pausa para animación visible
+        escena.mostrar(0.01)  # Pausa para animación visible
 
 # Ejecutar animación hasta 90 grados
 rotate(90)
@@ -1,9 +1,15 @@
-import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+import os
+import sys
 
-def sind(t): return np.sin(np.deg2rad(t))
-def cosd(t): return np.cos(np.deg2rad(t))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.esferico import ik_esferico, RAMAS, tabla_poses
+from robotica.registro import guardar_trayectoria
+from robotica.render import Escena
+from robotica.perfiles import rampa
+from robotica.cartesiano import CAMINO, linea, ik_camino_esferico
+from robotica.estela import Estela, largo_estela
 
 L1 = 15
 L2 = 13
@@ -12,67 +18,25 @@ L2 = 13
 # Punto objetivo
 x_target, y_target, z_target = 10, 15, 7
 
-# Ángulo base (rotación en Z)
-theta1 = np.rad2deg(np.arctan2(y_target, x_target))
-
-# Distancia en el plano XY
-r_xy = np.sqrt(x_target**2 + y_target**2)
-
-# Distancia total desde el origen
-r = np.sqrt(r_xy**2 + z_target**2)
-
-# Ley de cosenos para el codo
-cos_theta3 = (r**2 - L1**2 - L2**2) / (2*L1*L2)
-theta3 = np.rad2deg(np.arccos(np.clip(cos_theta3, -1, 1)))
-theta3 = -theta3   # codo abajo
-
-# Ángulo del hombro (theta2)
-phi = np.rad2deg(np.arctan2(z_target, r_xy))
-psi = np.rad2deg(np.arctan2(L2*np.sin(np.deg2rad(-theta3)), L1 + L2*np.cos(np.deg2rad(-theta3))))
-theta2 = phi - psi
+# Cinemática inversa: las 4 ramas (hombro frente/atrás, codo arriba/abajo)
+# resueltas de forma consistente con la cinemática directa de tabla_poses
+soluciones, validas = ik_esferico([x_target, y_target, z_target], L1, L2)
+rama = RAMAS.index('frente-abajo')   # codo abajo
+if not validas[0, rama]:
+    print("El punto está fuera del alcance del robot; se usa la postura más cercana.")
+theta1, theta2, theta3 = soluciones[0, rama]
 # ----------------------------
 
-def rot_z(angle):
-    return np.array([
-        [cosd(angle), -sind(angle), 0, 0],
-        [sind(angle),  cosd(angle), 0, 0],
-        [0, 0, 1, 0],
-        [0, 0, 0, 1]
-    ])
-
-def rot_y(angle):
-    return np.array([
-        [ cosd(angle), 0, sind(angle), 0],
-        [ 0, 1, 0, 0],
-        [-sind(angle), 0, cosd(angle), 0],
-        [ 0, 0, 0, 1]
-    ])
-
-def trasl_x(L):
-    return np.array([
-        [1, 0, 0, L],
-        [0, 1, 0, 0],
-        [0, 0, 1, 0],
-        [0, 0, 0, 1]
-    ])
-
-def forward_kinematics(theta1, theta2, theta3):
-    T1 = rot_z(theta1) @ rot_y(theta2) @ trasl_x(L1)
-    T2 = T1 @ rot_y(-theta3) @ trasl_x(L2)
-    p0 = np.array([0,0,0,1])
-    p1 = T1 @ np.array([0,0,0,1])
-    p2 = T2 @ np.array([0,0,0,1])
-    return p0, p1, p2
-
 def draw_robot(p0, p1, p2):
-    ax.scatter(p0[0], p0[1], p0[2], color="red", s=50)
-    ax.scatter(p1[0], p1[1], p1[2], color="blue", s=50)
-    ax.scatter(p2[0], p2[1], p2[2], color="green", s=50)
-    ax.plot([p0[0], p1[0]], [p0[1], p1[1]], [p0[2], p1[2]], color="black", linewidth=3)
-    ax.plot([p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]], color="black", linewidth=3)
+    escena.scatter(p0[0], p0[1], p0[2], color="red", s=50)
+    escena.scatter(p1[0], p1[1], p1[2], color="blue", s=50)
+    escena.scatter(p2[0], p2[1], p2[2], color="green", s=50)
+    escena.plot([p0[0], p1[0]], [p0[1], p1[1]], [p0[2], p1[2]], color="black", linewidth=3)
+    escena.plot([p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]], color="black", linewidth=3)
 
 fig = plt.figure()
 ax = fig.add_subplot(111, projection="3d")
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 def setaxis():
     ax.set_xlim3d(-30,30)
@@ -80,26 +44,37 @@ def setaxis():
     ax.set_zlim3d(-10,30)
     ax.view_init(elev=30, azim=40)
 
+setaxis()  # Límites y cámara: una sola vez
 steps = 100
-trajectory = []
+estela = Estela(largo_estela(steps+1))  # Rastro del efector final (buffer circular)
+
+# Cinemática de todos los pasos de una vez: T1 = Rz(θ1)·Ry(θ2)·Tx(L1), T2 = T1·Ry(-θ3)·Tx(L2)
+# (tests/test_esferico.py la compara con el producto de matrices 4x4)
+fraccion = rampa(0, 1, steps+1)[:, 0]  # 0 -> 1 (lineal por defecto; ver ROBOTICA_PERFIL)
+if CAMINO == 'linea':
+    # Efector final en línea recta desde la postura inicial (brazo estirado) hasta el objetivo,
+    # con la IK de todos los pasos en una sola llamada y la misma rama que arriba
+    puntos = linea([L1 + L2, 0, 0], [x_target, y_target, z_target], fraccion)
+    q, en_alcance = ik_camino_esferico(puntos, RAMAS[rama], L1, L2)
+    if not en_alcance.all():
+        print("Parte de la línea queda fuera del alcance; ahí se usa la postura más cercana.")
+    poses = tabla_poses(q[:, 0], q[:, 1], q[:, 2], L1, L2)
+else:
+    poses = tabla_poses(theta1 * fraccion, theta2 * fraccion, theta3 * fraccion, L1, L2)
+# Ángulos y efector final a disco (.rtray) si se pide con ROBOTICA_TRAYECTORIA
+guardar_trayectoria(poses, 'esferico', {'L1': L1, 'L2': L2},
+                    columnas=['theta1', 'theta2', 'theta3', 'p2'])
 
 for step in range(steps+1):
-    ax.cla()
-    setaxis()
-    
-    t1 = theta1 * step / steps
-    t2 = theta2 * step / steps
-    t3 = theta3 * step / steps
+    escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
     
-    p0, p1, p2 = forward_kinematics(t1, t2, t3)
-    trajectory.append([p2[0], p2[1], p2[2]])
+    p0, p1, p2 = poses[step]['p0'], poses[step]['p1'], poses[step]['p2']  # Sólo se lee la pose
+    estela.agregar(p2)
     draw_robot(p0, p1, p2)
     
-    traj_array = np.array(trajectory)
-    ax.plot(traj_array[:,0], traj_array[:,1], traj_array[:,2], color="green", linewidth=2, alpha=0.6)
+    escena.plot(*estela.vista(), color="green", linewidth=2, alpha=0.6)
     
-    plt.draw()
-    plt.pause(0.05)
+    escena.mostrar(0.05)
 
 plt.show()
 
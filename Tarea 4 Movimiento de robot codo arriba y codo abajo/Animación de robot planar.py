@@ -1,11 +1,14 @@
 # Importamos librerías necesarias
-import numpy as np              # Para operaciones matemáticas
 import matplotlib.pyplot as plt # Para graficar
 from mpl_toolkits.mplot3d import Axes3D  # Para proyecciones en 3D
+import os
+import sys
 
-# Funciones trigonométricas en grados
-def sind(t): return np.sin(np.deg2rad(t))  # Seno en grados
-def cosd(t): return np.cos(np.deg2rad(t))  # Coseno en grados
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.planar import ik_planar, tabla_poses
+from robotica.render import Escena
+from robotica.perfiles import rampa
+from robotica.cartesiano import CAMINO, linea, ik_camino_planar
 
 # Longitudes de los eslabones
 L1 = 15
@@ -15,23 +18,17 @@ L2 = 10
 # Punto final deseado
 x_target, y_target, z_target = 10, 15, 0
 
-# Distancia al punto
-r = np.sqrt(x_target**2 + y_target**2)
-
-# Cinemática inversa (ley de cosenos)
-cos_theta2 = (r**2 - L1**2 - L2**2) / (2*L1*L2)
-theta2 = np.rad2deg(np.arccos(cos_theta2))   # solución codo arriba
-theta2 = -theta2                             # solución codo abajo
-
-theta1 = np.rad2deg(
-    np.arctan2(y_target, x_target) -
-    np.arctan2(L2*np.sin(np.deg2rad(theta2)), L1 + L2*np.cos(np.deg2rad(theta2)))
-)
+# Cinemática inversa (ley de cosenos), regresa las dos ramas y si es alcanzable
+sol_arriba, sol_abajo, alcanzable = ik_planar(x_target, y_target, L1, L2)
+if not alcanzable[0]:
+    print("El punto está fuera del alcance del robot; se usa la postura más cercana.")
+theta1, theta2 = sol_abajo[0]                # solución codo abajo
 # -------------------------------
 
 # Creamos la figura 3D
 fig = plt.figure()
 ax = fig.add_subplot(111, projection='3d')
+escena = Escena(ax)  # Artistas persistentes: se crean una vez y se actualizan
 
 # Función para fijar los ejes de la animación
 def setaxis():
@@ -40,47 +37,35 @@ def setaxis():
     ax.set_zlim3d(-5, 30)
     ax.view_init(elev=30, azim=40)  # Vista de cámara
 
-# Cinemática directa (con matrices homogéneas 4x4)
-def forward_kinematics(theta1, theta2):
-    # Matriz homogénea de la primera articulación
-    T1 = np.array([
-        [cosd(theta1), -sind(theta1), 0, L1*cosd(theta1)],
-        [sind(theta1),  cosd(theta1), 0, L1*sind(theta1)],
-        [0,             0,            1, 0],
-        [0,             0,            0, 1]
-    ])
-    # Matriz homogénea de la segunda articulación
-    T2 = np.array([
-        [cosd(theta2), -sind(theta2), 0, L2*cosd(theta2)],
-        [sind(theta2),  cosd(theta2), 0, L2*sind(theta2)],
-        [0,             0,            1, 0],
-        [0,             0,            0, 1]
-    ])
-    # Posiciones
-    p0 = np.array([0, 0, 0, 1])                        # Base
-    p1 = np.dot(T1, np.array([0,0,0,1]))               # Final del eslabón 1
-    p2 = np.dot(np.dot(T1, T2), np.array([0,0,0,1]))   # Efector final
-    return p0, p1, p2
-
 # Función para dibujar el robot
 def draw_robot(p0, p1, p2):
-    ax.scatter(p0[0], p0[1], p0[2], color="red", s=50)   # Base
-    ax.scatter(p1[0], p1[1], p1[2], color="blue", s=50)  # Articulación 1
-    ax.scatter(p2[0], p2[1], p2[2], color="green", s=50) # Efector final
-    ax.plot([p0[0], p1[0]], [p0[1], p1[1]], [p0[2], p1[2]], color="black", linewidth=3)
-    ax.plot([p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]], color="black", linewidth=3)
+    escena.scatter(p0[0], p0[1], p0[2], color="red", s=50)   # Base
+    escena.scatter(p1[0], p1[1], p1[2], color="blue", s=50)  # Articulación 1
+    escena.scatter(p2[0], p2[1], p2[2], color="green", s=50) # Efector final
+    escena.plot([p0[0], p1[0]], [p0[1], p1[1]], [p0[2], p1[2]], color="black", linewidth=3)
+    escena.plot([p1[0], p2[0]], [p1[1], p2[1]], [p1[2], p2[2]], color="black", linewidth=3)
 
 # Animación desde 0 hasta los ángulos que llevan a (10,15,0)
+setaxis()  # Límites y cámara: una sola vez
 steps = 100
+# Cinemática de todos los pasos de una vez: T1·T2 de las matrices homogéneas 4x4
+# de cada articulación (tests/test_planar.py compara la tabla con ese producto)
+fraccion = rampa(0, 1, steps+1)[:, 0]  # 0 -> 1 (lineal por defecto; ver ROBOTICA_PERFIL)
+if CAMINO == 'linea':
+    # Efector final en línea recta desde la postura inicial (brazo estirado) hasta el objetivo,
+    # con la IK de todos los pasos en una sola llamada
+    puntos = linea([L1 + L2, 0, 0], [x_target, y_target, z_target], fraccion)
+    q, en_alcance = ik_camino_planar(puntos, 'abajo', L1, L2)
+    if not en_alcance.all():
+        print("Parte de la línea queda fuera del alcance; ahí se usa la postura más cercana.")
+    poses = tabla_poses(q[:, 0], q[:, 1], L1, L2)
+else:
+    poses = tabla_poses(theta1 * fraccion, theta2 * fraccion, L1, L2)
 for step in range(steps+1):
-    ax.cla()
-    setaxis()
-    t1 = theta1 * step / steps
-    t2 = theta2 * step / steps
-    p0, p1, p2 = forward_kinematics(t1, t2)
-    draw_robot(p0, p1, p2)
-    plt.draw()
-    plt.pause(0.05)
+    escena.nuevo_fotograma()  # Reutiliza los artistas del fotograma anterior
+    q = poses[step]           # El dibujo sólo lee la pose ya calculada
+    draw_robot(q['p0'], q['p1'], q['p2'])
+    escena.mostrar(0.05)
 
 plt.show()
 
@@ -2,118 +2,157 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.animation import FuncAnimation
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 # --- Funciones trigonométricas en grados ---
-# Las funciones sind y cosd convierten los ángulos a radianes para usar con numpy
-def sind(x): return np.sin(np.deg2rad(x))
-def cosd(x): return np.cos(np.deg2rad(x))
+# sincosd calcula seno y coseno juntos (exactos en múltiplos de 90°)
+from robotica.trig import sincosd
+from robotica.render import mostrar_animacion, EXPORTAR, activar_exportacion
+from robotica.registro import guardar_trayectoria, RUTA as RUTA_TRAYECTORIA
+from robotica.configuracion import DH_2R, desde_argv, ruta_variante
+from robotica.estela import Estela, largo_estela
+from robotica.perfiles import rampa
+from robotica.perfilado import perfilador, tramo
 
 # --- Matriz de transformación homogénea Denavit–Hartenberg ---
 # Esta matriz representa la relación entre dos marcos consecutivos
 def dh_matrix(theta, d, a, alpha):
+    st, ct = sincosd(theta)   # una sola evaluación por ángulo
+    sa, ca = sincosd(alpha)
     return np.array([
-        [cosd(theta), -cosd(alpha)*sind(theta), sind(alpha)*sind(theta), a*cosd(theta)],
-        [sind(theta),  cosd(alpha)*cosd(theta), -sind(alpha)*cosd(theta), a*sind(theta)],
-        [0,            sind(alpha),              cosd(alpha),              d],
-        [0,            0,                        0,                        1]
+        [ct, -ca*st,  sa*st, a*ct],
+        [st,  ca*ct, -sa*ct, a*st],
+        [0,   sa,     ca,    d],
+        [0,   0,      0,     1]
     ])
 
-# --- Entrada de datos del usuario ---
-print("=== ROBOT 2R tipo codo arriba (plano X–Z, rotación sobre eje Z) ===")
-theta1 = float(input("Ángulo θ1 (grados): "))
-theta2 = float(input("Ángulo θ2 (grados): "))
-a1 = float(input("Longitud del brazo 1 (a1): "))
-a2 = float(input("Longitud del brazo 2 (a2): "))
-
-# Parámetros DH: el robot es plano, así que α = 0°, d = 0
-alpha1 = 0
-alpha2 = 0
-d1 = 0
-d2 = 0
-
-# --- Calcular matrices DH ---
-T01 = dh_matrix(theta1, d1, a1, alpha1)
-T12 = dh_matrix(theta2, d2, a2, alpha2)
-T02 = np.dot(T01, T12)
-
-np.set_printoptions(precision=3, suppress=True)
-print("\nMatriz T01 =\n", T01)
-print("\nMatriz T12 =\n", T12)
-print("\nMatriz T02 (total) =\n", T02)
-
-# --- Cinemática directa: obtener coordenadas ---
-def puntos(theta1, theta2):
-    # Calcula las transformaciones DH para cada articulación
-    T01 = dh_matrix(theta1, 0, a1, 0)
-    T12 = dh_matrix(theta2, 0, a2, 0)
+# --- Animación del robot para un conjunto de parámetros ---
+def animar(theta1, theta2, a1, a2, nombre=None):
+    # Parámetros DH: el robot es plano, así que α = 0°, d = 0
+    alpha1 = 0
+    alpha2 = 0
+    d1 = 0
+    d2 = 0
+
+    # --- Calcular matrices DH ---
+    T01 = dh_matrix(theta1, d1, a1, alpha1)
+    T12 = dh_matrix(theta2, d2, a2, alpha2)
     T02 = np.dot(T01, T12)
 
-    # Posiciones de cada articulación
-    O0 = np.array([0, 0, 0])
-    O1 = T01[0:3, 3]
-    O2 = T02[0:3, 3]
-
-    # Intercambio ejes para que el movimiento esté en el plano X–Z (de pie)
-    # Aquí el eje Y se mantiene fijo y usamos Z como altura
-    O0 = np.array([O0[0], 0, O0[1]])
-    O1 = np.array([O1[0], 0, O1[1]])
-    O2 = np.array([O2[0], 0, O2[1]])
-
-    return np.column_stack((O0, O1, O2))
-
-# --- Configuración del gráfico ---
-fig = plt.figure()
-ax = fig.add_subplot(111, projection='3d')
-
-# Limites del entorno donde se moverá el robot
-ax.set_xlim(- (a1 + a2 + 2), a1 + a2 + 2)
-ax.set_ylim(-5, 5)
-ax.set_zlim(0, a1 + a2 + 5)
-
-ax.set_xlabel("X (cm)")
-ax.set_ylabel("Y (cm)")
-ax.set_zlabel("Z (cm)")
-ax.set_title("Cinemática matriz de hangover y denavit ")
-
-# Ajusto la vista: azim=–90 muestra el plano X–Z desde un costado
-ax.view_init(elev=20, azim=-90)
-
-# Creo las líneas del brazo y el trazo del efector final
-line, = ax.plot([], [], [], 'o-', lw=3, color='blue')
-trace, = ax.plot([], [], [], 'r--', lw=1)
-path_x, path_y, path_z = [], [], []
-
-# --- Inicialización de la animación ---
-def init():
-    line.set_data([], [])
-    line.set_3d_properties([])
-    trace.set_data([], [])
-    trace.set_3d_properties([])
-    return line, trace
-
-# --- Actualización de frames ---
-def update(frame):
-    t1, t2 = frame
-    pts = puntos(t1, t2)
-    x, y, z = pts
-    line.set_data(x, y)
-    line.set_3d_properties(z)
-    path_x.append(x[2])
-    path_y.append(y[2])
-    path_z.append(z[2])
-    trace.set_data(path_x, path_y)
-    trace.set_3d_properties(path_z)
-    return line, trace
-
-# --- Frames de movimiento (rotación eje Z) ---
-frames = []
-for t1 in np.linspace(0, theta1, 60):
-    frames.append([t1, 0])
-for t2 in np.linspace(0, theta2, 60):
-    frames.append([theta1, t2])
-
-# --- Animación ---
-ani = FuncAnimation(fig, update, frames=frames, init_func=init,
-                    blit=True, interval=60, repeat=False)
-
-plt.show()
+    np.set_printoptions(precision=3, suppress=True)
+    print("\nMatriz T01 =\n", T01)
+    print("\nMatriz T12 =\n", T12)
+    print("\nMatriz T02 (total) =\n", T02)
+
+    # --- Cinemática directa: obtener coordenadas ---
+    def puntos(theta1, theta2):
+        # Calcula las transformaciones DH para cada articulación
+        T01 = dh_matrix(theta1, 0, a1, 0)
+        T12 = dh_matrix(theta2, 0, a2, 0)
+        T02 = np.dot(T01, T12)
+
+        # Posiciones de cada articulación
+        O0 = np.array([0, 0, 0])
+        O1 = T01[0:3, 3]
+        O2 = T02[0:3, 3]
+
+        # Intercambio ejes para que el movimiento esté en el plano X–Z (de pie)
+        # Aquí el eje Y se mantiene fijo y usamos Z como altura
+        O0 = np.array([O0[0], 0, O0[1]])
+        O1 = np.array([O1[0], 0, O1[1]])
+        O2 = np.array([O2[0], 0, O2[1]])
+
+        return np.column_stack((O0, O1, O2))
+
+    # --- Configuración del gráfico ---
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+
+    # Limites del entorno donde se moverá el robot
+    ax.set_xlim(- (a1 + a2 + 2), a1 + a2 + 2)
+    ax.set_ylim(-5, 5)
+    ax.set_zlim(0, a1 + a2 + 5)
+
+    ax.set_xlabel("X (cm)")
+    ax.set_ylabel("Y (cm)")
+    ax.set_zlabel("Z (cm)")
+    ax.set_title("Cinemática matriz de hangover y denavit ")
+
+    # Ajusto la vista: azim=–90 muestra el plano X–Z desde un costado
+    ax.view_init(elev=20, azim=-90)
+
+    # Creo las líneas del brazo y el trazo del efector final
+    line, = ax.plot([], [], [], 'o-', lw=3, color='blue')
+    trace, = ax.plot([], [], [], 'r--', lw=1)
+
+    # --- Inicialización de la animación ---
+    def init():
+        line.set_data([], [])
+        line.set_3d_properties([])
+        trace.set_data([], [])
+        trace.set_3d_properties([])
+        estela.vaciar()
+        return line, trace
+
+    # --- Actualización de frames ---
+    def update(frame):
+        perfilador.nuevo_fotograma()  # Tiempos por fotograma con ROBOTICA_PERFILADO
+        t1, t2 = frame
+        with tramo('cinematica'):
+            pts = puntos(t1, t2)
+        with tramo('artistas'):
+            x, y, z = pts
+            line.set_data(x, y)
+            line.set_3d_properties(z)
+            estela.agregar(pts[:, 2])
+            trace.set_data_3d(*estela.vista())  # Vista del buffer, sin copiar
+        return line, trace
+
+    # --- Frames de movimiento (rotación eje Z) ---
+    frames = []
+    for t1 in rampa(0, theta1, 60)[:, 0]:
+        frames.append([t1, 0])
+    for t2 in rampa(0, theta2, 60)[:, 0]:
+        frames.append([theta1, t2])
+
+    # Guardar los frames (.rtray) si se pide con ROBOTICA_TRAYECTORIA
+    frames_arr = np.array(frames)
+    guardar_trayectoria({'theta1': frames_arr[:, 0], 'theta2': frames_arr[:, 1]},
+                        'dh_2r', {'a1': a1, 'a2': a2}, ruta=ruta_variante(RUTA_TRAYECTORIA, nombre))
+
+    # Rastro del efector final: buffer circular (por defecto, todos los frames)
+    estela = Estela(largo_estela(len(frames)))
+
+    # --- Animación ---
+    ani = FuncAnimation(fig, update, frames=frames, init_func=init,
+                        blit=True, interval=60, repeat=False)
+
+    # Ventana interactiva, o archivo (GIF/MP4/PNG) si se define ROBOTICA_EXPORTAR
+    # (en lote, un archivo por variante)
+    mostrar_animacion(ani, fig, 60, ruta_variante(EXPORTAR, nombre))
+    plt.close(fig)
+
+
+# --- Entrada de datos del usuario ---
+# Sin argumentos se preguntan los datos; también se pueden dar sin preguntas:
+#   python "Tarea matriz de denavit hartenberg.py" theta1=30 theta2=45 a1=10 a2=8
+# o un archivo .json/.jsonl/.csv con varias variantes (ver robotica.configuracion).
+# En lote no se abre ninguna ventana: cada variante se exporta a ROBOTICA_EXPORTAR,
+# o a dh_2r.gif (dh_2r_<nombre>.gif) si no se definió.
+if __name__ == "__main__":
+    variantes = desde_argv(sys.argv[1:], DH_2R)
+    if variantes is not None and not EXPORTAR:
+        EXPORTAR = activar_exportacion('dh_2r.gif')
+    if variantes is None:
+        print("=== ROBOT 2R tipo codo arriba (plano X–Z, rotación sobre eje Z) ===")
+        theta1 = float(input("Ángulo θ1 (grados): "))
+        theta2 = float(input("Ángulo θ2 (grados): "))
+        a1 = float(input("Longitud del brazo 1 (a1): "))
+        a2 = float(input("Longitud del brazo 2 (a2): "))
+        variantes = [dict(theta1=theta1, theta2=theta2, a1=a1, a2=a2, nombre=None)]
+
+    for v in variantes:
+        animar(v['theta1'], v['theta2'], v['a1'], v['a2'], v['nombre'])
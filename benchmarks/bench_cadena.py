@@ -0,0 +1,57 @@
+"""
+Microbenchmark: cinemática directa con CadenaSerial.
+
+Compara, para N poses del SCARA del examen (4 articulaciones, RRPR):
+
+    cadena_dh    -> robotica.dh.cadena_dh: arma las 4 matrices DH completas
+                    de cada pose (sen/cos de θ y de α) y las multiplica
+    CadenaSerial -> robotica.cadena.scara(): las partes que no dependen de
+                    q (α, a, d fijos) están precalculadas y por pose sólo
+                    se combinan dos filas por eslabón rotacional
+
+Ambas regresan los marcos acumulados (N, 4, 4, 4); se reporta el tiempo
+por pose.
+
+Uso:
+    python benchmarks/bench_cadena.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cadena import scara
+from robotica.dh import cadena_dh
+
+
+def con_cadena_dh(q):
+    t1, t2, l, t3 = q.T
+    ceros = np.zeros_like(t1)
+    theta = np.stack([t1, t2, ceros, t3], axis=-1)
+    d = np.stack([ceros, ceros, l - 40.0 - 776.0, ceros], axis=-1)
+    a = np.stack([ceros + 715.0, ceros + 850.0, ceros, ceros], axis=-1)
+    return cadena_dh(theta, d, a, 0.0)[1]
+
+
+def medir(fn, q, repeticiones=5):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn(q)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+if __name__ == "__main__":
+    robot = scara()
+    rng = np.random.default_rng(0)
+    print(f"{'poses':<10}{'modo':<16}{'ms':>10}{'us/pose':>10}")
+    for n in (1000, 100000):
+        q = np.column_stack([rng.uniform(-180, 180, (n, 2)),
+                             rng.uniform(418.5, 880.0, n), rng.uniform(-180, 180, n)])
+        for nombre, fn in [('cadena_dh', con_cadena_dh), ('CadenaSerial', robot.marcos)]:
+            dt = medir(fn, q)
+            print(f"{n:<10}{nombre:<16}{dt*1e3:>10.2f}{dt/n*1e6:>10.3f}")
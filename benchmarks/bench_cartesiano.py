@@ -0,0 +1,48 @@
+"""
+Microbenchmark: IK de caminos cartesianos.
+
+Resuelve una línea recta del brazo esférico y del 2R planar (Tarea 4)
+muestreada en N puntos con robotica.cartesiano (IK por lotes + rama
+continua) y reporta puntos por segundo, el error de posición máximo
+(IK -> FK) y el mayor salto articular entre muestras consecutivas.
+
+Uso:
+    python benchmarks/bench_cartesiano.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica import esferico, planar
+from robotica.cartesiano import ik_camino_esferico, ik_camino_planar, linea
+
+
+def medir(robot, n):
+    s = np.linspace(0.0, 1.0, n)
+    if robot == 'esferico':
+        puntos = linea([28.0, 0, 0], [10.0, 15.0, 7.0], s)
+        t0 = time.perf_counter()
+        q, _ = ik_camino_esferico(puntos, 'frente-abajo')
+        dt = time.perf_counter() - t0
+        _, _, p2 = esferico.fk_esferico(*q.T)
+    else:
+        puntos = linea([25.0, 0, 0], [10.0, 15.0, 0], s)
+        t0 = time.perf_counter()
+        q, _ = ik_camino_planar(puntos, 'abajo')
+        dt = time.perf_counter() - t0
+        _, p2 = planar.fk_planar(*q.T)
+    err = np.abs(p2 - puntos).max()
+    salto = np.abs(np.diff(q, axis=0)).max()
+    return dt, err, salto
+
+
+if __name__ == "__main__":
+    print(f"{'robot':<10}{'puntos':>9}{'ms':>9}{'puntos/s':>13}{'error máx':>12}{'salto máx (°)':>15}")
+    for robot in ('planar', 'esferico'):
+        for n in (1000, 100000):
+            dt, err, salto = medir(robot, n)
+            print(f"{robot:<10}{n:>9}{dt*1e3:>9.2f}{n/dt:>13.0f}{err:>12.1e}{salto:>15.3f}")
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: validación de caminos candidatos del SCARA contra colisiones.
+
+Genera C caminos articulares aleatorios de N muestras (rampas entre dos
+poses al azar) y M cajas al azar alrededor del robot, y revisa todos
+los caminos de una vez con robotica.colisiones.modelo_scara().verificar
+(cápsulas propias + cajas vía BVH).  Compara con la revisión sin BVH
+(cada cápsula contra todas las cajas).
+
+Reporta caminos por segundo y la fracción de caminos con choque.
+
+Uso:
+    python benchmarks/bench_colisiones.py [caminos] [muestras] [cajas]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.colisiones import Obstaculos, distancia_segmento_caja, modelo_scara
+from robotica.cuerpos import CAJA
+
+
+def caminos(C, N, rng):
+    ini = np.column_stack([rng.uniform(-180, 180, (C, 2)), rng.uniform(418.5, 880, C), np.zeros(C)])
+    fin = np.column_stack([rng.uniform(-180, 180, (C, 2)), rng.uniform(418.5, 880, C), np.zeros(C)])
+    s = np.linspace(0, 1, N)[None, :, None]
+    return ini[:, None, :] + s * (fin - ini)[:, None, :]          # (C, N, 4)
+
+
+def cajas(M, rng):
+    # Cajas sobre el piso, en un anillo alrededor de la columna
+    tam = rng.uniform([40, 40, 150], [160, 160, 550], (M, 1, 3))
+    rho, phi = rng.uniform(300, 2000, M), rng.uniform(-np.pi, np.pi, M)
+    pos = np.column_stack([rho * np.cos(phi), rho * np.sin(phi), np.zeros(M)])
+    return CAJA[None] / [7.0, 2.0, 3.0] * tam + pos[:, None, :]    # (M, 8, 3)
+
+
+def sin_bvh(modelo, q, obst, bloque=4):
+    # Todas las cápsulas contra todas las cajas, por bloques de caminos
+    contra = np.empty(q.shape[:-1], dtype=bool)
+    for k in range(0, len(q), bloque):
+        a, b = modelo.segmentos(q[k:k + bloque])
+        d = distancia_segmento_caja(a[..., None, :], b[..., None, :], obst.centros,
+                                    obst.R, obst.semiejes)
+        contra[k:k + bloque] = np.any(d < modelo.radios[:, None], axis=(-1, -2))
+    return contra
+
+
+if __name__ == "__main__":
+    C = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    N = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    M = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    rng = np.random.default_rng(0)
+    modelo = modelo_scara()
+    q = caminos(C, N, rng)
+    obst = Obstaculos.desde_vertices(cajas(M, rng))
+    print(f"{C} caminos x {N} muestras, {M} cajas")
+
+    t0 = time.perf_counter()
+    choque, propio, contra = modelo.verificar(q, obst)
+    dt = time.perf_counter() - t0
+    malos = choque.any(axis=-1)
+    print(f"{'con BVH':<10}{dt:>8.3f} s{C/dt:>12.0f} caminos/s   con choque: {malos.mean():.1%} "
+          f"(propio {propio.any(-1).mean():.1%}, cajas {contra.any(-1).mean():.1%})")
+
+    sub = q[:max(C // 20, 1)]
+    t0 = time.perf_counter()
+    ref = sin_bvh(modelo, sub, obst)
+    dt = time.perf_counter() - t0
+    print(f"{'sin BVH':<10}{dt:>8.3f} s{len(sub)/dt:>12.0f} caminos/s   (sobre {len(sub)} caminos)")
+    assert np.array_equal(ref, contra[:len(sub)]), "BVH y fuerza bruta no coinciden"
@@ -0,0 +1,69 @@
+"""
+Microbenchmark: transformación de los vértices de la caja.
+
+Compara tres formas de obtener los vértices de la caja rotada en cada
+fotograma de una animación (rotación sobre Z, un grado por paso):
+
+    por_vertice  -> estilo original: 8 llamadas R.dot(p_init) por fotograma
+    un_producto  -> caja (8, 3) y un solo producto V · Rᵀ por fotograma
+    precalculado -> robotica.cuerpos.fotogramas: toda la animación como un
+                    tensor (F, B, 8, 3) en una sola operación
+
+para 1 caja y para muchas cajas (B) a la vez.  Sólo se mide el cálculo
+de los vértices, no el dibujo.
+
+Uso:
+    python benchmarks/bench_cuerpos.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cuerpos import CAJA, fotogramas
+from robotica.transformaciones import rotz, rotz_lote
+
+
+def por_vertice(cajas, frames):
+    puntos = [[p for p in V] for V in cajas]
+    R = np.empty((3, 3))
+    for n in range(frames):
+        rotz(n, out=R)
+        for V in puntos:
+            [R.dot(p) for p in V]
+
+
+def un_producto(cajas, frames):
+    R = np.empty((3, 3))
+    out = np.empty(cajas.shape)
+    for n in range(frames):
+        rotz(n, out=R)
+        np.matmul(cajas, R.T, out=out)
+
+
+def precalculado(cajas, frames):
+    fotogramas(cajas, rotz_lote(np.arange(frames)))
+
+
+def medir(fn, cajas, frames, repeticiones=3):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn(cajas, frames)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor / frames
+
+
+if __name__ == "__main__":
+    frames = 360
+    print(f"{'cajas':<8}{'modo':<14}{'us/fotograma':>14}")
+    for B in (1, 1000):
+        cajas = CAJA[None] + np.arange(B)[:, None, None] * [10.0, 0, 0]
+        for nombre, fn in [('por_vertice', por_vertice), ('un_producto', un_producto),
+                           ('precalculado', precalculado)]:
+            f = frames if (B == 1 or fn is not por_vertice) else 20
+            dt = medir(fn, cajas, f)
+            print(f"{B:<8}{nombre:<14}{dt*1e6:>14.2f}")
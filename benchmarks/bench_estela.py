@@ -0,0 +1,60 @@
+"""
+Microbenchmark: rastro del efector final en una corrida larga.
+
+Compara, para N pasos, el costo de mantener el rastro y obtener sus
+coordenadas en cada paso (sin dibujar):
+
+    lista + np.array -> estilo original del esférico: trajectory.append y
+                        np.array(trajectory) en cada paso (O(n²))
+    Estela           -> robotica.estela: buffer circular, agregar() O(1) y
+                        vista() sin copia
+
+Reporta el tiempo por paso al principio y al final de la corrida, para
+ver si el costo crece con el largo del rastro.
+
+Uso:
+    python benchmarks/bench_estela.py [pasos]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.estela import Estela
+
+
+def con_lista(puntos):
+    trajectory = []
+    tiempos = np.empty(len(puntos))
+    for k, p in enumerate(puntos):
+        t0 = time.perf_counter()
+        trajectory.append([p[0], p[1], p[2]])
+        traj_array = np.array(trajectory)
+        traj_array[:, 0], traj_array[:, 1], traj_array[:, 2]
+        tiempos[k] = time.perf_counter() - t0
+    return tiempos
+
+
+def con_estela(puntos, largo):
+    estela = Estela(largo)
+    tiempos = np.empty(len(puntos))
+    for k, p in enumerate(puntos):
+        t0 = time.perf_counter()
+        estela.agregar(p)
+        x, y, z = estela.vista()
+        tiempos[k] = time.perf_counter() - t0
+    return tiempos
+
+
+if __name__ == "__main__":
+    pasos = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    puntos = np.random.default_rng(0).normal(size=(pasos, 3))
+    tramo = max(pasos // 20, 1)
+    print(f"{'modo':<22}{'us/paso (inicio)':>18}{'us/paso (final)':>18}{'s total':>10}")
+    for nombre, t in [('lista + np.array', con_lista(puntos)),
+                      ('Estela (todo)', con_estela(puntos, pasos)),
+                      ('Estela (500)', con_estela(puntos, 500))]:
+        print(f"{nombre:<22}{t[:tramo].mean()*1e6:>18.2f}{t[-tramo:].mean()*1e6:>18.2f}{t.sum():>10.2f}")
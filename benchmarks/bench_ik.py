@@ -0,0 +1,48 @@
+"""
+Microbenchmark: IK numérica (DLS) del SCARA a lo largo de un camino.
+
+Resuelve la posición de la punta del pistón sobre una línea recta de N
+muestras con robotica.ik_numerica y compara:
+
+    en frío        -> ik_dls: todas las muestras en lote desde la misma
+                      semilla
+    warm, secuencia -> ik_camino(cada=1): cada muestra desde la anterior
+    warm, anclas   -> ik_camino(cada=16): anclas en secuencia, el resto en
+                      lote desde la interpolación de sus anclas
+
+Reporta muestras por segundo, iteraciones promedio y máximas, residuo
+máximo y el mayor salto articular entre muestras (continuidad de rama).
+
+Uso:
+    python benchmarks/bench_ik.py [muestras]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cadena import scara
+from robotica.cartesiano import linea
+from robotica.ik_numerica import ik_camino, ik_dls
+
+LIMITES = [[-360, 360], [-360, 360], [418.5, 880.0], [-360, 360]]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    robot = scara()
+    q0 = np.array([30.0, 45.0, 700.0, 0.0])
+    puntos = linea(robot.fk(q0)[:3, 3], [900.0, 600.0, 1000.0], np.linspace(0, 1, n))
+
+    print(f"{'modo':<18}{'muestras/s':>12}{'it prom':>9}{'it máx':>8}{'residuo máx':>13}{'salto máx (°)':>15}")
+    for nombre, fn in [('en frío', lambda: ik_dls(robot, puntos, q0, limites=LIMITES)),
+                       ('warm, secuencia', lambda: ik_camino(robot, puntos, q0, limites=LIMITES, cada=1)),
+                       ('warm, anclas', lambda: ik_camino(robot, puntos, q0, limites=LIMITES))]:
+        t0 = time.perf_counter()
+        q, it, res, ok = fn()
+        dt = time.perf_counter() - t0
+        salto = np.abs(np.diff(q[:, :2], axis=0)).max()
+        print(f"{nombre:<18}{n/dt:>12.0f}{it.mean():>9.2f}{it.max():>8}{res.max():>13.1e}{salto:>15.3f}")
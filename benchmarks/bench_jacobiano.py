@@ -0,0 +1,65 @@
+"""
+Microbenchmark: jacobianos y manipulabilidad del SCARA en una rejilla densa.
+
+Evalúa con robotica.cadena.scara() el jacobiano (N, 6, 4) y el índice de
+Yoshikawa (filas x, y, z, giro en z) sobre una rejilla θ2 × l_barra del
+examen, por bloques, y reporta poses por segundo para:
+
+    marcos + jacobiano -> FK y jacobiano desde los mismos marcos
+    fk + jacobiano(q)  -> FK y jacobiano por separado (marcos dos veces)
+
+Comprueba además la forma cerrada del SCARA: w = A1·A2·|sen θ2|.
+
+Uso:
+    python benchmarks/bench_jacobiano.py [lado de la rejilla]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cadena import manipulabilidad, scara
+
+BLOQUE = 100_000
+
+
+def rejilla(lado):
+    th2, l = np.meshgrid(np.linspace(-180, 180, lado), np.linspace(418.5, 880.0, lado), indexing='ij')
+    q = np.zeros((lado * lado, 4))
+    q[:, 1], q[:, 2] = th2.ravel(), l.ravel()
+    return q
+
+
+def reutilizando(robot, q):
+    w = np.empty(len(q))
+    for k in range(0, len(q), BLOQUE):
+        _, J = robot.fk_jacobiano(q[k:k + BLOQUE])
+        w[k:k + BLOQUE] = manipulabilidad(J, [0, 1, 2, 5])
+    return w
+
+
+def por_separado(robot, q):
+    w = np.empty(len(q))
+    for k in range(0, len(q), BLOQUE):
+        robot.fk(q[k:k + BLOQUE])
+        J = robot.jacobiano(q[k:k + BLOQUE])
+        w[k:k + BLOQUE] = manipulabilidad(J, [0, 1, 2, 5])
+    return w
+
+
+if __name__ == "__main__":
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 700
+    robot = scara()
+    q = rejilla(lado)
+    print(f"rejilla {lado}x{lado} = {len(q)} poses")
+    print(f"{'modo':<22}{'s':>8}{'poses/s':>12}")
+    for nombre, fn in [('marcos + jacobiano', reutilizando), ('fk + jacobiano(q)', por_separado)]:
+        t0 = time.perf_counter()
+        w = fn(robot, q)
+        dt = time.perf_counter() - t0
+        print(f"{nombre:<22}{dt:>8.2f}{len(q)/dt:>12.0f}")
+    err = np.abs(w - 715.0 * 850.0 * np.abs(np.sin(np.deg2rad(q[:, 1])))).max()
+    print(f"\nerror vs. A1·A2·|sen θ2|: {err:.2e}   (w máx {w.max():.0f})")
@@ -0,0 +1,56 @@
+"""
+Benchmark: exportación de fotogramas repartida entre procesos.
+
+Dibuja el robot de bench_render (SCARA sencillo con Escena) y exporta
+los fotogramas a PNG con robotica.render.renderizar_paralelo usando 1,
+2, 4, ... procesos hasta el número de núcleos de la máquina.  Reporta el
+tiempo total y la aceleración respecto a 1 proceso.
+
+Uso:
+    python benchmarks/bench_paralelo.py [fotogramas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.render import Escena, renderizar_paralelo
+from bench_render import configurar_ejes, dibujar, pose
+
+
+def medir(procesos, frames):
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    configurar_ejes(ax)
+    escena = Escena(ax)
+
+    def fotograma(k):
+        escena.nuevo_fotograma()
+        dibujar(escena, *pose(k, frames))
+        escena.fin_fotograma()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        t0 = time.perf_counter()
+        renderizar_paralelo(fig, fotograma, frames, fps=25, procesos=procesos,
+                            ruta=carpeta + os.sep)
+        dt = time.perf_counter() - t0
+    plt.close(fig)
+    return dt
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+    nucleos = os.cpu_count() or 1
+    lista = sorted({1, nucleos} | {2 ** k for k in range(1, 8) if 2 ** k < nucleos})
+    print(f"{'procesos':<10}{'s totales':>12}{'fotogramas/s':>15}{'aceleración':>14}")
+    base = None
+    for p in lista:
+        dt = medir(p, frames)
+        base = base or dt
+        print(f"{p:<10}{dt:>12.2f}{frames/dt:>15.1f}{base/dt:>14.2f}")
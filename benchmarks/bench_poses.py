@@ -0,0 +1,54 @@
+"""
+Microbenchmark: cinemática de una trayectoria completa.
+
+Compara, para la animación del examen (θ1 fijo, θ2 0->90, barra
+BAR_MAX->BAR_MIN, θ3 0->360), el costo de la etapa de CINEMÁTICA por
+separado del dibujo:
+
+    fkine por fotograma -> fkine() del examen llamado en cada update(i)
+    tabla_poses         -> robotica.scara.tabla_poses, una sola pasada
+
+Reporta el tiempo total y por fotograma, y el tamaño de la tabla.
+
+Uso:
+    python benchmarks/bench_poses.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RAIZ)
+from robotica.scara import fkine, tabla_poses
+
+
+def trayectoria(frames):
+    return (np.linspace(0, 90.0, frames),
+            np.linspace(880.0, 418.5, frames),
+            np.linspace(0, 360.0, frames))
+
+
+def por_fotograma(frames):
+    th2, l, th3 = trayectoria(frames)
+    for i in range(frames):
+        fkine(30.0, th2[i], l[i], th3[i], 715.0, 850.0, 776.0, -40.0, 100.0)
+
+
+def tabla(frames):
+    th2, l, th3 = trayectoria(frames)
+    return tabla_poses(30.0, th2, l, th3, 715.0, 850.0, 776.0, -40.0, 100.0)
+
+
+if __name__ == "__main__":
+    print(f"{'fotogramas':<12}{'modo':<22}{'ms total':>10}{'us/fotograma':>15}")
+    for frames in (240, 10000):
+        for nombre, fn in [('fkine por fotograma', por_fotograma), ('tabla_poses', tabla)]:
+            t0 = time.perf_counter()
+            fn(frames)
+            dt = time.perf_counter() - t0
+            print(f"{frames:<12}{nombre:<22}{dt*1e3:>10.2f}{dt/frames*1e6:>15.2f}")
+    poses = tabla(240)
+    print(f"\ntabla de 240 poses: {poses.nbytes/1024:.0f} KiB ({poses.itemsize} bytes por fila)")
@@ -0,0 +1,149 @@
+"""
+Microbenchmark: costo de dibujo por fotograma.
+
+Compara el estilo original de los bucles de animación (ax.cla() y volver
+a fijar límites, cámara y crear cada línea/punto en cada fotograma)
+contra robotica.render.Escena (artistas persistentes: sólo se cambian
+los datos).
+
+Se dibuja un robot tipo SCARA sencillo (5 segmentos, 3 puntos y el
+círculo del platillo) y se mide el tiempo medio por fotograma incluyendo
+el render completo del lienzo (canvas.draw) con el backend Agg, de modo
+que no influyen ni la pantalla ni las pausas de plt.pause.
+
+La segunda tabla compara la caja de la Tarea 2 dibujada con 20 artistas
+(12 líneas + 8 scatter, como drawBox) contra Escena.caja (una
+Line3DCollection + un scatter), para 1 y para 50 cajas a la vez.
+
+Uso:
+    python benchmarks/bench_render.py
+"""
+
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.render import Escena, ARISTAS_CAJA
+from robotica.trig import sincosd
+
+
+LIM = 1600
+
+
+def configurar_ejes(ax):
+    ax.set_xlim(-LIM, LIM)
+    ax.set_ylim(-LIM, LIM)
+    ax.set_zlim(0, LIM)
+    ax.set_xlabel('X (mm)'); ax.set_ylabel('Y (mm)'); ax.set_zlabel('Z (mm)')
+    ax.view_init(elev=25, azim=45)
+
+
+def pose(k, frames):
+    # Puntos del robot para el fotograma k (sólo geometría, sin DH)
+    s, c = sincosd(90.0 * k / frames)
+    s3, c3 = sincosd(np.linspace(0, 360, 60))
+    p0 = np.array([0, 0, 0])
+    p1 = np.array([0, 0, 776])
+    p2 = p1 + [715, 0, 0]
+    p3 = p2 + [850 * c, 850 * s, 0]
+    p4 = p3 + [0, 0, 322]
+    circulo = (p4[0] + 100 * c3, p4[1] + 100 * s3, np.full(60, p4[2]))
+    return p0, p1, p2, p3, p4, circulo
+
+
+def dibujar(dib, p0, p1, p2, p3, p4, circulo):
+    for a, b, color in [(p0, p1, 'red'), (p1, p2, 'blue'), (p2, p3, 'cyan'), (p3, p4, 'orange')]:
+        dib.plot([a[0], b[0]], [a[1], b[1]], [a[2], b[2]], color=color, linewidth=4)
+    dib.plot(*circulo, color='green', linewidth=3)
+    for p in (p1, p2, p3):
+        dib.scatter(p[0], p[1], p[2], color='black', s=18)
+
+
+# ------------------ Estilo original ------------------
+def medir_cla(frames):
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    t0 = time.perf_counter()
+    for k in range(frames):
+        ax.cla()
+        configurar_ejes(ax)
+        dibujar(ax, *pose(k, frames))
+        fig.canvas.draw()
+    dt = (time.perf_counter() - t0) / frames
+    plt.close(fig)
+    return dt
+
+
+# ------------------ Artistas persistentes ------------------
+def medir_escena(frames):
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    configurar_ejes(ax)
+    escena = Escena(ax)
+    t0 = time.perf_counter()
+    for k in range(frames):
+        escena.nuevo_fotograma()
+        dibujar(escena, *pose(k, frames))
+        escena.fin_fotograma()
+        fig.canvas.draw()
+    dt = (time.perf_counter() - t0) / frames
+    plt.close(fig)
+    return dt
+
+
+# ------------------ Cajas ------------------
+CAJA = np.array([[0, 0, 0], [7, 0, 0], [7, 0, 3], [0, 0, 3],
+                 [0, 2, 0], [7, 2, 0], [7, 2, 3], [0, 2, 3]], dtype=float)
+
+
+def cajas(k, frames, n):
+    # n cajas desplazadas en X y rotadas un poco en cada fotograma
+    s, c = sincosd(90.0 * k / frames + 7.0 * np.arange(n))
+    R = np.zeros((n, 3, 3))
+    R[:, 0, 0] = c; R[:, 0, 1] = -s; R[:, 1, 0] = s; R[:, 1, 1] = c; R[:, 2, 2] = 1
+    return CAJA @ R.transpose(0, 2, 1) + np.arange(n)[:, None, None] * [0.5, 0, 0]
+
+
+def medir_cajas(modo, frames, n):
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlim(-10, 35); ax.set_ylim(-10, 10); ax.set_zlim(-5, 5)
+    escena = Escena(ax)
+    t0 = time.perf_counter()
+    for k in range(frames):
+        escena.nuevo_fotograma()
+        V = cajas(k, frames, n)
+        if modo == 'caja':
+            escena.caja(V, color='red')
+        else:
+            for v in V:
+                for p in v:
+                    escena.scatter(p[0], p[1], p[2], marker='o')
+                for i, j in ARISTAS_CAJA:
+                    escena.plot(v[[i, j], 0], v[[i, j], 1], v[[i, j], 2], color='red', linewidth=1)
+        escena.fin_fotograma()
+        fig.canvas.draw()
+    dt = (time.perf_counter() - t0) / frames
+    plt.close(fig)
+    return dt
+
+
+if __name__ == "__main__":
+    frames = 200
+    print(f"{'modo':<12}{'ms/fotograma':>14}{'fps':>10}")
+    for nombre, fn in [('cla', medir_cla), ('escena', medir_escena)]:
+        dt = fn(frames)
+        print(f"{nombre:<12}{dt*1e3:>14.2f}{1/dt:>10.1f}")
+
+    print()
+    print(f"{'cajas':<8}{'modo':<12}{'ms/fotograma':>14}{'fps':>10}")
+    for n in (1, 50):
+        for modo in ('20 artistas', 'caja'):
+            dt = medir_cajas(modo, 20 if n > 1 else frames, n)
+            print(f"{n:<8}{modo:<12}{dt*1e3:>14.2f}{1/dt:>10.1f}")
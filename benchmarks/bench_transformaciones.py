@@ -0,0 +1,86 @@
+"""
+Microbenchmark: construcción de rotaciones por fotograma.
+
+Compara el estilo original de los scripts (np.array a partir de listas
+anidadas en cada llamada) contra robotica.transformaciones escribiendo
+en buffers reservados una sola vez (out=).
+
+Para cada modo se simula el bucle de animate_rotation_fluida
+(R = RotX @ RotY @ RotZ) y se mide:
+    - tiempo medio por fotograma
+    - memoria pico reservada por fotograma (tracemalloc)
+
+Uso:
+    python benchmarks/bench_transformaciones.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import rotx, roty, rotz
+
+
+# ------------------ Estilo original ------------------
+def sind(t):
+    return np.sin(t * np.pi / 180)
+
+def cosd(t):
+    return np.cos(t * np.pi / 180)
+
+def RotX(t):
+    return np.array([[1, 0, 0], [0, cosd(t), -sind(t)], [0, sind(t), cosd(t)]])
+
+def RotY(t):
+    return np.array([[cosd(t), 0, sind(t)], [0, 1, 0], [-sind(t), 0, cosd(t)]])
+
+def RotZ(t):
+    return np.array([[cosd(t), -sind(t), 0], [sind(t), cosd(t), 0], [0, 0, 1]])
+
+
+def fotograma_original(a, buffers):
+    return RotX(a) @ RotY(a) @ RotZ(a)
+
+
+# ------------------ Con buffers ------------------
+def fotograma_buffers(a, buffers):
+    Rx, Ry, Rz, Rxy, R = buffers
+    rotx(a, out=Rx)
+    roty(a, out=Ry)
+    rotz(a, out=Rz)
+    np.dot(Rx, Ry, out=Rxy)
+    np.dot(Rxy, Rz, out=R)
+    return R
+
+
+def medir(fotograma, frames=2000):
+    buffers = tuple(np.empty((3, 3)) for _ in range(5))
+    angulos = [90.0 * k / frames for k in range(frames)]
+
+    # Tiempo
+    t0 = time.perf_counter()
+    for a in angulos:
+        fotograma(a, buffers)
+    dt = (time.perf_counter() - t0) / frames
+
+    # Memoria pico por fotograma
+    tracemalloc.start()
+    picos = []
+    for a in angulos[:200]:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fotograma(a, buffers)
+        picos.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return dt, float(np.median(picos))
+
+
+if __name__ == "__main__":
+    print(f"{'modo':<12}{'us/fotograma':>14}{'bytes pico/fotograma':>24}")
+    for nombre, fn in [('original', fotograma_original), ('buffers', fotograma_buffers)]:
+        dt, pico = medir(fn)
+        print(f"{nombre:<12}{dt*1e6:>14.2f}{pico:>24.0f}")
@@ -0,0 +1,359 @@
+"""
+Suite de benchmarks con cargas fijas y resultados en JSON.
+
+Los bench_*.py comparan dos o tres variantes de UNA cosa y sólo imprimen
+una tabla; aquí se mide, siempre con las mismas cargas (semilla fija),
+todo lo que cuesta CPU en las tareas y el examen:
+
+    fk/...      -> cinemática directa por pose (DH y fkine del examen,
+                   tal cual) y por lotes, para cada robot
+    ik/...      -> IK sobre rejillas de objetivos (forma cerrada y DLS)
+    barrido/... -> métricas de variantes de diseño del SCARA
+    rot/...     -> RotX/RotY/RotZ, matrices DH y vértices de cajas
+    render/...  -> un fotograma completo sin pantalla (Agg, canvas.draw)
+
+Cada caso se calibra para que una repetición dure al menos MINIMO s, se
+repite REPETICIONES veces y se guarda el mejor tiempo, la mediana y la
+desviación por llamada, y el tiempo por unidad (pose, objetivo,
+fotograma...).  El JSON lleva el commit, la fecha y las versiones, y dos
+corridas se comparan caso por caso:
+
+Uso:
+    python benchmarks/suite.py [-k filtro] [--json ruta] [--rapido]
+    python benchmarks/suite.py --comparar base.json nuevo.json [--umbral 1.10]
+
+Sin --json se escribe benchmarks/resultados/<commit>.json.  --comparar
+sale con código 1 si algún caso es más lento que umbral × base.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RAIZ)
+from robotica import barrido, cadena, esferico, planar, scara
+from robotica.cuerpos import CAJA, fotogramas, transformar_vertices
+from robotica.dh import dh_lote
+from robotica.ik_numerica import ik_camino, ik_dls
+from robotica.render import Escena
+from robotica.transformaciones import rotx, rotx_lote, roty, roty_lote, rotz, rotz_lote
+
+SEMILLA = 0
+MINIMO = 0.2        # s por repetición, como mínimo
+REPETICIONES = 5
+RESULTADOS = os.path.join(RAIZ, 'benchmarks', 'resultados')
+EXAMEN = os.path.join(RAIZ, 'Examen 3er Parcial', 'EXAMEN 3ER PARCIAL.py')
+
+CASOS = {}
+
+
+def caso(nombre, unidad):
+    """Registra preparar(rng) -> (fn sin argumentos, unidades por llamada)."""
+    def registrar(preparar):
+        CASOS[nombre] = (unidad, preparar)
+        return preparar
+    return registrar
+
+
+def _examen():
+    # Funciones de dibujo del examen tal cual (el script sólo pide datos bajo __main__)
+    return runpy.run_path(EXAMEN, run_name='examen')
+
+
+def _q_scara(rng, n):
+    return np.column_stack([rng.uniform(-180, 180, (n, 2)), rng.uniform(418.5, 880.0, n),
+                            rng.uniform(-180, 180, n)])
+
+
+# ------------------ Cinemática directa ------------------
+@caso('fk/scara/DH_examen', 'matriz')
+def _(rng):
+    return (lambda: scara.DH(30.0, -40.0, 715.0, 0.0)), 1
+
+
+@caso('fk/scara/fkine_examen', 'pose')
+def _(rng):
+    return (lambda: scara.fkine(30.0, 45.0, 700.0, 90.0, 715.0, 850.0, 776.0, -40.0, 100.0)), 1
+
+
+@caso('fk/scara/fkine_lote', 'pose')
+def _(rng):
+    t1, t2, l, t3 = _q_scara(rng, 10_000).T
+    return (lambda: scara.fkine_lote(t1, t2, l, t3, 715.0, 850.0)), len(t1)
+
+
+@caso('fk/scara/fkine_analitico', 'pose')
+def _(rng):
+    t1, t2, l, t3 = _q_scara(rng, 10_000).T
+    return (lambda: scara.fkine_lote(t1, t2, l, t3, 715.0, 850.0, modo='analitico')), len(t1)
+
+
+@caso('fk/scara/cadena_pose', 'pose')
+def _(rng):
+    robot, q = cadena.scara(), _q_scara(rng, 1)[0]
+    return (lambda: robot.fk(q)), 1
+
+
+@caso('fk/scara/cadena_lote', 'pose')
+def _(rng):
+    robot, q = cadena.scara(), _q_scara(rng, 10_000)
+    return (lambda: robot.marcos(q)), len(q)
+
+
+@caso('fk/planar/pose', 'pose')
+def _(rng):
+    return (lambda: planar.fk_planar(30.0, 45.0)), 1
+
+
+@caso('fk/planar/lote', 'pose')
+def _(rng):
+    t1, t2 = rng.uniform(-180, 180, (2, 10_000))
+    return (lambda: planar.fk_planar(t1, t2)), len(t1)
+
+
+@caso('fk/esferico/pose', 'pose')
+def _(rng):
+    return (lambda: esferico.fk_esferico(30.0, 45.0, 60.0)), 1
+
+
+@caso('fk/esferico/lote', 'pose')
+def _(rng):
+    t1, t2, t3 = rng.uniform(-180, 180, (3, 10_000))
+    return (lambda: esferico.fk_esferico(t1, t2, t3)), len(t1)
+
+
+@caso('fk/dh_2r/lote', 'pose')
+def _(rng):
+    robot, q = cadena.dh_2r(3.0, 2.0), rng.uniform(-180, 180, (10_000, 2))
+    return (lambda: robot.puntos(q)), len(q)
+
+
+# ------------------ Cinemática inversa ------------------
+@caso('ik/planar/rejilla', 'objetivo')
+def _(rng):
+    x, y = np.meshgrid(np.linspace(-25, 25, 100), np.linspace(-25, 25, 100))
+    return (lambda: planar.ik_planar(x.ravel(), y.ravel())), x.size
+
+
+@caso('ik/esferico/rejilla', 'objetivo')
+def _(rng):
+    eje = np.linspace(-28, 28, 22)
+    p = np.stack(np.meshgrid(eje, eje, eje), axis=-1).reshape(-1, 3)
+    return (lambda: esferico.ik_esferico(p)), len(p)
+
+
+@caso('ik/scara/dls_rejilla', 'objetivo')
+def _(rng):
+    robot = cadena.scara()
+    p = robot.fk(_q_scara(rng, 500))[:, :3, 3]
+    q0 = np.array([30.0, 45.0, 700.0, 0.0])
+    return (lambda: ik_dls(robot, p, q0)), len(p)
+
+
+@caso('ik/scara/dls_camino', 'objetivo')
+def _(rng):
+    robot = cadena.scara()
+    q0 = np.array([30.0, 45.0, 700.0, 0.0])
+    p = np.linspace(robot.fk(q0)[:3, 3], [900.0, 600.0, 1000.0], 500)
+    return (lambda: ik_camino(robot, p, q0)), len(p)
+
+
+@caso('barrido/metricas', 'variante')
+def _(rng):
+    variantes = barrido.rejilla({'A1': '500:900:16', 'A2': '600:1000:16', 'BAR_MAX': '800:900:4'})
+    return (lambda: barrido.metricas(variantes)), len(variantes)
+
+
+# ------------------ Rotaciones y cajas ------------------
+@caso('rot/RotXYZ_pose', 'rotación')
+def _(rng):
+    return (lambda: rotx(30.0) @ roty(45.0) @ rotz(60.0)), 1
+
+
+@caso('rot/RotXYZ_lote', 'rotación')
+def _(rng):
+    a = rng.uniform(-180, 180, 10_000)
+    return (lambda: rotx_lote(a) @ roty_lote(a) @ rotz_lote(a)), len(a)
+
+
+@caso('rot/dh_lote', 'matriz')
+def _(rng):
+    th, d, a, al = rng.uniform(-180, 180, (4, 10_000))
+    return (lambda: dh_lote(th, d, a, al)), len(th)
+
+
+@caso('rot/caja_pose', 'caja')
+def _(rng):
+    R, out = rotz(30.0), np.empty((8, 3))
+    return (lambda: transformar_vertices(CAJA, R, out=out)), 1
+
+
+@caso('rot/cajas_animacion', 'caja')
+def _(rng):
+    V = CAJA[None] + rng.uniform(-10, 10, (100, 1, 3))
+    R = rotz_lote(np.arange(360.0))
+    return (lambda: fotogramas(V, R)), 100 * 360
+
+
+# ------------------ Render sin pantalla ------------------
+@caso('render/examen_fotograma', 'fotograma')
+def _(rng):
+    ex = _examen()
+    poses = scara.tabla_poses(30.0, np.linspace(0, 90, 240), np.linspace(880, 418.5, 240),
+                              np.linspace(0, 360, 240), 715.0, 850.0)
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
+    ex['configurar_ejes'](ax, 1865.0)
+    escena = Escena(ax)
+    i = iter(range(10**9))
+
+    def fotograma():
+        q = poses[next(i) % len(poses)]
+        escena.nuevo_fotograma()
+        ex['dibujar_robot'](escena, q['p_base'], q['p_eje'], q['p1'], q['p2'], q['p_top'],
+                            *q['circulo'], *q['punto'], *q['p2'])
+        escena.fin_fotograma()
+        fig.canvas.draw()
+    return fotograma, 1
+
+
+@caso('render/caja_fotograma', 'fotograma')
+def _(rng):
+    cajas = fotogramas(CAJA, rotz_lote(np.arange(360.0)))
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlim(-10, 10); ax.set_ylim(-10, 10); ax.set_zlim(-10, 10)
+    escena = Escena(ax)
+    i = iter(range(10**9))
+
+    def fotograma():
+        escena.nuevo_fotograma()
+        escena.caja(cajas[next(i) % len(cajas)], color='magenta', color_vertices='black')
+        escena.fin_fotograma()
+        fig.canvas.draw()
+    return fotograma, 1
+
+
+# ------------------ Medición ------------------
+def medir(fn, minimo=MINIMO, repeticiones=REPETICIONES):
+    """
+    Calibra el número de llamadas por repetición para que dure al menos
+    minimo s y regresa (tiempos por llamada de cada repetición, llamadas).
+    """
+    fn()  # calentamiento (cachés, primeras reservas de memoria)
+    llamadas = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(llamadas):
+            fn()
+        dt = time.perf_counter() - t0
+        if dt >= minimo:
+            break
+        llamadas = max(llamadas * 2, int(llamadas * minimo / max(dt, 1e-9) * 1.1))
+    tiempos = [dt / llamadas]
+    for _ in range(repeticiones - 1):
+        t0 = time.perf_counter()
+        for _ in range(llamadas):
+            fn()
+        tiempos.append((time.perf_counter() - t0) / llamadas)
+    return np.array(tiempos), llamadas
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git', *args], cwd=RAIZ, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadatos():
+    return dict(commit=_git('rev-parse', '--short', 'HEAD'),
+                cambios_sin_commit=bool(_git('status', '--porcelain', '--untracked-files=no')),
+                fecha=datetime.datetime.now().isoformat(timespec='seconds'),
+                python=platform.python_version(), numpy=np.__version__,
+                matplotlib=matplotlib.__version__, plataforma=platform.platform(),
+                procesador=platform.processor() or platform.machine(), nucleos=os.cpu_count(),
+                semilla=SEMILLA)
+
+
+def correr(filtro=None, minimo=MINIMO, repeticiones=REPETICIONES):
+    resultados = {}
+    print(f"{'caso':<28}{'mejor':>12}{'mediana':>12}{'±':>9}{'por unidad':>14}")
+    for nombre, (unidad, preparar) in CASOS.items():
+        if filtro and filtro not in nombre:
+            continue
+        fn, unidades = preparar(np.random.default_rng(SEMILLA))
+        tiempos, llamadas = medir(fn, minimo, repeticiones)
+        plt.close('all')
+        mejor = float(tiempos.min())
+        resultados[nombre] = dict(mejor_s=mejor, mediana_s=float(np.median(tiempos)),
+                                  desv_s=float(tiempos.std()), unidades=unidades, unidad=unidad,
+                                  por_unidad_s=mejor / unidades, llamadas=llamadas,
+                                  repeticiones=len(tiempos))
+        r = resultados[nombre]
+        print(f"{nombre:<28}{_fmt(mejor):>12}{_fmt(r['mediana_s']):>12}{_fmt(r['desv_s']):>9}"
+              f"{_fmt(r['por_unidad_s']):>9}/{unidad}")
+    return resultados
+
+
+def _fmt(s):
+    for escala, sufijo in ((1.0, ' s'), (1e-3, ' ms'), (1e-6, ' us')):
+        if s >= escala:
+            return f"{s/escala:.3g}{sufijo}"
+    return f"{s*1e9:.3g} ns"
+
+
+def comparar(base, nuevo, umbral):
+    """Imprime nuevo/base por caso; regresa los casos más lentos que umbral."""
+    b, n = base['casos'], nuevo['casos']
+    print(f"base  {base['meta']['commit']} ({base['meta']['fecha']})")
+    print(f"nuevo {nuevo['meta']['commit']} ({nuevo['meta']['fecha']})\n")
+    print(f"{'caso':<28}{'base':>12}{'nuevo':>12}{'nuevo/base':>12}")
+    lentos = []
+    for nombre in sorted(set(b) | set(n)):
+        if nombre not in b or nombre not in n:
+            print(f"{nombre:<28}{'sólo en ' + ('nuevo' if nombre in n else 'base'):>36}")
+            continue
+        razon = n[nombre]['por_unidad_s'] / b[nombre]['por_unidad_s']
+        marca = '  más lento' if razon > umbral else '  más rápido' if razon < 1 / umbral else ''
+        if razon > umbral:
+            lentos.append(nombre)
+        print(f"{nombre:<28}{_fmt(b[nombre]['por_unidad_s']):>12}{_fmt(n[nombre]['por_unidad_s']):>12}"
+              f"{razon:>12.2f}{marca}")
+    return lentos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('-k', dest='filtro', help='sólo los casos cuyo nombre contiene el texto')
+    parser.add_argument('--json', help='archivo de resultados (por defecto resultados/<commit>.json)')
+    parser.add_argument('--rapido', action='store_true', help='menos tiempo por caso (menos estable)')
+    parser.add_argument('--comparar', nargs=2, metavar=('BASE', 'NUEVO'))
+    parser.add_argument('--umbral', type=float, default=1.10)
+    args = parser.parse_args()
+
+    if args.comparar:
+        with open(args.comparar[0]) as f1, open(args.comparar[1]) as f2:
+            lentos = comparar(json.load(f1), json.load(f2), args.umbral)
+        sys.exit(1 if lentos else 0)
+
+    meta = metadatos()
+    casos = correr(args.filtro, *((0.05, 3) if args.rapido else (MINIMO, REPETICIONES)))
+    ruta = args.json or os.path.join(RESULTADOS, f"{meta['commit'] or 'sin_git'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, 'w') as f:
+        json.dump(dict(meta=meta, casos=casos), f, indent=2)
+    print(f"\nresultados: {os.path.relpath(ruta)}")
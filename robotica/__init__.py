@@ -0,0 +1,38 @@
+"""
+Paquete de utilidades compartidas por las tareas y el examen de Robótica.
+
+Los scripts de cada tarea siguen siendo independientes; este paquete
+concentra las versiones VECTORIZADAS (por lotes) de los cálculos que los
+scripts hacen pose por pose, para poder barrer miles de configuraciones
+en una sola pasada de NumPy.
+
+Módulos:
+    dh               -> matrices de Denavit–Hartenberg por lotes y productos acumulados
+    scara            -> cinemática directa del SCARA del examen, por lotes (DH o analítica)
+    transformaciones -> RotX/RotY/RotZ y homogéneas en un buffer (out=), y rotaciones por lotes
+    trig             -> sind/cosd/sincosd en grados, exactos en múltiplos de 90°
+    planar           -> robot planar 2R (Tarea 4): FK e IK por lotes con ambas ramas del codo
+    esferico         -> brazo esférico (Tarea 4): FK e IK por lotes con las 4 ramas
+    espacio_trabajo  -> mapa de alcance voxelizado con caché .npy (memory-mapped)
+    render           -> Escena: artistas persistentes, cajas en 2 artistas y exportación sin pantalla
+    cuerpos          -> cuerpos rígidos como arreglos (8, 3); animaciones precalculadas (F, 8, 3)
+    poses            -> tablas de poses (arreglos estructurados) para separar cinemática y dibujo
+    registro         -> trayectorias en archivo binario .rtray, escritura incremental y lectura memmap
+    estela           -> rastro del efector final en un buffer circular (O(1) por punto, vistas sin copia)
+    perfiles         -> perfiles articulares en el tiempo (cúbico, quíntico, trapezoidal) para J articulaciones
+    cartesiano       -> caminos en línea recta / arco con IK por lotes y rama continua (np.unwrap)
+    cadena           -> CadenaSerial: cualquier robot serial desde su tabla DH (R/P), presets del curso,
+                        jacobianos (N, 6, J) y manipulabilidad
+    ik_numerica      -> IK por mínimos cuadrados amortiguados sobre CadenaSerial, en lote y con warm start
+    colisiones       -> cápsulas contra sí mismas y contra cajas (BVH), por lotes de trayectorias
+    perfilado        -> tiempos por fotograma (cinemática, artistas, dibujo, espera); tabla o traza Chrome
+    configuracion    -> parámetros de los scripts desde .json/.jsonl/.csv o CLAVE=valor, variantes en lote
+    barrido          -> barrido de parámetros de diseño del SCARA en paralelo, reanudable, tabla CSV
+
+Uso desde un script de tarea (las carpetas tienen espacios, por eso se
+añade la raíz del repositorio al path):
+
+    import os, sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from robotica.dh import dh_lote
+"""
@@ -0,0 +1,208 @@
+"""
+Barrido de parámetros de diseño del SCARA del examen, en paralelo y reanudable.
+
+fkine() y animar_movimiento_unico() reciben los parámetros como
+escalares: una variante del robot a la vez.  Aquí se arma la rejilla de
+VARIANTES (producto cartesiano de rangos sobre A1, A2, carrera de la
+barra, desplazamiento del brazo y radio del platillo), se reparte por
+bloques entre procesos y cada bloque evalúa la cinemática directa de
+todas sus variantes juntas, (V, muestras de θ2, extremos de la carrera),
+con scara.puntos_analiticos.  Métricas por variante:
+
+    alcance_min, alcance_max -> distancia radial mínima / máxima de la punta
+                                al eje (θ2 en [-theta2_max, theta2_max])
+    area_trabajo             -> corona que barre la punta al girar θ1
+    z_min, z_max             -> altura mínima / máxima de la punta (la altura
+                                es lineal en la carrera: bastan sus extremos)
+    radio_platillo           -> radio que barre el borde del platillo
+    carrera                  -> |BAR_MAX - BAR_MIN|
+
+Los resultados van a una tabla CSV, un renglón por variante, escrita
+bloque por bloque.  Si el barrido se interrumpe, al volver a correrlo
+con el mismo archivo se leen las variantes ya hechas (sus parámetros,
+theta2_max y muestras son la clave) y sólo se calculan las que faltan;
+un renglón a medias al final del archivo se descarta.
+
+    python -m robotica.barrido resultados.csv A1=600:800:5 A2=700:900:5 BAR_MIN=400,418.5
+
+Rango = ini:fin:n (n valores, ambos extremos incluidos) o lista con
+comas; los parámetros que no se dan quedan en su valor del examen
+(configuracion.SCARA).  Opciones en la misma forma: procesos=N (por
+defecto todos los núcleos), bloque=N, theta2_max=grados, muestras=N.
+"""
+
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from . import scara
+from .configuracion import SCARA
+
+PARAMETROS = ('A1', 'A2', 'BAR_MIN', 'BAR_MAX', 'BRAZO_OFFSET_Z', 'R_PLATILLO')
+METRICAS = ('alcance_min', 'alcance_max', 'area_trabajo', 'z_min', 'z_max',
+            'radio_platillo', 'carrera')
+CLAVE = PARAMETROS + ('theta2_max', 'muestras')
+COLUMNAS = CLAVE + METRICAS
+
+BLOQUE = 256          # variantes por tarea del pool
+MUESTRAS_THETA2 = 721  # cada 0.5° con theta2_max = 180
+THETA2_MAX = 180.0
+
+
+# ------------------ Rejilla de variantes ------------------
+def valores(espec):
+    """'ini:fin:n' -> linspace, 'a,b,c' -> lista, número o secuencia tal cual."""
+    if isinstance(espec, str):
+        if ':' in espec:
+            ini, fin, n = espec.split(':')
+            return np.linspace(float(ini), float(fin), int(n))
+        return np.array([float(v) for v in espec.split(',')])
+    return np.atleast_1d(np.asarray(espec, dtype=float))
+
+
+def rejilla(rangos):
+    """
+    Producto cartesiano de los rangos, (V, len(PARAMETROS)) en el orden
+    de PARAMETROS; los que no están en rangos valen lo de SCARA.
+    """
+    desconocidos = set(rangos) - set(PARAMETROS)
+    if desconocidos:
+        raise ValueError(f"parámetros desconocidos: {', '.join(sorted(desconocidos))} "
+                         f"(válidos: {', '.join(PARAMETROS)})")
+    ejes = [valores(rangos.get(p, SCARA[p])) for p in PARAMETROS]
+    malla = np.meshgrid(*ejes, indexing='ij')
+    return np.stack([m.ravel() for m in malla], axis=-1)
+
+
+# ------------------ Métricas ------------------
+def metricas(variantes, theta2_max=THETA2_MAX, muestras=MUESTRAS_THETA2):
+    """
+    Métricas de V variantes a la vez.
+
+    variantes -> (V, len(PARAMETROS)).  Regresa (V, len(METRICAS)).
+    """
+    P = np.asarray(variantes, dtype=float).reshape(-1, len(PARAMETROS))
+    A1, A2, bar_min, bar_max, offset, r_platillo = (P[:, k, None, None] for k in range(len(PARAMETROS)))
+    theta2 = np.linspace(-theta2_max, theta2_max, muestras)[None, :, None]
+    barra = np.concatenate([bar_min, bar_max], axis=-1)          # (V, 1, 2)
+
+    # θ1 = 0: por simetría, el giro de θ1 sólo rota el anillo de alcance
+    _, _, punta = scara.puntos_analiticos(0.0, theta2, barra, A1, A2,
+                                          scara.BASE_HEIGHT, offset)   # (V, M, 2, 3)
+    radio = np.hypot(punta[..., 0], punta[..., 1]).reshape(len(P), -1)
+    z = punta[..., 2].reshape(len(P), -1)
+
+    salida = np.empty((len(P), len(METRICAS)))
+    r_min, r_max = radio.min(axis=1), radio.max(axis=1)
+    salida[:, 0], salida[:, 1] = r_min, r_max
+    salida[:, 2] = np.pi * (r_max**2 - r_min**2)
+    salida[:, 3], salida[:, 4] = z.min(axis=1), z.max(axis=1)
+    salida[:, 5] = r_max + r_platillo[:, 0, 0]
+    salida[:, 6] = np.abs(bar_max - bar_min)[:, 0, 0]
+    return salida
+
+
+def _bloque(variantes, theta2_max, muestras):
+    # Corre en un proceso del pool
+    return variantes, metricas(variantes, theta2_max, muestras)
+
+
+# ------------------ Tabla de resultados ------------------
+def _clave(fila):
+    return tuple(float(fila[c]) for c in CLAVE)
+
+
+def _reanudar(ruta):
+    """Claves de las variantes ya escritas en ruta (y la deja lista para anexar)."""
+    if not os.path.exists(ruta) or os.path.getsize(ruta) == 0:
+        return set()
+    with open(ruta, 'rb+') as f:
+        contenido = f.read()
+        if not contenido.endswith(b'\n'):
+            # Renglón a medias de un barrido interrumpido
+            f.truncate(contenido.rfind(b'\n') + 1)
+    if os.path.getsize(ruta) == 0:
+        # Interrumpido antes de terminar el encabezado: barrer() lo vuelve a escribir
+        return set()
+    with open(ruta, newline='') as f:
+        lector = csv.DictReader(f)
+        if tuple(lector.fieldnames or ()) != COLUMNAS:
+            raise ValueError(f"{ruta}: columnas {lector.fieldnames} no son las de un barrido "
+                             f"({', '.join(COLUMNAS)})")
+        return {_clave(fila) for fila in lector}
+
+
+def leer_resultados(ruta):
+    """Tabla de resultados como arreglo estructurado (un campo por columna)."""
+    datos = np.loadtxt(ruta, delimiter=',', skiprows=1, ndmin=2)
+    return np.rec.fromarrays(datos.T, names=list(COLUMNAS)) if datos.size else \
+        np.empty(0, dtype=[(c, float) for c in COLUMNAS])
+
+
+def barrer(rangos, ruta, procesos=None, bloque=BLOQUE, theta2_max=THETA2_MAX,
+           muestras=MUESTRAS_THETA2):
+    """
+    Evalúa todas las variantes de rejilla(rangos) que aún no estén en
+    ruta y las anexa.  procesos -> por defecto todos los núcleos (1 = sin
+    pool).  Regresa (variantes nuevas, ya hechas, segundos).
+    """
+    t0 = time.perf_counter()
+    variantes = rejilla(rangos)
+    hechas = _reanudar(ruta)
+    if hechas:
+        extra = (float(theta2_max), float(muestras))
+        pendientes = np.array([tuple(v) + extra not in hechas for v in variantes.tolist()],
+                              dtype=bool)
+        variantes = variantes[pendientes]
+    bloques = [variantes[i:i + bloque] for i in range(0, len(variantes), bloque)]
+    procesos = procesos or os.cpu_count() or 1
+
+    nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+    with open(ruta, 'a', newline='') as f:
+        escritor = csv.writer(f)
+        if nuevo:
+            escritor.writerow(COLUMNAS)
+
+        def anexar(P, M):
+            escritor.writerows([*map(repr, p), repr(theta2_max), repr(muestras), *map(repr, m)]
+                               for p, m in zip(P.tolist(), M.tolist()))
+            f.flush()   # cada bloque queda en disco: se puede reanudar desde aquí
+
+        if procesos == 1 or len(bloques) <= 1:
+            for P in bloques:
+                anexar(*_bloque(P, theta2_max, muestras))
+        else:
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                futuros = [pool.submit(_bloque, P, theta2_max, muestras) for P in bloques]
+                for futuro in as_completed(futuros):
+                    anexar(*futuro.result())
+    return len(variantes), len(hechas), time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    # python -m robotica.barrido resultados.csv A1=600:800:5 ... [procesos=N bloque=N theta2_max=G muestras=N]
+    if len(sys.argv) < 2 or not sys.argv[1].lower().endswith('.csv'):
+        sys.exit('uso: python -m robotica.barrido <resultados.csv> [PARAM=ini:fin:n | PARAM=a,b,c ...] '
+                 '[procesos=N] [bloque=N] [theta2_max=grados] [muestras=N]')
+    rangos, opciones = {}, {}
+    for arg in sys.argv[2:]:
+        clave, _, valor = arg.partition('=')
+        if clave in ('procesos', 'bloque', 'muestras'):
+            opciones[clave] = int(valor)
+        elif clave == 'theta2_max':
+            opciones[clave] = float(valor)
+        else:
+            rangos[clave] = valor
+    nuevas, hechas, dt = barrer(rangos, sys.argv[1], **opciones)
+    print(f"{nuevas} variantes nuevas ({hechas} ya estaban) en {dt:.2f} s"
+          + (f", {nuevas / dt:.0f} variantes/s" if nuevas else ""))
+    tabla = leer_resultados(sys.argv[1])
+    if len(tabla):
+        mejor = tabla[np.argmax(tabla['area_trabajo'])]
+        print(f"{len(tabla)} variantes en {sys.argv[1]}; mayor área de trabajo: "
+              + ", ".join(f"{p}={mejor[p]:g}" for p in PARAMETROS)
+              + f" -> {mejor['area_trabajo']:.4g} mm², z_max {mejor['z_max']:.1f} mm")
@@ -0,0 +1,227 @@
+"""
+Cadena serial genérica a partir de una tabla DH.
+
+Cada robot del curso tiene su cinemática directa escrita a mano
+(puntos() del 2R de la Tarea 5, fk_planar() y fk_esferico() de la
+Tarea 4, fkine() del SCARA).  CadenaSerial las reemplaza por UNA
+implementación que sirve para cualquier número de articulaciones,
+vectorizada sobre lotes de poses q (..., J):
+
+    T_i = Rz(θ_i) · Tz(d_i) · Tx(a_i) · Rx(α_i)
+
+    R (rotacional): θ_i = q_i + θ de la tabla   (la tabla da el offset)
+    P (prismática): d_i = q_i + d de la tabla
+
+Lo que no depende de q se calcula UNA vez al construir la cadena:
+
+    R:  T_i = Rz(q_i + θ) · M_i,   M_i = Tz(d)·Tx(a)·Rx(α) constante
+        -> por pose sólo se combinan las filas 0 y 1 de M_i con (cos, sen)
+    P:  T_i = Tz(q_i) · C_i,       C_i = Rz(θ)·Tz(d)·Tx(a)·Rx(α) constante
+        -> por pose sólo cambia el elemento [2, 3]
+
+Los robots existentes están como presets (scara, planar_2r, esferico,
+dh_2r); tests/test_cadena.py verifica que reproducen sus cinemáticas
+originales.  jacobiano() da la cinemática de velocidades (..., 6, J) a
+partir de los mismos marcos, y manipulabilidad() el índice de
+Yoshikawa por pose.  Los ángulos van en GRADOS.
+"""
+
+import numpy as np
+
+from .dh import dh_lote
+from .trig import sincosd
+
+TIPOS_ARTICULACION = ('R', 'P')
+
+
+class CadenaSerial:
+    """
+    Robot serial definido por su tabla DH.
+
+    tabla       -> (J, 4) filas (θ, d, a, α); en la columna de la variable
+                   articular va su offset
+    tipos       -> 'R'/'P' por articulación, p. ej. 'RRPR'
+    base        -> homogénea 4x4 del mundo a la base (identidad por defecto)
+    herramienta -> homogénea 4x4 del último eslabón a la herramienta
+    """
+
+    def __init__(self, tabla, tipos, base=None, herramienta=None, nombre=''):
+        self.tabla = np.array(tabla, dtype=float).reshape(-1, 4)
+        self.tipos = tuple(tipos)
+        if len(self.tipos) != len(self.tabla):
+            raise ValueError(f"{len(self.tabla)} filas DH pero {len(self.tipos)} tipos de articulación")
+        if not set(self.tipos) <= set(TIPOS_ARTICULACION):
+            raise ValueError(f"tipos de articulación válidos: {', '.join(TIPOS_ARTICULACION)}")
+        self.base = np.eye(4) if base is None else np.asarray(base, dtype=float)
+        self.herramienta = np.eye(4) if herramienta is None else np.asarray(herramienta, dtype=float)
+        self.nombre = nombre
+
+        theta, d, a, alpha = self.tabla.T
+        rot = np.array([t == 'R' for t in self.tipos])
+        self._r = np.flatnonzero(rot)     # índices de articulaciones rotacionales
+        self._p = np.flatnonzero(~rot)    # índices de prismáticas
+        self._offset = np.where(rot, theta, d)
+        # Partes constantes: M = Tz(d)·Tx(a)·Rx(α) para R, C = DH completa para P
+        self._const = dh_lote(np.where(rot, 0.0, theta), np.where(rot, d, 0.0), a, alpha)
+        self._base_identidad = np.array_equal(self.base, np.eye(4))
+
+    @property
+    def n(self):
+        return len(self.tipos)
+
+    def __repr__(self):
+        return f"CadenaSerial({self.nombre or ''.join(self.tipos)!r}, {self.n} articulaciones)"
+
+    def _q(self, q):
+        q = np.asarray(q, dtype=float)
+        if q.shape[-1:] != (self.n,):
+            raise ValueError(f"q debe terminar en ({self.n},), no {q.shape}")
+        return q + self._offset
+
+    def eslabones(self, q):
+        """Transformaciones de cada eslabón, (..., J, 4, 4)."""
+        v = self._q(q)
+        T = np.empty(v.shape + (4, 4))
+        T[...] = self._const
+        # Rz(θ)·M: sólo cambian las filas 0 y 1 (un paso por articulación, N poses a la vez)
+        s, c = sincosd(v[..., self._r])
+        for k, j in enumerate(self._r):
+            M0, M1 = self._const[j, 0], self._const[j, 1]
+            sk, ck = s[..., k, None], c[..., k, None]
+            T[..., j, 0, :] = ck*M0 - sk*M1
+            T[..., j, 1, :] = sk*M0 + ck*M1
+        # Tz(d)·C: sólo cambia la traslación en z
+        for j in self._p:
+            T[..., j, 2, 3] += v[..., j]
+        return T
+
+    def marcos(self, q):
+        """
+        Marcos en el mundo, (..., J+1, 4, 4): la base y el final de cada
+        eslabón (sin la herramienta).
+        """
+        A = self.eslabones(q)
+        M = np.empty(A.shape[:-3] + (self.n + 1, 4, 4))
+        M[..., 0, :, :] = self.base
+        if self._base_identidad:
+            M[..., 1, :, :] = A[..., 0, :, :]
+        else:
+            np.matmul(self.base, A[..., 0, :, :], out=M[..., 1, :, :])
+        for j in range(1, self.n):
+            np.matmul(M[..., j, :, :], A[..., j, :, :], out=M[..., j + 1, :, :])
+        return M
+
+    def fk(self, q):
+        """Pose de la herramienta en el mundo, (..., 4, 4)."""
+        return self.marcos(q)[..., -1, :, :] @ self.herramienta
+
+    def puntos(self, q):
+        """
+        Puntos para dibujar el robot, (..., J+2, 3): origen de la base, de
+        cada marco y de la herramienta.
+        """
+        M = self.marcos(q)
+        herr = (M[..., -1, :, :] @ self.herramienta)[..., None, :3, 3]
+        return np.concatenate([M[..., :3, 3], herr], axis=-2)
+
+    def jacobiano(self, q=None, marcos=None):
+        """
+        Jacobiano geométrico de la herramienta en el marco del mundo,
+        (..., 6, J): filas (vx, vy, vz, wx, wy, wz).
+
+        Reutiliza los marcos de la cinemática directa: pasar marcos=
+        self.marcos(q) si ya se calcularon (si no, se calculan con q).
+        La columna j usa el eje z_(j-1) y el origen o_(j-1) del marco
+        anterior a la articulación:
+            R: (z × (o_herr - o), z)     P: (z, 0)
+        Las columnas rotacionales son por RADIÁN (q̇ en grados/s ->
+        np.deg2rad(q̇)); las prismáticas, por unidad de longitud.
+        """
+        M = self.marcos(q) if marcos is None else marcos
+        z = M[..., :-1, :3, 2]                                   # (..., J, 3)
+        o = M[..., :-1, :3, 3]
+        fin = M[..., -1, :, :]
+        o_herr = fin[..., :3, :3] @ self.herramienta[:3, 3] + fin[..., :3, 3]
+
+        J = np.zeros(M.shape[:-3] + (6, self.n))
+        for j in self._r:
+            # z × (o_herr - o), componente por componente (N poses a la vez)
+            zx, zy, zz = z[..., j, 0], z[..., j, 1], z[..., j, 2]
+            d = o_herr - o[..., j, :]
+            dx, dy, dz = d[..., 0], d[..., 1], d[..., 2]
+            J[..., 0, j] = zy*dz - zz*dy
+            J[..., 1, j] = zz*dx - zx*dz
+            J[..., 2, j] = zx*dy - zy*dx
+            J[..., 3:, j] = z[..., j, :]
+        for j in self._p:
+            J[..., :3, j] = z[..., j, :]
+        return J
+
+    def fk_jacobiano(self, q):
+        """(pose de la herramienta (..., 4, 4), jacobiano (..., 6, J)) con un solo FK."""
+        M = self.marcos(q)
+        return M[..., -1, :, :] @ self.herramienta, self.jacobiano(marcos=M)
+
+
+def manipulabilidad(J, filas=None):
+    """
+    Índice de Yoshikawa w = sqrt(det(Jf · Jfᵀ)) por pose, (...,).
+
+    filas -> filas del jacobiano que cuentan (p. ej. [0, 1, 2, 5] para el
+             SCARA: x, y, z y giro en z); todas por defecto.  w = 0 en
+             las singularidades.
+    """
+    Jf = J if filas is None else J[..., filas, :]
+    return np.sqrt(np.maximum(np.linalg.det(Jf @ np.swapaxes(Jf, -1, -2)), 0.0))
+
+
+# ------------------ Presets ------------------
+
+def _tz(z):
+    T = np.eye(4)
+    T[2, 3] = z
+    return T
+
+
+def scara(A1=715.0, A2=850.0, BASE_HEIGHT=776.0, BRAZO_OFFSET_Z=-40.0, LP=322.0):
+    """
+    SCARA del examen; q = (θ1, θ2, l_barra_abs, θ3).
+
+    fkine() transforma puntos a altura BASE_HEIGHT (base) y el pistón
+    suma LP (herramienta); la prismática usa d = l_barra_abs +
+    BRAZO_OFFSET_Z - BASE_HEIGHT.
+    """
+    tabla = [[0, 0, A1, 0],
+             [0, 0, A2, 0],
+             [0, BRAZO_OFFSET_Z - BASE_HEIGHT, 0, 0],
+             [0, 0, 0, 0]]
+    return CadenaSerial(tabla, 'RRPR', base=_tz(BASE_HEIGHT), herramienta=_tz(LP), nombre='scara')
+
+
+def planar_2r(L1=15.0, L2=10.0):
+    """Planar 2R de la Tarea 4 en el plano XY; q = (θ1, θ2)."""
+    return CadenaSerial([[0, 0, L1, 0], [0, 0, L2, 0]], 'RR', nombre='planar_2r')
+
+
+def esferico(L1=15.0, L2=13.0):
+    """
+    Brazo esférico de la Tarea 4; q = (θ1, θ2, θ3) con los signos del
+    script: T1 = Rz(θ1)·Ry(θ2)·Tx(L1), T2 = T1·Ry(-θ3)·Tx(L2).
+
+    α1 = -90° pone el eje z del hombro sobre +y (Ry(θ2) = Rz(θ2) ahí) y
+    α2 = 180° lo voltea a -y para el codo (Ry(-θ3) = Rz(θ3)); los
+    puntos coinciden con fk_esferico(), la orientación del último
+    marco tiene y, z invertidos.
+    """
+    tabla = [[0, 0, 0, -90],
+             [0, 0, L1, 180],
+             [0, 0, L2, 0]]
+    return CadenaSerial(tabla, 'RRR', nombre='esferico')
+
+
+def dh_2r(a1, a2):
+    """2R de la Tarea 5, dibujado de pie en el plano X–Z: base = Rx(90°)."""
+    base = np.eye(4)
+    base[1:3, 1:3] = [[0, -1], [1, 0]]
+    return CadenaSerial([[0, 0, a1, 0], [0, 0, a2, 0]], 'RR', base=base, nombre='dh_2r')
+
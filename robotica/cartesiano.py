@@ -0,0 +1,101 @@
+"""
+Caminos cartesianos (línea recta y arco) resueltos con IK por lotes.
+
+Las animaciones de la Tarea 4 interpolan los ÁNGULOS linealmente, así
+que el efector final describe una curva y no la recta hasta
+(x_target, y_target, z_target).  Aquí el camino se muestrea en el
+espacio de la tarea y la cinemática inversa de todas las muestras se
+resuelve en una sola llamada (ik_planar / ik_esferico):
+
+    s = rampa(0, 1, n)[:, 0]                  # o un perfil de robotica.perfiles
+    puntos = linea(p_inicio, p_objetivo, s)   # (n, 3)
+    q, alcanzable = ik_camino_esferico(puntos, 'frente-abajo')
+    poses = esferico.tabla_poses(*q.T)
+
+Continuidad entre muestras:
+  - La rama se sigue por FAMILIA (signo del codo), no por la etiqueta
+    arriba/abajo de cada muestra, que depende de la altura del codo y
+    puede intercambiarse a mitad del camino.  La rama pedida se refiere
+    a la postura en el objetivo (la última muestra).
+  - Los ángulos se desenvuelven con np.unwrap (periodo 360°), así no hay
+    saltos de ±360° cuando atan2 cruza ±180°.
+
+Si la variable de entorno ROBOTICA_CAMINO es 'linea', los scripts de la
+Tarea 4 mueven el efector final en línea recta en lugar de interpolar
+los ángulos.
+"""
+
+import os
+
+import numpy as np
+
+from . import esferico, planar
+from .trig import sincosd
+
+CAMINOS = ('articular', 'linea')
+CAMINO = os.environ.get('ROBOTICA_CAMINO') or 'articular'
+
+
+def linea(p0, pf, s):
+    """Puntos (N, D) del segmento p0 -> pf en las fracciones s (N,) de [0, 1]."""
+    p0 = np.asarray(p0, dtype=float)
+    pf = np.asarray(pf, dtype=float)
+    s = np.atleast_1d(np.asarray(s, dtype=float))[:, None]
+    return p0 + s * (pf - p0)
+
+
+def arco(centro, inicio, angulo, s, normal=(0.0, 0.0, 1.0)):
+    """
+    Puntos (N, 3) de un arco: 'inicio' girado alrededor de 'centro' hasta
+    'angulo' grados (regla de la mano derecha sobre 'normal'), en las
+    fracciones s (N,) de [0, 1].
+    """
+    centro = np.asarray(centro, dtype=float)
+    k = np.asarray(normal, dtype=float)
+    k = k / np.linalg.norm(k)
+    v = np.asarray(inicio, dtype=float) - centro
+    sn, cs = sincosd(angulo * np.atleast_1d(np.asarray(s, dtype=float)))
+    sn, cs = sn[:, None], cs[:, None]
+    # Rodrigues: v·cos φ + (k × v)·sin φ + k·(k·v)·(1 - cos φ)
+    return centro + v * cs + np.cross(k, v) * sn + k * np.dot(k, v) * (1 - cs)
+
+
+def _ultimo_definido(valores, eps=1e-9):
+    # Signo (+1/-1) del último valor lejos de cero; +1 si todos son ~0
+    definidos = np.flatnonzero(np.abs(valores) > eps)
+    return 1.0 if definidos.size == 0 else float(np.sign(valores[definidos[-1]]))
+
+
+def ik_camino_planar(puntos, rama='abajo', L1=planar.L1, L2=planar.L2):
+    """
+    IK del 2R para un camino (N, 2) o (N, 3) (se ignora z).
+
+    rama -> 'arriba' (θ2 >= 0) o 'abajo' (θ2 <= 0); cada rama ya es una
+            familia continua, sólo falta desenvolver θ1.
+    Regresa (q (N, 2) en grados, alcanzable (N,)).
+    """
+    if rama not in ('arriba', 'abajo'):
+        raise ValueError(f"rama desconocida {rama!r}; opciones: arriba, abajo")
+    p = np.atleast_2d(np.asarray(puntos, dtype=float))
+    sol_arriba, sol_abajo, alcanzable = planar.ik_planar(p[:, 0], p[:, 1], L1, L2)
+    q = sol_arriba if rama == 'arriba' else sol_abajo
+    return np.unwrap(q, period=360.0, axis=0), alcanzable
+
+
+def ik_camino_esferico(puntos, rama='frente-abajo', L1=esferico.L1, L2=esferico.L2):
+    """
+    IK del brazo esférico para un camino (N, 3).
+
+    rama -> una de esferico.RAMAS, tal como queda en el objetivo (la
+            última muestra); en el resto del camino se sigue la misma
+            familia: mismo hombro y mismo signo de θ3.
+    Regresa (q (N, 3) en grados, alcanzable (N,)).
+    """
+    if rama not in esferico.RAMAS:
+        raise ValueError(f"rama desconocida {rama!r}; opciones: {', '.join(esferico.RAMAS)}")
+    sol, validas = esferico.ik_esferico(puntos, L1, L2)
+    r = esferico.RAMAS.index(rama)
+    par = sol[:, 2 * (r // 2):2 * (r // 2) + 2]          # (N, 2, 3) las dos ramas del hombro
+    signo = _ultimo_definido(sol[:, r, 2])
+    q = np.where((par[:, 0, 2] * signo >= 0)[:, None], par[:, 0], par[:, 1])
+    return np.unwrap(q, period=360.0, axis=0), validas[:, r]
@@ -0,0 +1,303 @@
+"""
+Colisiones de los robots (cápsulas) contra sí mismos y contra cajas.
+
+fkine(), fk_planar(), fk_esferico() y puntos() sólo dan puntos y el dibujo
+traza segmentos: nada revisaba si un eslabón atraviesa a otro o a un
+obstáculo.  Aquí:
+
+  - Cada eslabón es una CÁPSULA: el segmento entre dos puntos de
+    CadenaSerial.puntos(q) más un radio.
+  - Los obstáculos son cajas orientadas (OBB); cajas_desde_vertices()
+    las arma a partir de vértices (8, 3) en el orden de cuerpos.CAJA,
+    como las cajas de la Tarea 2.
+  - Las cajas se indexan en una jerarquía de volúmenes envolventes (BVH)
+    de AABB; cada cápsula sólo se prueba contra las cajas cuyo AABB toca
+    el suyo.  El recorrido es por niveles, con arreglos de pares
+    (cápsula, nodo), así que todas las cápsulas de todas las poses bajan
+    por el árbol a la vez.
+  - Las distancias son exactas: segmento-segmento (Ericson, "Real-Time
+    Collision Detection", 5.1.9) y segmento-caja (la distancia al
+    cuadrado a lo largo del segmento es convexa y cuadrática por tramos
+    entre los cruces con los planos de la caja; se evalúan los extremos
+    de cada tramo y su mínimo).
+
+Todo va por lotes: ModeloColision.verificar(q) recibe (..., J) poses (una
+trayectoria, o (C, N, J) caminos candidatos completos) y regresa un
+booleano por pose.
+
+    modelo = modelo_scara()
+    obst = Obstaculos(cajas_desde_vertices(vertices))
+    choque, propio, contra_obstaculo = modelo.verificar(q, obst)
+"""
+
+import numpy as np
+
+from . import cadena as _cadena
+
+HOJA = 4  # cajas por hoja del BVH
+
+
+# ------------------ Distancias exactas ------------------
+def distancia_segmentos(p1, q1, p2, q2):
+    """Distancia mínima entre los segmentos p1q1 y p2q2, (...,) por par."""
+    d1, d2, r = q1 - p1, q2 - p2, p1 - p2
+    a = np.einsum('...i,...i->...', d1, d1)
+    e = np.einsum('...i,...i->...', d2, d2)
+    f = np.einsum('...i,...i->...', d2, r)
+    c = np.einsum('...i,...i->...', d1, r)
+    b = np.einsum('...i,...i->...', d1, d2)
+    eps = 1e-12
+    a_ok, e_ok = a > eps, e > eps
+    den = a * e - b * b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # s en el segmento 1 (si no son paralelos), t a partir de s
+        s = np.where(den > eps, np.clip((b * f - c * e) / den, 0.0, 1.0), 0.0)
+        t = np.where(e_ok, (b * s + f) / e, 0.0)
+        # t fuera de [0, 1]: se recorta y se recalcula s
+        s = np.where(t < 0.0, np.clip(-c / a, 0.0, 1.0), np.where(t > 1.0, np.clip((b - c) / a, 0.0, 1.0), s))
+        t = np.clip(t, 0.0, 1.0)
+        # Segmentos degenerados (puntos)
+        s = np.where(a_ok, s, 0.0)
+        t = np.where(a_ok, t, np.where(e_ok, np.clip(f / e, 0.0, 1.0), 0.0))
+        s = np.where(~a_ok | e_ok, s, np.clip(-c / a, 0.0, 1.0))
+    dif = (p1 + d1 * s[..., None]) - (p2 + d2 * t[..., None])
+    return np.sqrt(np.einsum('...i,...i->...', dif, dif))
+
+
+def _dist2_caja(a, d, h, t):
+    # Distancia al cuadrado de a + t·d (t (..., k)) a la caja [-h, h]
+    p = a[..., None, :] + t[..., None] * d[..., None, :]
+    fuera = np.maximum(np.abs(p) - h[..., None, :], 0.0)
+    return np.einsum('...i,...i->...', fuera, fuera)
+
+
+def distancia_segmento_caja(p, q, centro, R, semiejes):
+    """
+    Distancia mínima entre el segmento pq y la caja orientada
+    (centro, R con los ejes como columnas, semiejes), (...,) por par.
+    0 si se tocan o el segmento entra en la caja.
+    """
+    # Al marco de la caja: la caja queda alineada, [-h, h]
+    a = np.einsum('...ji,...j->...i', R, p - centro)
+    d = np.einsum('...ji,...j->...i', R, q - p)
+    h = np.asarray(semiejes, dtype=float)
+    h = np.broadcast_to(h, a.shape)
+
+    # Cruces con los 6 planos, más t = 0 y t = 1: extremos de los tramos
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cruces = np.concatenate([(-h - a) / d, (h - a) / d], axis=-1)
+    cruces = np.where(np.isfinite(cruces), np.clip(cruces, 0.0, 1.0), 0.0)
+    T = np.sort(np.concatenate([np.zeros(a.shape[:-1] + (1,)), cruces,
+                                np.ones(a.shape[:-1] + (1,))], axis=-1), axis=-1)   # (..., 8)
+
+    # Mínimo de la cuadrática de cada tramo: con las coordenadas que están
+    # fuera en el punto medio, t* = Σ (b - a)·d / Σ d²
+    lo, hi = T[..., :-1], T[..., 1:]
+    m = 0.5 * (lo + hi)
+    pm = a[..., None, :] + m[..., None] * d[..., None, :]
+    hh = h[..., None, :]
+    borde = np.where(pm > hh, hh, np.where(pm < -hh, -hh, np.nan))
+    fuera = ~np.isnan(borde)
+    dd = np.where(fuera, d[..., None, :], 0.0)
+    num = np.einsum('...i,...i->...', np.where(fuera, borde - a[..., None, :], 0.0), dd)
+    den = np.einsum('...i,...i->...', dd, dd)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        estacionario = np.where(den > 0, num / den, m)
+    estacionario = np.clip(estacionario, lo, hi)
+
+    candidatos = np.concatenate([T, estacionario], axis=-1)
+    return np.sqrt(_dist2_caja(a, d, h, candidatos).min(axis=-1))
+
+
+# ------------------ Obstáculos y BVH ------------------
+def cajas_desde_vertices(V):
+    """
+    Cajas orientadas a partir de vértices (..., 8, 3) en el orden de
+    cuerpos.CAJA (v1 - v0 = largo, v4 - v0 = ancho, v3 - v0 = alto).
+
+    Regresa (centros (M, 3), R (M, 3, 3), semiejes (M, 3)).
+    """
+    V = np.asarray(V, dtype=float).reshape(-1, 8, 3)
+    ejes = np.stack([V[:, 1] - V[:, 0], V[:, 4] - V[:, 0], V[:, 3] - V[:, 0]], axis=-1)
+    largos = np.linalg.norm(ejes, axis=-2)
+    return V.mean(axis=1), ejes / largos[:, None, :], largos / 2
+
+
+class BVH:
+    """
+    Jerarquía de AABB sobre M objetos, como arreglos.
+
+    lo, hi -> (M, 3) esquinas de la caja envolvente de cada objeto.
+    Se parte por la mediana del eje más largo hasta HOJA objetos por hoja.
+    """
+
+    def __init__(self, lo, hi, hoja=HOJA):
+        lo = np.asarray(lo, dtype=float).reshape(-1, 3)
+        hi = np.asarray(hi, dtype=float).reshape(-1, 3)
+        self.orden = np.arange(len(lo))
+        self.objetos_lo, self.objetos_hi = lo, hi
+        nodos_lo, nodos_hi, izq, der, inicio, cuenta = [], [], [], [], [], []
+
+        def construir(i, j):
+            k = len(izq)
+            idx = self.orden[i:j]
+            nodos_lo.append(lo[idx].min(axis=0))
+            nodos_hi.append(hi[idx].max(axis=0))
+            izq.append(-1), der.append(-1), inicio.append(i), cuenta.append(j - i)
+            if j - i > hoja:
+                centros = (lo[idx] + hi[idx]) / 2
+                eje = np.argmax(np.ptp(centros, axis=0))
+                self.orden[i:j] = idx[np.argsort(centros[:, eje], kind='stable')]
+                mitad = (i + j) // 2
+                izq[k] = construir(i, mitad)
+                der[k] = construir(mitad, j)
+            return k
+
+        if len(lo):
+            construir(0, len(lo))
+        self.lo = np.array(nodos_lo).reshape(-1, 3)
+        self.hi = np.array(nodos_hi).reshape(-1, 3)
+        self.izq, self.der = np.array(izq, dtype=np.intp), np.array(der, dtype=np.intp)
+        self.inicio, self.cuenta = np.array(inicio, dtype=np.intp), np.array(cuenta, dtype=np.intp)
+
+    def pares(self, qlo, qhi):
+        """
+        Pares candidatos (consulta, objeto) cuyas AABB se traslapan.
+
+        qlo, qhi -> (Q, 3) cajas de consulta.  Regresa dos arreglos de
+        índices de la misma longitud.
+        """
+        qlo, qhi = np.asarray(qlo).reshape(-1, 3), np.asarray(qhi).reshape(-1, 3)
+        vacio = np.empty(0, dtype=np.intp)
+        if len(self.lo) == 0 or len(qlo) == 0:
+            return vacio, vacio
+        cons = np.arange(len(qlo))
+        nodo = np.zeros(len(qlo), dtype=np.intp)
+        res_c, res_o = [], []
+        while cons.size:
+            toca = np.all((qlo[cons] <= self.hi[nodo]) & (qhi[cons] >= self.lo[nodo]), axis=-1)
+            cons, nodo = cons[toca], nodo[toca]
+            hoja = self.izq[nodo] < 0
+            # Hojas: cada objeto de la hoja contra la consulta
+            c, n = cons[hoja], nodo[hoja]
+            rep = self.cuenta[n]
+            c = np.repeat(c, rep)
+            o = self.orden[np.repeat(self.inicio[n] - np.cumsum(rep) + rep, rep) + np.arange(rep.sum())]
+            toca = np.all((qlo[c] <= self.objetos_hi[o]) & (qhi[c] >= self.objetos_lo[o]), axis=-1)
+            res_c.append(c[toca])
+            res_o.append(o[toca])
+            # Nodos internos: bajan a sus dos hijos
+            c, n = cons[~hoja], nodo[~hoja]
+            cons = np.concatenate([c, c])
+            nodo = np.concatenate([self.izq[n], self.der[n]])
+        return np.concatenate(res_c), np.concatenate(res_o)
+
+
+class Obstaculos:
+    """Cajas orientadas estáticas indexadas en un BVH."""
+
+    def __init__(self, centros, R, semiejes):
+        self.centros = np.asarray(centros, dtype=float).reshape(-1, 3)
+        self.R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+        self.semiejes = np.asarray(semiejes, dtype=float).reshape(-1, 3)
+        # AABB de cada caja orientada: |R|·h
+        extension = np.einsum('mij,mj->mi', np.abs(self.R), self.semiejes)
+        self.bvh = BVH(self.centros - extension, self.centros + extension)
+
+    @classmethod
+    def desde_vertices(cls, V):
+        return cls(*cajas_desde_vertices(V))
+
+    def __len__(self):
+        return len(self.centros)
+
+
+# ------------------ Modelo de colisión del robot ------------------
+class ModeloColision:
+    """
+    Cápsulas de un robot sobre los puntos de una CadenaSerial.
+
+    cadena    -> CadenaSerial; sus puntos(q) (..., K, 3) son los extremos
+    capsulas  -> {nombre: (i, j, radio)} con índices en los K puntos; los
+                 índices K, K+1, ... son los de 'fijos'
+    fijos     -> (F, 3) puntos fijos en el mundo (p. ej. el piso de la base)
+    excluir   -> pares (nombre, nombre) que no se revisan entre sí, además
+                 de los que comparten un extremo (eslabones contiguos)
+    """
+
+    def __init__(self, cadena, capsulas, fijos=None, excluir=()):
+        self.cadena = cadena
+        self.nombres = list(capsulas)
+        ij = np.array([capsulas[n][:2] for n in self.nombres], dtype=np.intp)
+        self.i, self.j = ij[:, 0], ij[:, 1]
+        self.radios = np.array([capsulas[n][2] for n in self.nombres], dtype=float)
+        self.fijos = np.zeros((0, 3)) if fijos is None else np.asarray(fijos, dtype=float).reshape(-1, 3)
+        excluir = {frozenset(p) for p in excluir}
+        pares = []
+        for a in range(len(self.nombres)):
+            for b in range(a + 1, len(self.nombres)):
+                contiguos = {self.i[a], self.j[a]} & {self.i[b], self.j[b]}
+                if not contiguos and frozenset((self.nombres[a], self.nombres[b])) not in excluir:
+                    pares.append((a, b))
+        self.pares = np.array(pares, dtype=np.intp).reshape(-1, 2)
+
+    def segmentos(self, q):
+        """Extremos de las cápsulas: (p, q) cada uno (..., S, 3)."""
+        P = self.cadena.puntos(q)
+        if len(self.fijos):
+            P = np.concatenate([P, np.broadcast_to(self.fijos, P.shape[:-2] + self.fijos.shape)], axis=-2)
+        return P[..., self.i, :], P[..., self.j, :]
+
+    def verificar(self, q, obstaculos=None, margen=0.0):
+        """
+        Colisiones de (..., J) poses.
+
+        Regresa (choque, propio, contra_obstaculo), booleanos (...,):
+        propio = dos cápsulas no contiguas a menos de la suma de radios +
+        margen; contra_obstaculo = una cápsula a menos de radio + margen
+        de una caja.
+        """
+        a, b = self.segmentos(q)
+        forma = a.shape[:-2]
+
+        propio = np.zeros(forma, dtype=bool)
+        if len(self.pares):
+            u, v = self.pares[:, 0], self.pares[:, 1]
+            dist = distancia_segmentos(a[..., u, :], b[..., u, :], a[..., v, :], b[..., v, :])
+            propio = np.any(dist < self.radios[u] + self.radios[v] + margen, axis=-1)
+
+        contra = np.zeros(forma, dtype=bool)
+        if obstaculos is not None and len(obstaculos):
+            S = len(self.nombres)
+            a2, b2 = a.reshape(-1, 3), b.reshape(-1, 3)
+            r = np.broadcast_to(self.radios + margen, forma + (S,)).reshape(-1)
+            lo = np.minimum(a2, b2) - r[:, None]
+            hi = np.maximum(a2, b2) + r[:, None]
+            ic, io = obstaculos.bvh.pares(lo, hi)
+            if ic.size:
+                d = distancia_segmento_caja(a2[ic], b2[ic], obstaculos.centros[io],
+                                            obstaculos.R[io], obstaculos.semiejes[io])
+                golpe = ic[d < r[ic]] // S
+                contra.reshape(-1)[golpe] = True
+
+        return propio | contra, propio, contra
+
+
+# ------------------ Modelos de los robots del curso ------------------
+def modelo_scara(A1=715.0, A2=850.0, BASE_HEIGHT=776.0, BRAZO_OFFSET_Z=-40.0, LP=322.0,
+                 radios=None):
+    """
+    SCARA del examen sobre cadena.scara(): columna (piso -> eje), brazo 1,
+    brazo 2 (a la altura de la base), bajada hasta el pistón y pistón.
+    El pistón atraviesa el extremo del brazo 2, así que ese par se excluye.
+    Radios en mm.
+    """
+    r = dict(columna=80.0, brazo1=60.0, brazo2=50.0, bajada=10.0, piston=20.0)
+    r.update(radios or {})
+    # puntos(): 0 eje, 1 codo, 2 fin del brazo 2, 3 tras la prismática, 4 tras θ3, 5 punta; 6 piso
+    capsulas = {'columna': (6, 0, r['columna']), 'brazo1': (0, 1, r['brazo1']),
+                'brazo2': (1, 2, r['brazo2']), 'bajada': (2, 3, r['bajada']),
+                'piston': (3, 5, r['piston'])}
+    return ModeloColision(_cadena.scara(A1, A2, BASE_HEIGHT, BRAZO_OFFSET_Z, LP), capsulas,
+                          fijos=[[0.0, 0.0, 0.0]], excluir=[('brazo2', 'piston')])
+
@@ -0,0 +1,146 @@
+"""
+Parámetros de los scripts desde archivos o la línea de comandos.
+
+El examen pedía sus nueve parámetros con ask_float() uno tras otro y la
+Tarea 5 llamaba a input() al importarse: no había forma de correr una
+lista de variantes sin teclear.  Aquí cada script declara un ESQUEMA
+(nombre -> valor por defecto; None = obligatorio) y desde_argv() arma la
+lista de CONJUNTOS de parámetros a partir de sus argumentos:
+
+    script.py                              -> None (el script pregunta como siempre)
+    script.py A1=700 frames=60             -> un conjunto; lo demás por defecto
+    script.py variantes.json [A2=800 ...]  -> un conjunto por variante del archivo;
+                                              CLAVE=valor se aplica a todas
+
+Archivos aceptados (pueden ser varios, se concatenan en orden):
+
+    .json  -> un objeto, una lista de objetos o
+              {"comun": {...}, "variantes": [{...}, ...]}
+    .jsonl -> un objeto por línea
+    .csv   -> encabezado con los nombres, una variante por fila
+
+Cada conjunto es un dict con todos los parámetros del esquema (tipos ya
+convertidos) más 'nombre', que viene del archivo o es el número de la
+variante ('000', '001', ...).  ruta_variante() usa ese nombre para que
+las salidas (ROBOTICA_EXPORTAR, ROBOTICA_TRAYECTORIA) no se pisen; el
+conjunto único de la línea de comandos no lleva nombre (None) y escribe
+en las rutas tal cual.
+
+Las claves desconocidas, los valores que no son números y los
+obligatorios que faltan son ValueError con el nombre de la variante.
+"""
+
+import csv
+import json
+import os
+
+# Parámetros de animar_movimiento_unico (EXAMEN 3ER PARCIAL.py)
+SCARA = {
+    'A1': 715.0, 'A2': 850.0, 'BAR_MIN': 418.5, 'BAR_MAX': 880.0,
+    'R_PLATILLO': 100.0, 'BRAZO_OFFSET_Z': -40.0,
+    'frames': 240, 'theta2_final': 90.0, 'theta3_total': 360.0,
+}
+
+# Robot 2R de la Tarea 5 (sin valores por defecto: el script los pedía todos)
+DH_2R = {'theta1': None, 'theta2': None, 'a1': None, 'a2': None}
+
+EXTENSIONES = ('.json', '.jsonl', '.csv')
+
+
+def _etiqueta(nombre):
+    return 'parámetros' if nombre is None else f"variante {nombre}"
+
+
+def _convertir(esquema, clave, valor, nombre):
+    if clave not in esquema:
+        raise ValueError(f"{_etiqueta(nombre)}: parámetro desconocido {clave!r} "
+                         f"(válidos: {', '.join(esquema)})")
+    defecto = esquema[clave]
+    try:
+        # Coma decimal ('1,5') igual para campos enteros y reales
+        numero = float(valor.replace(',', '.')) if isinstance(valor, str) else float(valor)
+        if isinstance(defecto, int) and not isinstance(defecto, bool):
+            if numero != int(numero):
+                raise ValueError
+            return int(numero)
+        return numero
+    except (TypeError, ValueError):
+        raise ValueError(f"{_etiqueta(nombre)}: {clave}={valor!r} no es un número válido") from None
+
+
+def completar(parcial, esquema, nombre):
+    """Conjunto completo a partir de un dict parcial (valores por defecto del esquema)."""
+    parcial = dict(parcial)
+    nombre = parcial.pop('nombre', None) or nombre
+    nombre = None if nombre is None else str(nombre)
+    conjunto = {}
+    for clave, valor in parcial.items():
+        if valor is None or valor == '':
+            continue
+        conjunto[clave] = _convertir(esquema, clave, valor, nombre)
+    faltan = [c for c, d in esquema.items() if d is None and c not in conjunto]
+    if faltan:
+        raise ValueError(f"{_etiqueta(nombre)}: faltan {', '.join(faltan)}")
+    return {**{c: d for c, d in esquema.items() if d is not None}, **conjunto, 'nombre': nombre}
+
+
+def _leer(ruta):
+    # Lista de dicts parciales de un archivo
+    extension = os.path.splitext(ruta)[1].lower()
+    with open(ruta, newline='', encoding='utf-8') as f:
+        if extension == '.csv':
+            return [dict(fila) for fila in csv.DictReader(f)]
+        if extension == '.jsonl':
+            return [json.loads(linea) for linea in f if linea.strip()]
+        datos = json.load(f)
+    if isinstance(datos, dict) and 'variantes' in datos:
+        comun = datos.get('comun', {})
+        return [{**comun, **v} for v in datos['variantes']]
+    return datos if isinstance(datos, list) else [datos]
+
+
+def cargar(rutas, esquema, fijos=None):
+    """
+    Conjuntos de parámetros de uno o varios archivos.
+
+    fijos -> dict que se aplica encima de cada variante (CLAVE=valor).
+    """
+    parciales = []
+    for ruta in ([rutas] if isinstance(rutas, str) else rutas):
+        parciales.extend(_leer(ruta))
+    return [completar({**p, **(fijos or {})}, esquema, f"{i:03d}") for i, p in enumerate(parciales)]
+
+
+def desde_argv(argv, esquema):
+    """
+    Conjuntos de parámetros a partir de los argumentos del script, o None
+    si no hay argumentos (el script sigue con sus preguntas de siempre).
+    """
+    if not argv:
+        return None
+    rutas, fijos = [], {}
+    for arg in argv:
+        if '=' in arg:
+            clave, valor = arg.split('=', 1)
+            fijos[clave.strip()] = valor.strip()
+        elif arg.lower().endswith(EXTENSIONES):
+            rutas.append(arg)
+        else:
+            raise ValueError(f"argumento no reconocido {arg!r}: se espera CLAVE=valor o un "
+                             f"archivo {'/'.join(EXTENSIONES)}")
+    if rutas:
+        return cargar(rutas, esquema, fijos)
+    return [completar(fijos, esquema, None)]
+
+
+def ruta_variante(base, nombre):
+    """
+    Ruta de salida propia de una variante: 'salida.gif' -> 'salida_<nombre>.gif',
+    'carpeta/' -> 'carpeta/<nombre>/'.  Sin base o sin nombre regresa base.
+    """
+    if not base or nombre is None:
+        return base
+    if base.endswith(('/', os.sep)) or not os.path.splitext(base)[1]:
+        return os.path.join(base, str(nombre)) + os.sep
+    raiz, extension = os.path.splitext(base)
+    return f"{raiz}_{nombre}{extension}"
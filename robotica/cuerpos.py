@@ -0,0 +1,92 @@
+"""
+Cuerpos rígidos como arreglos de vértices.
+
+Los scripts de la Tarea 2 guardan la caja como 8 vectores sueltos
+(p1_init ... p8_init) y en cada fotograma hacen 8 productos R.dot(p) u
+8 sumas p + [dx,0,0].  Aquí la caja es UN arreglo (8, 3) con un vértice
+por fila, y se transforma con un solo producto matricial:
+
+    V' = V · Rᵀ + t
+
+Como todo se escribe con broadcasting, las mismas funciones sirven para:
+
+    una caja, un fotograma        V (8, 3)       R (3, 3)        t (3,)
+    toda la animación de golpe    V (8, 3)       R (F, 3, 3)     t (F, 3)
+    muchas cajas a la vez         V (B, 8, 3)    R (F, B, 3, 3)  t (F, B, 3)
+
+fotogramas() precalcula la animación completa como un tensor
+(F, [B,] 8, 3); el bucle de dibujo sólo lo recorre.
+
+También se acepta la forma homogénea: vértices (..., 8, 4) con la
+coordenada w = 1 y una transformación 4x4 en lugar de (R, t).
+"""
+
+import numpy as np
+
+
+# Caja de la Tarea 2 (7 x 2 x 3), vértices en el orden p1..p8 de drawBox
+CAJA = np.array([
+    [0, 0, 0],
+    [7, 0, 0],
+    [7, 0, 3],
+    [0, 0, 3],
+    [0, 2, 0],
+    [7, 2, 0],
+    [7, 2, 3],
+    [0, 2, 3],
+], dtype=float)
+
+
+def transformar_vertices(V, R=None, t=None, out=None):
+    """
+    Aplica V' = V · Rᵀ + t a todos los vértices con un solo matmul.
+
+    V -> (..., n, 3) vértices como filas, o (..., n, 4) homogéneos
+    R -> (..., 3, 3) rotación, o (..., 4, 4) transformación homogénea
+    t -> (..., 3) traslación (se ignora si R es 4x4)
+    out -> buffer opcional con la forma del resultado
+
+    Las dimensiones '...' se difunden entre sí (broadcast).
+    """
+    V = np.asarray(V, dtype=float)
+    if R is None:
+        if out is None:
+            out = V.copy()
+        else:
+            out[...] = V
+    else:
+        R = np.asarray(R, dtype=float)
+        if R.shape[-1] == 4 and V.shape[-1] == 3:
+            # Transformación homogénea sobre vértices cartesianos
+            t = R[..., :3, 3]
+            R = R[..., :3, :3]
+        out = np.matmul(V, np.swapaxes(R, -1, -2), out=out)
+    if t is not None:
+        out += np.asarray(t, dtype=float)[..., None, :]
+    return out
+
+
+def fotogramas(V, R=None, t=None):
+    """
+    Precalcula una animación completa: tensor (F, [B,] n, 3).
+
+    V -> (n, 3) un cuerpo, o (B, n, 3) varios cuerpos
+    R -> (F, 3, 3) misma rotación para todos, o (F, B, 3, 3) una por cuerpo
+    t -> (F, 3) misma traslación para todos, o (F, B, 3) una por cuerpo
+    """
+    V = np.asarray(V, dtype=float)
+    extra = V.ndim - 2               # 1 si hay varios cuerpos
+    if R is not None:
+        R = np.asarray(R, dtype=float)
+        if R.ndim - 2 == 1 and extra:
+            R = R[:, None]           # (F, 1, 3, 3): difunde sobre los cuerpos
+    if t is not None:
+        t = np.asarray(t, dtype=float)
+        if t.ndim == 2 and extra:
+            t = t[:, None]           # (F, 1, 3)
+    if R is None and t is None:
+        return V[None].copy()
+    if R is None:
+        # Sólo traslación: suma con broadcasting, sin matmul
+        return V + t[..., None, :]
+    return transformar_vertices(V, R, t)
@@ -0,0 +1,94 @@
+"""
+Bloque DH por lotes.
+
+La función DH() del examen y dh_matrix() de la Tarea 5 construyen UNA
+matriz 4x4 por llamada a partir de escalares de Python:
+
+       T_i = Rz(theta_i) · Tz(d_i) · Tx(a_i) · Rx(alpha_i)
+
+Aquí se construyen TODAS las matrices de una trayectoria de una vez:
+los parámetros se reciben como arreglos (N, articulaciones) y se devuelve
+un arreglo apilado (N, articulaciones, 4, 4).  El producto acumulado
+T_0_1, T_0_2, ... se calcula con un matmul por articulación sobre las N
+poses a la vez (el número de articulaciones es pequeño, N es grande).
+
+Los ángulos van en GRADOS, igual que en los scripts.
+"""
+
+import numpy as np
+
+from .trig import sincosd
+
+
+def dh_lote(theta_deg, d, a, alpha_deg=0.0):
+    """
+    Matrices DH apiladas.
+
+    theta_deg, d, a, alpha_deg -> escalares o arreglos que se puedan
+    difundir (broadcast) a una forma común (..., articulaciones).
+    Regresa un arreglo (..., articulaciones, 4, 4).
+    """
+    th, d, a, al = np.broadcast_arrays(
+        np.asarray(theta_deg, dtype=float),
+        np.asarray(d, dtype=float),
+        np.asarray(a, dtype=float),
+        np.asarray(alpha_deg, dtype=float))
+
+    s, c = sincosd(np.atleast_1d(th))
+    sa, ca = sincosd(np.atleast_1d(al))
+    s, c = s.reshape(th.shape), c.reshape(th.shape)
+    sa, ca = sa.reshape(al.shape), ca.reshape(al.shape)
+
+    T = np.zeros(th.shape + (4, 4))
+    T[..., 0, 0] = c
+    T[..., 0, 1] = -s*ca
+    T[..., 0, 2] = s*sa
+    T[..., 0, 3] = a*c
+    T[..., 1, 0] = s
+    T[..., 1, 1] = c*ca
+    T[..., 1, 2] = -c*sa
+    T[..., 1, 3] = a*s
+    T[..., 2, 1] = sa
+    T[..., 2, 2] = ca
+    T[..., 2, 3] = d
+    T[..., 3, 3] = 1.0
+    return T
+
+
+def producto_acumulado(T):
+    """
+    Producto acumulado de una cadena de eslabones.
+
+    T -> (..., articulaciones, 4, 4) con T_0_1, T_1_2, T_2_3, ...
+    Regresa (..., articulaciones, 4, 4) con T_0_1, T_0_2, T_0_3, ...
+    (M2, M3, ... de los apuntes).
+    """
+    T = np.asarray(T, dtype=float)
+    acum = np.empty_like(T)
+    acum[..., 0, :, :] = T[..., 0, :, :]
+    for j in range(1, T.shape[-3]):
+        np.matmul(acum[..., j-1, :, :], T[..., j, :, :], out=acum[..., j, :, :])
+    return acum
+
+
+def cadena_dh(theta_deg, d, a, alpha_deg=0.0):
+    """
+    Evalúa una cadena DH completa para N poses en una sola pasada.
+
+    Regresa (T, T_acum), ambos (..., articulaciones, 4, 4):
+        T      -> transformaciones de cada eslabón
+        T_acum -> transformaciones acumuladas desde la base
+    """
+    T = dh_lote(theta_deg, d, a, alpha_deg)
+    return T, producto_acumulado(T)
+
+
+def transformar_puntos(T, p):
+    """
+    Aplica transformaciones homogéneas apiladas a puntos 3D.
+
+    T -> (..., 4, 4);  p -> (3,) o (..., 3)
+    Regresa (..., 3) sin construir el vector homogéneo [x, y, z, 1].
+    """
+    p = np.asarray(p, dtype=float)
+    return np.einsum('...ij,...j->...i', T[..., :3, :3], p) + T[..., :3, 3]
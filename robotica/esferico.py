@@ -0,0 +1,123 @@
+"""
+Brazo esférico de la Tarea 4 (Animación de robot esférico.py), por lotes.
+
+Cinemática directa del script:
+    T1 = Rz(θ1) · Ry(θ2) · Tx(L1)
+    T2 = T1 · Ry(-θ3) · Tx(L2)
+
+Desarrollando, en el plano vertical que contiene al brazo (coordenada
+radial ρ y altura z), con la elevación del hombro β = -θ2:
+    ρ = L1·cos β + L2·cos(β + θ3)
+    z = L1·sin β + L2·sin(β + θ3)
+es decir, un 2R plano con articulaciones (β, θ3).  La cinemática inversa
+queda entonces:
+    θ1 = atan2(y, x)             hombro al frente   (ρ = +r_xy)
+    θ1 = atan2(y, x) + 180°      hombro hacia atrás (ρ = -r_xy)
+    cos θ3 = (ρ² + z² - L1² - L2²) / (2·L1·L2),  θ3 = ±acos(...)
+    β = atan2(z, ρ) - atan2(L2·sin θ3, L1 + L2·cos θ3),  θ2 = -β
+
+ik_esferico() resuelve (N, 3) objetivos de una vez y regresa las cuatro
+ramas (hombro frente/atrás × codo arriba/abajo) con su máscara de
+validez.  "Codo arriba" es, de cada par, la rama cuyo codo queda más
+alto.  Los ángulos van en GRADOS.
+"""
+
+import numpy as np
+
+from .poses import tabla
+from .trig import sincosd
+
+L1 = 15.0
+L2 = 13.0
+
+RAMAS = ('frente-arriba', 'frente-abajo', 'atras-arriba', 'atras-abajo')
+
+
+def _envolver(angulo):
+    # Lleva ángulos en grados al intervalo [-180, 180)
+    return np.mod(angulo + 180.0, 360.0) - 180.0
+
+
+def fk_esferico(theta1, theta2, theta3, L1=L1, L2=L2):
+    """
+    Cinemática directa del script (T1, T2 de arriba), vectorizada.
+
+    Regresa (p0, p1, p2), cada uno (N, 3).
+    """
+    theta1, theta2, theta3 = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (theta1, theta2, theta3)))
+    s1, c1 = sincosd(theta1)
+    s2, c2 = sincosd(theta2)
+    s23, c23 = sincosd(theta2 - theta3)
+
+    p0 = np.zeros(theta1.shape + (3,))
+    p1 = np.empty_like(p0)
+    p1[..., 0] = L1*c1*c2
+    p1[..., 1] = L1*s1*c2
+    p1[..., 2] = -L1*s2
+    p2 = p1.copy()
+    p2[..., 0] += L2*c1*c23
+    p2[..., 1] += L2*s1*c23
+    p2[..., 2] -= L2*s23
+    return p0, p1, p2
+
+
+def tabla_poses(theta1, theta2, theta3, L1=L1, L2=L2):
+    """
+    Trayectoria como tabla de poses (ver robotica.poses).
+
+    Campos por fila: theta1, theta2, theta3 y los puntos p0, p1, p2 (3,).
+    """
+    theta1, theta2, theta3 = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (theta1, theta2, theta3)))
+    p0, p1, p2 = fk_esferico(theta1, theta2, theta3, L1, L2)
+    return tabla(theta1=theta1, theta2=theta2, theta3=theta3, p0=p0, p1=p1, p2=p2)
+
+
+def ik_esferico(objetivos, L1=L1, L2=L2, tol=1e-9):
+    """
+    Cinemática inversa para (N, 3) objetivos.
+
+    Regresa (soluciones, validas):
+        soluciones -> (N, 4, 3) con (θ1, θ2, θ3) por rama, en el orden RAMAS
+        validas    -> (N, 4) booleano; False si el objetivo queda fuera del
+                      alcance (ahí la rama es la postura más cercana)
+    """
+    p = np.atleast_2d(np.asarray(objetivos, dtype=float))
+    x, y, z = p[..., 0], p[..., 1], p[..., 2]
+
+    r_xy = np.hypot(x, y)
+    c3 = (r_xy*r_xy + z*z - L1*L1 - L2*L2) / (2.0*L1*L2)
+    alcanzable = np.abs(c3) <= 1.0 + tol
+    np.clip(c3, -1.0, 1.0, out=c3)
+    q3 = np.arccos(c3)
+    s3 = np.sqrt(1.0 - c3*c3)
+
+    theta1 = np.rad2deg(np.arctan2(y, x))
+    atras = np.where(theta1 > 0.0, theta1 - 180.0, theta1 + 180.0)
+    delta = np.arctan2(L2*s3, L1 + L2*c3)
+
+    sol = np.empty(x.shape + (4, 3))
+    for i, (rho, t1) in enumerate(((r_xy, theta1), (-r_xy, atras))):
+        phi = np.arctan2(z, rho)
+        # Codo con θ3 = +q3 y con θ3 = -q3
+        beta_pos = phi - delta
+        beta_neg = phi + delta
+        # "Arriba" = la rama cuyo codo (altura L1·sin β) queda más alto
+        pos_arriba = np.sin(beta_pos) >= np.sin(beta_neg)
+        beta_arr = np.where(pos_arriba, beta_pos, beta_neg)
+        beta_abj = np.where(pos_arriba, beta_neg, beta_pos)
+        q3_arr = np.where(pos_arriba, q3, -q3)
+
+        sol[..., 2*i, 0] = t1
+        sol[..., 2*i, 1] = _envolver(-np.rad2deg(beta_arr))
+        sol[..., 2*i, 2] = np.rad2deg(q3_arr)
+        sol[..., 2*i + 1, 0] = t1
+        sol[..., 2*i + 1, 1] = _envolver(-np.rad2deg(beta_abj))
+        sol[..., 2*i + 1, 2] = -np.rad2deg(q3_arr)
+
+    validas = np.repeat(alcanzable[..., None], 4, axis=-1)
+    return sol, validas
+
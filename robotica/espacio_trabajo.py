@@ -0,0 +1,230 @@
+"""
+Mapa de alcance (espacio de trabajo) de los robots, con caché en disco.
+
+Se barre el espacio articular de cada robot con su cinemática directa
+vectorizada, los puntos de la herramienta se voxelizan en una rejilla de
+ocupación 3D y la rejilla se guarda como .npy en un directorio de caché,
+con nombre derivado de los parámetros de los eslabones.  Las consultas
+posteriores cargan la rejilla con np.load(mmap_mode='r') y responden
+"¿este punto es alcanzable?" con un índice, sin resolver la IK.
+
+Robots disponibles (parámetros por defecto entre corchetes):
+    'planar'   -> L1 [15], L2 [10]                 (Tarea 4, punta p2)
+    'esferico' -> L1 [15], L2 [13]                 (Tarea 4, punta p2)
+    'scara'    -> A1 [715], A2 [850], BAR_MIN [418.5], BAR_MAX [880],
+                  BRAZO_OFFSET_Z [-40]             (examen, punta del pistón)
+
+Uso:
+    mapa = mapa_alcance('scara', {'A1': 700.0})
+    mapa.alcanzable([[900.0, 300.0, 1300.0]])
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from . import esferico, planar, scara
+
+DIRECTORIO_CACHE = os.environ.get(
+    'ROBOTICA_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'robotica', 'espacio_trabajo'))
+
+BLOQUE = 2_000_000  # poses evaluadas por bloque al barrer el espacio articular
+PASO_VOXEL = 0.7    # avance máximo de la punta entre muestras, en vóxeles
+VERSION_CACHE = 2   # 2: la carrera de la prismática incluye su extremo
+
+
+# ------------------ Cinemática directa de la punta de cada robot ------------------
+def _punta_planar(q, L1, L2):
+    return planar.fk_planar(q[..., 0], q[..., 1], L1, L2)[1]
+
+
+def _punta_esferico(q, L1, L2):
+    return esferico.fk_esferico(q[..., 0], q[..., 1], q[..., 2], L1, L2)[2]
+
+
+def _punta_scara(q, A1, A2, BAR_MIN, BAR_MAX, BRAZO_OFFSET_Z):
+    return scara.puntos_analiticos(q[..., 0], q[..., 1], q[..., 2],
+                                   A1, A2, scara.BASE_HEIGHT, BRAZO_OFFSET_Z)[2]
+
+
+# nombre -> (punta(q, **parametros), parámetros por defecto,
+#            rangos articulares(parametros), brazo de palanca de cada
+#            articulación(parametros) (0 = prismática), voxel por defecto)
+_ROBOTS = {
+    'planar': (_punta_planar, {'L1': planar.L1, 'L2': planar.L2},
+               lambda p: [(-180.0, 180.0), (-180.0, 180.0)],
+               lambda p: [p['L1'] + p['L2'], p['L2']], 0.25),
+    'esferico': (_punta_esferico, {'L1': esferico.L1, 'L2': esferico.L2},
+                 lambda p: [(-180.0, 180.0), (-180.0, 180.0), (-180.0, 180.0)],
+                 lambda p: [p['L1'] + p['L2'], p['L1'] + p['L2'], p['L2']], 1.0),
+    'scara': (_punta_scara, {'A1': 715.0, 'A2': 850.0, 'BAR_MIN': 418.5,
+                             'BAR_MAX': 880.0, 'BRAZO_OFFSET_Z': -40.0},
+              lambda p: [(-180.0, 180.0), (-180.0, 180.0),
+                         (min(p['BAR_MIN'], p['BAR_MAX']), max(p['BAR_MIN'], p['BAR_MAX']))],
+              lambda p: [p['A1'] + p['A2'], p['A2'], 0.0], 20.0),
+}
+
+
+class MapaAlcance:
+    """
+    Rejilla de ocupación del espacio de trabajo.
+
+    ocupacion -> arreglo booleano (nx, ny, nz) (puede ser un memmap)
+    origen    -> esquina mínima de la rejilla (3,)
+    tam_voxel -> lado del vóxel
+    """
+
+    def __init__(self, ocupacion, origen, tam_voxel):
+        self.ocupacion = ocupacion
+        self.origen = np.asarray(origen, dtype=float)
+        self.tam_voxel = float(tam_voxel)
+
+    def indices(self, puntos):
+        # Índices de vóxel de cada punto y máscara de "dentro de la rejilla"
+        p = np.asarray(puntos, dtype=float)
+        idx = np.floor((p - self.origen) / self.tam_voxel).astype(np.intp)
+        dentro = np.all((idx >= 0) & (idx < self.ocupacion.shape), axis=-1)
+        return idx, dentro
+
+    def alcanzable(self, puntos):
+        """Booleano (...,) por punto: True si su vóxel está ocupado."""
+        idx, dentro = self.indices(puntos)
+        res = np.zeros(dentro.shape, dtype=bool)
+        i = idx[dentro]
+        res[dentro] = self.ocupacion[i[:, 0], i[:, 1], i[:, 2]]
+        return res
+
+    def fraccion_ocupada(self):
+        return float(np.count_nonzero(self.ocupacion)) / self.ocupacion.size
+
+
+def voxelizar(puntos, origen, forma, tam_voxel, ocupacion=None):
+    """
+    Marca en 'ocupacion' (se crea si no se da) los vóxeles que contienen
+    algún punto de (M, 3) 'puntos'.
+    """
+    if ocupacion is None:
+        ocupacion = np.zeros(forma, dtype=bool)
+    idx = np.floor((np.asarray(puntos) - origen) / tam_voxel).astype(np.intp)
+    idx = np.clip(idx, 0, np.asarray(forma) - 1)
+    ocupacion[idx[:, 0], idx[:, 1], idx[:, 2]] = True
+    return ocupacion
+
+
+def _rejilla_articular(rangos, pasos, brazos):
+    # Valores de cada articulación, sin repetir el extremo en rangos de 360°
+    # (sólo rotacionales: la carrera de una prismática puede medir más de 360)
+    ejes = []
+    for (lo, hi), n, brazo in zip(rangos, pasos, brazos):
+        ejes.append(np.linspace(lo, hi, n, endpoint=brazo == 0 or (hi - lo) < 360.0))
+    return ejes
+
+
+def _pasos(rangos, brazos, tam_voxel, paso_voxel):
+    # Resolución articular para que la punta avance ~paso_voxel vóxeles por paso
+    pasos = []
+    for (lo, hi), brazo in zip(rangos, brazos):
+        if brazo > 0:
+            # articulación rotacional: arco = brazo · Δθ
+            n = np.deg2rad(hi - lo) * brazo / (paso_voxel * tam_voxel)
+        else:
+            n = (hi - lo) / (paso_voxel * tam_voxel)
+        pasos.append(max(2, int(np.ceil(n)) + 1))
+    return pasos
+
+
+def barrer(robot, parametros=None, tam_voxel=None, rangos=None, pasos=None):
+    """
+    Barre el espacio articular y regresa un MapaAlcance en memoria.
+
+    La rejilla articular completa se evalúa por bloques de BLOQUE poses
+    para no reservar toda la nube de puntos a la vez.
+    """
+    punta, defecto, rangos_defecto, brazos_fn, voxel_defecto = _ROBOTS[robot]
+    p = dict(defecto)
+    p.update(parametros or {})
+    tam_voxel = float(tam_voxel or voxel_defecto)
+    rangos = rangos or rangos_defecto(p)
+    brazos = brazos_fn(p)
+    alcance = brazos[0]
+    pasos = pasos or _pasos(rangos, brazos, tam_voxel, PASO_VOXEL)
+
+    ejes = _rejilla_articular(rangos, pasos, brazos)
+
+    # Caja envolvente de la punta
+    z_min, z_max = -alcance, alcance
+    if robot == 'planar':
+        z_min, z_max = -tam_voxel, tam_voxel
+    elif robot == 'scara':
+        z_min = p['BRAZO_OFFSET_Z'] + rangos[2][0] + scara.LP - tam_voxel
+        z_max = p['BRAZO_OFFSET_Z'] + rangos[2][1] + scara.LP + tam_voxel
+    origen = np.array([-alcance - tam_voxel, -alcance - tam_voxel, z_min])
+    extremo = np.array([alcance + tam_voxel, alcance + tam_voxel, z_max])
+    forma = tuple(int(n) for n in np.ceil((extremo - origen) / tam_voxel))
+    ocupacion = np.zeros(forma, dtype=bool)
+
+    # Se recorre la primera articulación por bloques; el resto, vectorizado
+    resto = np.stack(np.meshgrid(*ejes[1:], indexing='ij'), axis=-1).reshape(-1, len(ejes) - 1)
+    por_bloque = max(1, BLOQUE // len(resto))
+    for k in range(0, len(ejes[0]), por_bloque):
+        q0 = ejes[0][k:k + por_bloque]
+        q = np.empty((len(q0), len(resto), len(ejes)))
+        q[..., 0] = q0[:, None]
+        q[..., 1:] = resto[None, :, :]
+        puntos = punta(q.reshape(-1, len(ejes)), **p)
+        voxelizar(puntos, origen, forma, tam_voxel, ocupacion)
+
+    return MapaAlcance(ocupacion, origen, tam_voxel)
+
+
+def clave_cache(robot, parametros=None, tam_voxel=None, rangos=None, pasos=None):
+    """Nombre de archivo (sin extensión) derivado de los parámetros."""
+    _, defecto, rangos_defecto, _, voxel_defecto = _ROBOTS[robot]
+    p = dict(defecto)
+    p.update(parametros or {})
+    # 'version' cambia cuando cambia el barrido, para no reutilizar rejillas viejas
+    desc = {'robot': robot, 'version': VERSION_CACHE,
+            'parametros': {k: float(v) for k, v in sorted(p.items())},
+            'tam_voxel': float(tam_voxel or voxel_defecto),
+            'rangos': [[float(a), float(b)] for a, b in (rangos or rangos_defecto(p))],
+            'pasos': list(pasos) if pasos else None}
+    h = hashlib.sha1(json.dumps(desc, sort_keys=True).encode()).hexdigest()[:16]
+    return f"{robot}_{h}", desc
+
+
+def mapa_alcance(robot, parametros=None, tam_voxel=None, rangos=None,
+                 pasos=None, directorio=None, recalcular=False):
+    """
+    Mapa de alcance con caché en disco.
+
+    Si ya existe una rejilla para estos parámetros en 'directorio'
+    (DIRECTORIO_CACHE por defecto) se abre memory-mapped; si no, se barre
+    el espacio articular y se guarda.
+    """
+    directorio = directorio or DIRECTORIO_CACHE
+    nombre, desc = clave_cache(robot, parametros, tam_voxel, rangos, pasos)
+    ruta_npy = os.path.join(directorio, nombre + '.npy')
+    ruta_json = os.path.join(directorio, nombre + '.json')
+
+    if not recalcular and os.path.exists(ruta_npy) and os.path.exists(ruta_json):
+        with open(ruta_json) as f:
+            meta = json.load(f)
+        ocupacion = np.load(ruta_npy, mmap_mode='r')
+        return MapaAlcance(ocupacion, meta['origen'], meta['tam_voxel'])
+
+    mapa = barrer(robot, parametros, tam_voxel, rangos, pasos)
+
+    os.makedirs(directorio, exist_ok=True)
+    tmp = ruta_npy + '.tmp.npy'
+    np.save(tmp, mapa.ocupacion)
+    os.replace(tmp, ruta_npy)
+    meta = dict(desc, origen=mapa.origen.tolist(), tam_voxel=mapa.tam_voxel,
+                forma=list(mapa.ocupacion.shape))
+    with open(ruta_json + '.tmp', 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(ruta_json + '.tmp', ruta_json)
+
+    return MapaAlcance(np.load(ruta_npy, mmap_mode='r'), mapa.origen, mapa.tam_voxel)
@@ -0,0 +1,68 @@
+"""
+Estela (rastro) del efector final en un buffer circular de NumPy.
+
+Las animaciones guardaban el rastro en listas de Python que crecían sin
+límite: la Tarea 5 agregaba a path_x/path_y/path_z y le pasaba las
+listas completas a trace.set_data en cada fotograma, y el esférico
+rehacía np.array(trajectory) en cada paso (O(n²) en toda la corrida).
+
+Estela tiene capacidad fija: agregar() es O(1) y vista() regresa los
+últimos puntos, del más viejo al más nuevo, como una VISTA (dim, n) del
+buffer, sin copiar.  Para que esa ventana sea siempre contigua cada
+punto se escribe dos veces, en i y en i + largo, dentro de un buffer de
+2·largo columnas:
+
+    estela = Estela(largo_estela(200))
+    estela.agregar(p2)
+    x, y, z = estela.vista()
+    trace.set_data_3d(x, y, z)
+
+El largo del rastro se puede cambiar sin tocar los scripts con la
+variable de entorno ROBOTICA_ESTELA (número de puntos).
+"""
+
+import os
+
+import numpy as np
+
+LARGO = int(os.environ.get('ROBOTICA_ESTELA') or 0) or None
+
+
+def largo_estela(defecto):
+    """Largo del rastro: ROBOTICA_ESTELA si está definida, si no 'defecto'."""
+    return LARGO or defecto
+
+
+class Estela:
+    """
+    Buffer circular de puntos (dim,) con capacidad fija.
+
+    largo -> número máximo de puntos del rastro (los más viejos se descartan)
+    dim   -> coordenadas por punto (3 para x, y, z)
+    """
+
+    def __init__(self, largo, dim=3):
+        if largo < 1:
+            raise ValueError(f"el largo de la estela debe ser >= 1, no {largo}")
+        self.largo = int(largo)
+        self._buf = np.zeros((dim, 2 * self.largo))
+        self._i = 0   # siguiente columna a escribir, en [0, largo)
+        self._n = 0   # puntos guardados, hasta largo
+
+    def agregar(self, p):
+        """Agrega un punto (dim,) al final del rastro."""
+        self._buf[:, self._i] = p
+        self._buf[:, self._i + self.largo] = p
+        self._i = (self._i + 1) % self.largo
+        self._n = min(self._n + 1, self.largo)
+
+    def vista(self):
+        """Puntos del rastro (dim, n), del más viejo al más nuevo; sin copia."""
+        fin = self._i + self.largo
+        return self._buf[:, fin - self._n:fin]
+
+    def vaciar(self):
+        self._i = self._n = 0
+
+    def __len__(self):
+        return self._n
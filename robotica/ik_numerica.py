@@ -0,0 +1,162 @@
+"""
+Cinemática inversa numérica (mínimos cuadrados amortiguados) sobre
+cualquier CadenaSerial.
+
+Sólo había IK en forma cerrada (planar y esférico de la Tarea 4); el
+SCARA del examen y cualquier cadena DH general no tenían ninguna.  Aquí
+se resuelve iterando
+
+    e  = objetivo - fk(q)                      (posición, y giro si se pide)
+    Δq = Jᵀ · (J·Jᵀ + λ²·I)⁻¹ · e              (DLS / Levenberg–Marquardt)
+    q  = q + Δq
+
+con el jacobiano de CadenaSerial.fk_jacobiano (un solo FK por iteración).
+El amortiguamiento λ evita pasos enormes cerca de singularidades y el
+paso de las rotacionales se limita a PASO_MAX grados.
+
+    ik_dls    -> N objetivos a la vez, todos desde la misma semilla (o
+                 una por objetivo); sigue iterando sólo los que no han
+                 convergido
+    ik_camino -> muestras de un camino: anclas en orden, cada una
+                 arrancando de la solución de la anterior (warm start,
+                 con extrapolación lineal), y las muestras intermedias en
+                 lote desde la interpolación de sus anclas; cerca de la
+                 solución bastan 1–3 iteraciones
+
+Ambas regresan (q, iteraciones, residuo, convergio) por objetivo.  Los
+ángulos van en GRADOS; el residuo, en unidades de longitud (y radianes
+para las filas de orientación).
+"""
+
+import numpy as np
+
+AMORTIGUAMIENTO = 1e-2  # λ
+TOLERANCIA = 1e-6       # norma del error para dar por resuelto un objetivo
+MAX_ITER = 100
+PASO_MAX = 20.0         # grados por iteración como máximo en una rotacional
+CADA = 16               # ik_camino: una muestra de cada CADA se resuelve en secuencia
+
+FILAS_POSICION = (0, 1, 2)
+
+
+def _error(T, objetivo, filas):
+    # Error (..., 6): posición y, si el objetivo es una pose (4, 4), orientación
+    e = np.zeros(T.shape[:-2] + (6,))
+    if objetivo.shape[-2:] == (4, 4):
+        e[..., :3] = objetivo[..., :3, 3] - T[..., :3, 3]
+        # ½ Σ r_i × r_i*  (ejes actuales contra ejes deseados)
+        e[..., 3:] = 0.5 * np.cross(T[..., :3, :3], objetivo[..., :3, :3], axis=-2).sum(axis=-1)
+    else:
+        e[..., :3] = objetivo - T[..., :3, 3]
+    return e[..., list(filas)]
+
+
+def _paso(cadena, J, e, amortiguamiento):
+    # Δq = Jᵀ (J Jᵀ + λ² I)⁻¹ e, en las unidades de q (grados / longitud)
+    JJt = J @ np.swapaxes(J, -1, -2)
+    JJt[..., np.arange(JJt.shape[-1]), np.arange(JJt.shape[-1])] += amortiguamiento**2
+    dq = (np.swapaxes(J, -1, -2) @ np.linalg.solve(JJt, e[..., None]))[..., 0]
+    r = cadena._r
+    dq[..., r] = np.rad2deg(dq[..., r])
+    # Limita el paso rotacional conservando la dirección
+    mayor = np.abs(dq[..., r]).max(axis=-1, initial=0.0)
+    escala = np.minimum(1.0, PASO_MAX / np.maximum(mayor, 1e-300))
+    return dq * escala[..., None]
+
+
+def _limitar(q, limites):
+    if limites is not None:
+        lim = np.asarray(limites, dtype=float)
+        np.clip(q, lim[:, 0], lim[:, 1], out=q)
+    return q
+
+
+def ik_dls(cadena, objetivos, q0, filas=None, limites=None,
+           amortiguamiento=AMORTIGUAMIENTO, tol=TOLERANCIA, max_iter=MAX_ITER):
+    """
+    IK de N objetivos a la vez.
+
+    objetivos -> (N, 3) posiciones de la herramienta o (N, 4, 4) poses
+    q0        -> semilla (J,) para todos o (N, J) una por objetivo
+    filas     -> componentes del error que se anulan, de (x, y, z, wx,
+                 wy, wz); por defecto posición para (N, 3) y las 6 para
+                 poses.  El SCARA con pose usa (0, 1, 2, 5).
+    limites   -> (J, 2) rango de cada articulación (se recorta cada paso)
+
+    Regresa (q (N, J), iteraciones (N,), residuo (N,), convergio (N,)).
+    """
+    objetivos = np.asarray(objetivos, dtype=float)
+    pose = objetivos.shape[-2:] == (4, 4)
+    objetivos = objetivos.reshape((-1, 4, 4) if pose else (-1, 3))
+    n = len(objetivos)
+    filas = filas if filas is not None else (range(6) if pose else FILAS_POSICION)
+
+    q = _limitar(np.array(np.broadcast_to(q0, (n, cadena.n)), dtype=float), limites)
+    iteraciones = np.zeros(n, dtype=int)
+    residuo = np.full(n, np.inf)
+    activos = np.arange(n)
+
+    for k in range(max_iter + 1):
+        T, J = cadena.fk_jacobiano(q[activos])
+        e = _error(T, objetivos[activos], filas)
+        residuo[activos] = np.linalg.norm(e, axis=-1)
+        listos = residuo[activos] <= tol
+        activos, J, e = activos[~listos], J[~listos], e[~listos]
+        if activos.size == 0 or k == max_iter:
+            break
+        q[activos] += _paso(cadena, J[..., list(filas), :], e, amortiguamiento)
+        q[activos] = _limitar(q[activos], limites)
+        iteraciones[activos] += 1
+
+    return q, iteraciones, residuo, residuo <= tol
+
+
+def _secuencial(cadena, objetivos, q0, filas, limites, extrapolar, amortiguamiento, tol, max_iter):
+    # Una muestra tras otra, cada una desde la solución de la anterior
+    n = objetivos.shape[0]
+    q = np.empty((n, cadena.n))
+    iteraciones = np.empty(n, dtype=int)
+    residuo = np.empty(n)
+    semilla = np.asarray(q0, dtype=float)
+    for k in range(n):
+        if extrapolar and k >= 2:
+            semilla = 2 * q[k - 1] - q[k - 2]
+        elif k >= 1:
+            semilla = q[k - 1]
+        qk, it, res, _ = ik_dls(cadena, objetivos[k:k + 1], semilla, filas, limites,
+                                amortiguamiento, tol, max_iter)
+        q[k], iteraciones[k], residuo[k] = qk[0], it[0], res[0]
+    return q, iteraciones, residuo
+
+
+def ik_camino(cadena, objetivos, q0, filas=None, limites=None, extrapolar=True, cada=CADA,
+              amortiguamiento=AMORTIGUAMIENTO, tol=TOLERANCIA, max_iter=MAX_ITER):
+    """
+    IK de las muestras de un camino (N, 3) o (N, 4, 4), en orden.
+
+    Las muestras 0, cada, 2·cada, ..., N-1 (anclas) se resuelven una tras
+    otra: cada ancla arranca de la solución de la anterior (con
+    extrapolar, de q_(k-1) + (q_(k-1) - q_(k-2))), así la solución sigue
+    la misma rama a lo largo del camino.  Las muestras intermedias
+    arrancan de la interpolación lineal entre sus dos anclas y se
+    resuelven todas juntas en un solo ik_dls.  cada=1 resuelve todo en
+    secuencia.  q0 es la semilla de la primera muestra.
+
+    Regresa (q (N, J), iteraciones (N,), residuo (N,), convergio (N,)).
+    """
+    objetivos = np.asarray(objetivos, dtype=float)
+    n = objetivos.shape[0]
+    anclas = np.unique(np.r_[np.arange(0, n, max(int(cada), 1)), n - 1])
+    qa, ita, resa = _secuencial(cadena, objetivos[anclas], q0, filas, limites, extrapolar,
+                                amortiguamiento, tol, max_iter)
+    q = np.empty((n, cadena.n))
+    iteraciones = np.empty(n, dtype=int)
+    residuo = np.empty(n)
+    q[anclas], iteraciones[anclas], residuo[anclas] = qa, ita, resa
+
+    resto = np.setdiff1d(np.arange(n), anclas)
+    if resto.size:
+        semillas = np.column_stack([np.interp(resto, anclas, qa[:, j]) for j in range(cadena.n)])
+        q[resto], iteraciones[resto], residuo[resto], _ = ik_dls(
+            cadena, objetivos[resto], semillas, filas, limites, amortiguamiento, tol, max_iter)
+    return q, iteraciones, residuo, residuo <= tol
@@ -0,0 +1,215 @@
+"""
+Tiempos por fotograma de los bucles de animación.
+
+Un fotograma de las tareas mezcla cinemática, actualización de artistas,
+el dibujo del lienzo y la espera de plt.pause / del intervalo de
+FuncAnimation, sin forma de ver cuánto se lleva cada parte.  Con la
+variable de entorno ROBOTICA_PERFILADO se registran TRAMOS con nombre:
+
+    cinematica -> cálculo de poses (donde el script lo marque)
+    artistas   -> de escena.nuevo_fotograma() a escena.fin_fotograma()
+    dibujo     -> Figure.draw (lo llame plt.pause, FuncAnimation o savefig)
+    espera     -> plt.pause después de dibujar (eventos de la ventana + sueño)
+    exportar   -> grab_frame del escritor en modo ROBOTICA_EXPORTAR
+                  (incluye el dibujo que hace savefig)
+
+Cada tramo queda asociado al fotograma en curso (el que abrió el último
+nuevo_fotograma(); -1 antes del primero).  Al salir del script se
+imprime un resumen por tramo y, si el valor termina en .json, se guarda
+además una traza en formato Chrome (chrome://tracing, Perfetto):
+
+    ROBOTICA_PERFILADO=1            -> sólo la tabla
+    ROBOTICA_PERFILADO=traza.json   -> tabla + traza
+
+Escena y mostrar_animacion ya llaman a los ganchos; un script que no
+usa Escena marca sus fotogramas a mano:
+
+    from robotica.perfilado import perfilador, tramo
+    def update(i):
+        perfilador.nuevo_fotograma()
+        with tramo('cinematica'):
+            ...
+
+Sin la variable, tramo() regresa un contexto vacío y nada se registra.
+Los procesos de renderizar_paralelo no reportan sus tramos.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+PERFILADO = os.environ.get('ROBOTICA_PERFILADO') or None
+
+
+class _Nulo:
+    # Contexto vacío: tramo() cuando el perfilado está apagado
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULO = _Nulo()
+
+
+class _Tramo:
+    __slots__ = ('perfilador', 'nombre', 'inicio')
+
+    def __init__(self, perfilador, nombre):
+        self.perfilador, self.nombre = perfilador, nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.perfilador.registrar(self.nombre, self.inicio, time.perf_counter_ns())
+        return False
+
+
+class Perfilador:
+    """
+    Registro de tramos (nombre, fotograma, inicio, fin) en nanosegundos.
+
+    objetivo -> duración deseada de un fotograma en s (el interval de
+                FuncAnimation o la pausa del script); el resumen cuenta
+                los fotogramas que lo exceden.
+    """
+
+    def __init__(self, activo=True, objetivo=None):
+        self.activo = activo
+        self.objetivo = objetivo
+        self.eventos = []
+        self.fotograma = -1
+        self._origen = time.perf_counter_ns()
+        self._inicio_fotograma = None
+        self._abiertos = {}
+
+    def tramo(self, nombre):
+        """Contexto que mide un tramo del fotograma en curso."""
+        return _Tramo(self, nombre) if self.activo else _NULO
+
+    def registrar(self, nombre, inicio, fin):
+        self.eventos.append((nombre, self.fotograma, inicio, fin))
+
+    def abrir(self, nombre):
+        # Para tramos que empiezan y terminan en métodos distintos
+        if self.activo:
+            self._abiertos[nombre] = time.perf_counter_ns()
+
+    def cerrar(self, nombre):
+        inicio = self._abiertos.pop(nombre, None)
+        if inicio is not None:
+            self.registrar(nombre, inicio, time.perf_counter_ns())
+
+    def nuevo_fotograma(self):
+        """Cierra el fotograma en curso (tramo 'fotograma') y abre el siguiente."""
+        if not self.activo:
+            return
+        ahora = time.perf_counter_ns()
+        if self._inicio_fotograma is not None:
+            self.registrar('fotograma', self._inicio_fotograma, ahora)
+        self.fotograma += 1
+        self._inicio_fotograma = ahora
+
+    def terminar(self):
+        # Cierra el último fotograma (al salir del script)
+        if self._inicio_fotograma is not None:
+            self.registrar('fotograma', self._inicio_fotograma, time.perf_counter_ns())
+            self._inicio_fotograma = None
+
+    # ------------------ Salidas ------------------
+    def resumen(self):
+        """
+        {tramo: dict(llamadas, total, media, p50, p95, maximo)} en s, y
+        para 'fotograma' además fps y lentos (fotogramas sobre objetivo).
+        """
+        por_tramo = {}
+        for nombre, _, inicio, fin in self.eventos:
+            por_tramo.setdefault(nombre, []).append(fin - inicio)
+        tabla = {}
+        for nombre, duraciones in por_tramo.items():
+            d = np.array(duraciones) * 1e-9
+            tabla[nombre] = dict(llamadas=len(d), total=d.sum(), media=d.mean(),
+                                 p50=np.percentile(d, 50), p95=np.percentile(d, 95), maximo=d.max())
+        if 'fotograma' in tabla:
+            f = tabla['fotograma']
+            f['fps'] = 1.0 / f['media']
+            if self.objetivo:
+                d = [fin - inicio for n, _, inicio, fin in self.eventos if n == 'fotograma']
+                f['lentos'] = int(np.sum(np.array(d) * 1e-9 > self.objetivo * 1.05))
+        return tabla
+
+    def imprimir(self, archivo=None):
+        archivo = archivo or sys.stdout
+        tabla = self.resumen()
+        if not tabla:
+            return
+        cuadro = tabla.get('fotograma', {}).get('total')
+        print(f"\n{'tramo':<12}{'llamadas':>9}{'total ms':>11}{'media ms':>10}{'p50 ms':>9}"
+              f"{'p95 ms':>9}{'máx ms':>9}{'% fotog.':>10}", file=archivo)
+        for nombre in sorted(tabla, key=lambda n: (n == 'fotograma', -tabla[n]['total'])):
+            t = tabla[nombre]
+            parte = f"{100 * t['total'] / cuadro:>9.1f}%" if cuadro and nombre != 'fotograma' else ''
+            print(f"{nombre:<12}{t['llamadas']:>9}{t['total']*1e3:>11.1f}{t['media']*1e3:>10.2f}"
+                  f"{t['p50']*1e3:>9.2f}{t['p95']*1e3:>9.2f}{t['maximo']*1e3:>9.2f}{parte}", file=archivo)
+        if 'fotograma' in tabla:
+            f = tabla['fotograma']
+            linea = f"{f['llamadas']} fotogramas, {f['fps']:.1f} fps"
+            if 'lentos' in f:
+                linea += (f"; objetivo {self.objetivo*1e3:.0f} ms: {f['lentos']} "
+                          f"fotogramas más lentos")
+            print(linea, file=archivo)
+
+    def traza_chrome(self, ruta):
+        """Guarda los tramos como eventos completos ('X') del formato Chrome Trace."""
+        pid = os.getpid()
+        eventos = [dict(name=nombre, cat='fotograma' if nombre == 'fotograma' else 'tramo', ph='X',
+                        ts=(inicio - self._origen) / 1e3, dur=(fin - inicio) / 1e3,
+                        pid=pid, tid=0, args=dict(fotograma=k))
+                   for nombre, k, inicio, fin in self.eventos]
+        with open(ruta, 'w') as f:
+            json.dump(dict(traceEvents=eventos, displayTimeUnit='ms'), f)
+
+
+perfilador = Perfilador(activo=bool(PERFILADO))
+
+
+def tramo(nombre):
+    """perfilador.tramo(nombre) del perfilador global."""
+    return perfilador.tramo(nombre)
+
+
+def envolver(objeto, metodo, nombre):
+    """Registra cada llamada a objeto.metodo como el tramo nombre (una sola vez)."""
+    original = getattr(objeto, metodo)
+    if not perfilador.activo or getattr(original, '_tramo', None) == nombre:
+        return
+
+    def medido(*args, **kwargs):
+        with perfilador.tramo(nombre):
+            return original(*args, **kwargs)
+    medido._tramo = nombre
+    setattr(objeto, metodo, medido)
+
+
+def medir_dibujo(fig):
+    """Cada Figure.draw (plt.pause, FuncAnimation, savefig) cuenta como 'dibujo'."""
+    envolver(fig, 'draw', 'dibujo')
+
+
+def _al_salir():
+    perfilador.terminar()
+    perfilador.imprimir()
+    if PERFILADO.lower().endswith('.json'):
+        perfilador.traza_chrome(PERFILADO)
+        print(f"traza: {PERFILADO}")
+
+
+if PERFILADO:
+    atexit.register(_al_salir)
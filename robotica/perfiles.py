@@ -0,0 +1,163 @@
+"""
+Perfiles de movimiento articular parametrizados en el tiempo.
+
+Los scripts mueven las articulaciones con rampas lineales
+(np.linspace(0, theta1, 60), theta1 * step / steps,
+np.linspace(BAR_MAX, BAR_MIN, frames)): velocidad constante desde el
+primer fotograma y frenado instantáneo al final, sin una noción de
+tiempo real.  Aquí cada perfil es una función normalizada s(τ), τ = t/T
+en [0, 1], aplicada a J articulaciones a la vez:
+
+    q(t)   = q0 + (qf - q0) · s(τ)
+    q'(t)  = (qf - q0) · s'(τ) / T
+    q''(t) = (qf - q0) · s''(τ) / T²
+
+    lineal      -> s = τ (lo que hacen hoy los scripts)
+    cubico      -> velocidad cero en los extremos
+    quintico    -> velocidad y aceleración cero en los extremos
+    trapezoidal -> aceleración constante, crucero, frenado (LSPB)
+
+Todo es vectorizado sobre las N muestras de tiempo: q, q', q'' salen
+como (N, J), una columna por articulación, listas para pasarse a las
+funciones por lotes (scara.tabla_poses, planar.fk_planar, ...):
+
+    q, qd, qdd = perfil([0, BAR_MAX, 0], [90, BAR_MIN, 360], t, T)
+    th2, l, th3 = q.T
+
+trapezoidal() parte de límites reales de velocidad y aceleración por
+articulación, sincroniza todas con la más lenta y da la duración del
+movimiento (tiempo de ciclo) con duracion_trapezoidal().
+"""
+
+import os
+
+import numpy as np
+
+TIPOS = ('lineal', 'cubico', 'quintico', 'trapezoidal')
+
+# Perfil de las rampas de los scripts (ver rampa); 'lineal' = comportamiento original
+PERFIL = os.environ.get('ROBOTICA_PERFIL') or 'lineal'
+
+# Fracción del tiempo que dura cada tramo de aceleración en perfil(tipo='trapezoidal')
+BLEND = 1 / 3
+
+
+def _s_lineal(tau):
+    return tau, np.ones_like(tau), np.zeros_like(tau)
+
+
+def _s_cubico(tau):
+    return (3 * tau**2 - 2 * tau**3,
+            6 * tau - 6 * tau**2,
+            6 - 12 * tau)
+
+
+def _s_quintico(tau):
+    return (10 * tau**3 - 15 * tau**4 + 6 * tau**5,
+            30 * tau**2 - 60 * tau**3 + 30 * tau**4,
+            60 * tau - 180 * tau**2 + 120 * tau**3)
+
+
+def _s_trapezoidal(tau, tb=BLEND):
+    # Trapecio normalizado: acelera en [0, tb], crucero, frena en [1-tb, 1]
+    tb = np.asarray(tb, dtype=float)
+    v = 1 / (1 - tb)
+    a = v / tb
+    sube = tau < tb
+    baja = tau > 1 - tb
+    r = 1 - tau
+    s = np.where(sube, a * tau**2 / 2,
+                 np.where(baja, 1 - a * r**2 / 2, a * tb**2 / 2 + v * (tau - tb)))
+    ds = np.where(sube, a * tau, np.where(baja, a * r, v))
+    dds = np.where(sube, a, np.where(baja, -a, 0.0))
+    return s, ds, dds
+
+
+_PERFILES = {'lineal': _s_lineal, 'cubico': _s_cubico,
+             'quintico': _s_quintico, 'trapezoidal': _s_trapezoidal}
+
+
+def _escalar(q0, qf, t, T, s, ds, dds):
+    D = qf - q0
+    return q0 + D * s, D * ds / T, D * dds / T**2
+
+
+def _preparar(q0, qf, t, T):
+    q0 = np.atleast_1d(np.asarray(q0, dtype=float))
+    qf = np.atleast_1d(np.asarray(qf, dtype=float))
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    tau = np.clip(t / T, 0.0, 1.0)[:, None]   # (N, 1), se satura fuera de [0, T]
+    return q0, qf, tau
+
+
+def perfil(q0, qf, t, T, tipo='quintico'):
+    """
+    q, q', q'' (N, J) de un movimiento de q0 a qf (J,) en T segundos.
+
+    t    -> instantes (N,); antes de 0 o después de T el perfil se satura
+    tipo -> 'lineal', 'cubico', 'quintico' o 'trapezoidal' (tramos de
+            aceleración de BLEND·T)
+    """
+    if tipo not in _PERFILES:
+        raise ValueError(f"perfil desconocido {tipo!r}; opciones: {', '.join(TIPOS)}")
+    q0, qf, tau = _preparar(q0, qf, t, T)
+    return _escalar(q0, qf, t, T, *_PERFILES[tipo](tau))
+
+
+def _minimo_trapezoidal(D, vmax, amax):
+    # Duración mínima por articulación: triángulo si no alcanza vmax
+    triangulo = D <= vmax**2 / amax
+    return np.where(triangulo, 2 * np.sqrt(D / amax), D / vmax + vmax / amax)
+
+
+def duracion_trapezoidal(q0, qf, vmax, amax):
+    """
+    Tiempo de ciclo del movimiento de q0 a qf con límites de velocidad y
+    aceleración por articulación (escalares o (J,)): la duración de la
+    articulación más lenta, con la que se sincronizan las demás.
+    """
+    D = np.abs(np.atleast_1d(np.asarray(qf, dtype=float) - q0))
+    vmax, amax = np.broadcast_to(vmax, D.shape), np.broadcast_to(amax, D.shape)
+    return float(np.max(_minimo_trapezoidal(D, vmax, amax), initial=0.0))
+
+
+def trapezoidal(q0, qf, t, vmax, amax):
+    """
+    Perfil trapezoidal sincronizado: q, q', q'' (N, J) y la duración T.
+
+    Cada articulación usa su aceleración amax y la velocidad de crucero
+    justa para terminar en T = duracion_trapezoidal(...), así todas
+    llegan juntas sin pasar sus límites.
+    """
+    T = duracion_trapezoidal(q0, qf, vmax, amax)
+    q0, qf, tau = _preparar(q0, qf, t, T or 1.0)
+    if T == 0:
+        cero = np.zeros(tau.shape[:1] + q0.shape)
+        return q0 + cero, cero, cero.copy(), T
+    D = np.abs(qf - q0)
+    amax = np.broadcast_to(np.asarray(amax, dtype=float), D.shape)
+    # Crucero V que cumple D = V·(T - V/a); tramo de aceleración ta = V/a
+    disc = np.maximum(amax**2 * T**2 - 4 * amax * D, 0.0)
+    V = (amax * T - np.sqrt(disc)) / 2
+    tb = np.where(D > 0, V / (amax * T), 0.5)
+    q, qd, qdd = _escalar(q0, qf, t, T, *_s_trapezoidal(tau, tb))
+    return q, qd, qdd, T
+
+
+def muestras(T, fps):
+    """Instantes (N,) para muestrear un movimiento de T segundos a fps cuadros/s."""
+    return np.linspace(0.0, T, max(int(np.ceil(T * fps)), 1) + 1)
+
+
+def rampa(q0, qf, n, tipo=None):
+    """
+    Posiciones (n, J) de q0 a qf en n fotogramas, para las animaciones.
+
+    Con tipo 'lineal' es exactamente np.linspace(q0, qf, n); el tipo por
+    defecto sale de ROBOTICA_PERFIL, así los scripts cambian de perfil
+    sin tocarlos.
+    """
+    tipo = tipo or PERFIL
+    if tipo == 'lineal':
+        return np.linspace(np.atleast_1d(q0), np.atleast_1d(qf), n)
+    return perfil(q0, qf, np.linspace(0.0, 1.0, n), 1.0, tipo)[0]
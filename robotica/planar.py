@@ -0,0 +1,95 @@
+"""
+Robot planar 2R de la Tarea 4 (Animación de robot planar.py), por lotes.
+
+Cinemática directa:
+    p1 = L1·(c1, s1, 0)
+    p2 = p1 + L2·(c12, s12, 0)
+
+Cinemática inversa (ley de cosenos), para arreglos de objetivos:
+    cos θ2 = (r² - L1² - L2²) / (2·L1·L2)
+    θ2 = ±acos(cos θ2)                   (+ codo arriba, - codo abajo)
+    θ1 = atan2(y, x) ∓ atan2(L2·|s2|, L1 + L2·c2)
+
+Se calcula UNA vez el acos y el atan2 común a las dos ramas; los
+objetivos fuera del anillo |L1 - L2| <= r <= L1 + L2 se marcan en la
+máscara de alcance en lugar de producir NaN (el coseno se recorta a
+[-1, 1], así que para ellos se regresa la postura más cercana).
+
+Los ángulos van en GRADOS, como en el script.
+"""
+
+import numpy as np
+
+from .poses import tabla
+from .trig import sincosd
+
+L1 = 15.0
+L2 = 10.0
+
+
+def fk_planar(theta1, theta2, L1=L1, L2=L2):
+    """
+    Cinemática directa vectorizada.
+
+    Regresa (p1, p2), cada uno (N, 3) con z = 0.
+    """
+    theta1 = np.atleast_1d(np.asarray(theta1, dtype=float))
+    theta2 = np.atleast_1d(np.asarray(theta2, dtype=float))
+    s1, c1 = sincosd(theta1)
+    s12, c12 = sincosd(theta1 + theta2)
+
+    p1 = np.zeros(np.broadcast(theta1, theta2).shape + (3,))
+    p1[..., 0] = L1*c1
+    p1[..., 1] = L1*s1
+    p2 = p1.copy()
+    p2[..., 0] += L2*c12
+    p2[..., 1] += L2*s12
+    return p1, p2
+
+
+def tabla_poses(theta1, theta2, L1=L1, L2=L2):
+    """
+    Trayectoria como tabla de poses (ver robotica.poses).
+
+    Campos por fila: theta1, theta2 y los puntos p0 (base), p1, p2 (3,).
+    """
+    theta1, theta2 = np.broadcast_arrays(np.atleast_1d(np.asarray(theta1, dtype=float)),
+                                         np.atleast_1d(np.asarray(theta2, dtype=float)))
+    p1, p2 = fk_planar(theta1, theta2, L1, L2)
+    return tabla(theta1=theta1, theta2=theta2, p0=np.zeros_like(p1), p1=p1, p2=p2)
+
+
+def ik_planar(x, y, L1=L1, L2=L2, tol=1e-9):
+    """
+    Cinemática inversa del 2R para arreglos de objetivos.
+
+    x, y -> escalares o arreglos de N objetivos.
+    Regresa (sol_arriba, sol_abajo, alcanzable):
+        sol_arriba -> (N, 2) con (θ1, θ2) de la rama codo arriba (θ2 >= 0)
+        sol_abajo  -> (N, 2) con (θ1, θ2) de la rama codo abajo  (θ2 <= 0)
+        alcanzable -> (N,) booleano, False si el objetivo está fuera del
+                      espacio de trabajo (ahí las soluciones son la
+                      postura más cercana, no una solución exacta)
+    """
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    y = np.atleast_1d(np.asarray(y, dtype=float))
+
+    r2 = x*x + y*y
+    c2 = (r2 - L1*L1 - L2*L2) / (2.0*L1*L2)
+    alcanzable = np.abs(c2) <= 1.0 + tol
+    np.clip(c2, -1.0, 1.0, out=c2)
+
+    q2 = np.arccos(c2)                             # rama codo arriba, [0, π]
+    s2 = np.sqrt(1.0 - c2*c2)
+    gamma = np.arctan2(y, x)
+    beta = np.arctan2(L2*s2, L1 + L2*c2)
+
+    sol_arriba = np.empty(x.shape + (2,))
+    sol_abajo = np.empty_like(sol_arriba)
+    sol_arriba[..., 0] = gamma - beta
+    sol_arriba[..., 1] = q2
+    sol_abajo[..., 0] = gamma + beta
+    sol_abajo[..., 1] = -q2
+    np.rad2deg(sol_arriba, out=sol_arriba)
+    np.rad2deg(sol_abajo, out=sol_abajo)
+    return sol_arriba, sol_abajo, alcanzable
@@ -0,0 +1,40 @@
+"""
+Tablas de poses precalculadas.
+
+Las animaciones calculaban la cinemática DENTRO del dibujo (fkine() en
+update(i) del examen, forward_kinematics() en los bucles de la Tarea 4),
+así que el costo de la cinemática quedaba mezclado con el de matplotlib
+y se repetía cada vez que se volvía a reproducir o exportar.
+
+Aquí la trayectoria completa se calcula ANTES, en una sola pasada
+vectorizada, y se guarda en un arreglo estructurado de NumPy con una
+fila por fotograma:
+
+    poses = scara.tabla_poses(th1, th2, l, th3, A1, A2)   # (F,)
+    poses['p2']          -> (F, 3)   codo de todos los fotogramas
+    poses[i]['circulo']  -> (3, 60)  platillo del fotograma i
+
+El bucle de dibujo sólo indexa poses[i].  Cada robot (scara, planar,
+esferico) tiene su tabla_poses() que llama a tabla() con sus campos.
+"""
+
+import numpy as np
+
+
+def tabla(**campos):
+    """
+    Arreglo estructurado (N,) a partir de columnas con nombre.
+
+    Cada campo es un arreglo (N, ...): la primera dimensión es el
+    fotograma y el resto es la forma del campo en una fila.  El orden de
+    los campos es el de los argumentos.
+    """
+    columnas = {k: np.asarray(v, dtype=float) for k, v in campos.items()}
+    n = {v.shape[0] for v in columnas.values()}
+    if len(n) != 1:
+        raise ValueError(f"los campos tienen distinto número de filas: {sorted(n)}")
+
+    poses = np.empty(n.pop(), dtype=[(k, float, v.shape[1:]) for k, v in columnas.items()])
+    for nombre, v in columnas.items():
+        poses[nombre] = v
+    return poses
@@ -0,0 +1,445 @@
+"""
+Capa de dibujo con artistas persistentes.
+
+Los bucles de animación de las tareas hacían en cada fotograma:
+
+    ax.cla()                 -> destruye todos los artistas
+    setaxis(...)             -> vuelve a fijar límites y cámara
+    fix_system(...)          -> vuelve a crear los ejes de referencia
+    ax.plot3D / ax.scatter   -> vuelve a crear cada línea y punto
+
+Escena conserva los artistas entre fotogramas: los límites y los ejes
+fijos se dibujan UNA vez, y cada llamada a escena.plot()/escena.scatter()
+reutiliza (en orden) el artista creado en el fotograma anterior,
+cambiando sólo sus datos.  Así el código de dibujo de los scripts casi
+no cambia y el costo por fotograma queda en la actualización de datos.
+
+    escena = Escena(ax)
+    setaxis(...); fix_system(...)      # una sola vez
+    for paso in ...:
+        escena.nuevo_fotograma()
+        escena.plot(xs, ys, zs, color='red')
+        escena.scatter(x, y, z, s=40)
+        escena.mostrar(0.05)           # en lugar de plt.draw(); plt.pause()
+
+Para las cajas de la Tarea 2, escena.caja() dibuja las 12 aristas como
+UNA Line3DCollection y los 8 vértices como UN scatter (2 artistas en
+lugar de 20).  Acepta también varias cajas a la vez, (K, 8, 3), y las
+sigue dibujando con esos mismos 2 artistas.
+
+Modo exportación (sin pantalla)
+-------------------------------
+Si la variable de entorno ROBOTICA_EXPORTAR tiene una ruta, al importar
+este módulo se cambia al backend Agg y ninguna animación espera en
+plt.pause: cada fotograma se dibuja tan rápido como se pueda y se manda
+a un escritor:
+
+    ROBOTICA_EXPORTAR=salida.gif       -> GIF (Pillow)
+    ROBOTICA_EXPORTAR=salida.mp4       -> video (ffmpeg, si está instalado)
+    ROBOTICA_EXPORTAR=fotogramas/      -> secuencia PNG en esa carpeta
+
+Los cuadros por segundo salen de la pausa del script (1/pausa) o del
+interval de FuncAnimation; ROBOTICA_FPS los fija a mano.  Las
+animaciones con FuncAnimation deben terminar con
+mostrar_animacion(ani, fig, interval) en lugar de plt.show().  También
+se puede lanzar un script así:
+
+    python -m robotica.render "Tarea 2 .../script.py" salida.gif
+
+Un script también puede entrar a este modo por su cuenta con
+activar_exportacion(ruta) (así lo hacen el examen y la Tarea 5 cuando
+corren variantes en lote).
+
+Con ROBOTICA_PROCESOS=N (N > 1) la exportación se reparte entre N
+procesos (ProcessPoolExecutor con 'fork'): cada proceso hereda una copia
+de la figura ya preparada, dibuja un tramo contiguo de fotogramas a PNG
+y al final se juntan en orden en el archivo de salida.  Requiere que el
+script pueda dibujar el fotograma i sin depender de los anteriores
+(fotogramas precalculados, ver robotica.cuerpos).
+
+Con ROBOTICA_PERFILADO, Escena y mostrar_animacion registran el tiempo
+de cada fotograma repartido en artistas / dibujo / espera / exportar
+(ver robotica.perfilado).
+"""
+
+import atexit
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import animation
+from matplotlib.markers import MarkerStyle
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from .perfilado import envolver, medir_dibujo, perfilador
+
+
+EXPORTAR = None
+FPS = os.environ.get('ROBOTICA_FPS')
+PROCESOS = int(os.environ.get('ROBOTICA_PROCESOS') or 1)
+
+
+def activar_exportacion(ruta):
+    """
+    Modo exportación desde el propio script, igual que ROBOTICA_EXPORTAR=ruta.
+
+    Para los modos en lote, donde una ventana por variante bloquearía en
+    plt.show().  Debe llamarse antes de crear las figuras; regresa ruta.
+    """
+    global EXPORTAR
+    EXPORTAR = ruta
+    plt.switch_backend('Agg')
+    # plt.show() al final de los scripts no tiene nada que mostrar con Agg
+    warnings.filterwarnings('ignore', message='.*non-interactive.*')
+    return ruta
+
+
+if os.environ.get('ROBOTICA_EXPORTAR'):
+    activar_exportacion(os.environ['ROBOTICA_EXPORTAR'])
+
+
+# Aristas de la caja como pares de índices de vértice (p1..p8 -> 0..7),
+# en el mismo orden en que drawBox llamaba a drawVector.
+ARISTAS_CAJA = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],     # cara y = 0
+    [4, 5], [5, 6], [6, 7], [7, 4],     # cara y = ancho
+    [3, 7], [0, 4], [2, 6], [1, 5],     # aristas que unen ambas caras
+])
+
+# Colores de los vértices: los 8 primeros del ciclo de matplotlib, como
+# salían al llamar ax.scatter una vez por vértice.
+COLORES_VERTICES = ['C%d' % i for i in range(8)]
+
+
+# ------------------ Exportación ------------------
+class EscritorPNG(animation.AbstractMovieWriter):
+    """Escritor con la interfaz de matplotlib que guarda un PNG por fotograma."""
+
+    def setup(self, fig, outfile, dpi=None):
+        os.makedirs(outfile, exist_ok=True)   # antes: setup exige que exista la carpeta padre
+        super().setup(fig, outfile, dpi)
+        self._n = 0
+
+    def grab_frame(self, **savefig_kwargs):
+        nombre = os.path.join(self.outfile, 'fotograma_%05d.png' % self._n)
+        self.fig.savefig(nombre, dpi=self.dpi, **savefig_kwargs)
+        self._n += 1
+
+    def finish(self):
+        pass
+
+
+def escritor(ruta, fps):
+    """Elige el escritor según la ruta: carpeta -> PNG, .gif -> Pillow, otro -> ffmpeg."""
+    fps = float(FPS) if FPS else min(max(fps, 1.0), 60.0)
+    extension = os.path.splitext(ruta)[1].lower()
+    if ruta.endswith(('/', os.sep)) or not extension:
+        return EscritorPNG(fps=fps)
+    if extension == '.gif':
+        return animation.PillowWriter(fps=fps)
+    if not animation.writers.is_available('ffmpeg'):
+        raise RuntimeError("Para exportar '%s' hace falta ffmpeg; "
+                           "use .gif o una carpeta para PNG" % ruta)
+    return animation.FFMpegWriter(fps=fps)
+
+
+_rutas_usadas = []
+
+
+def _ruta_salida():
+    # Si un mismo script crea varias escenas, la 2a va a 'salida_2.gif', etc.
+    ruta = EXPORTAR
+    if _rutas_usadas:
+        base, extension = os.path.splitext(ruta.rstrip('/' + os.sep))
+        ruta = '%s_%d%s' % (base, len(_rutas_usadas) + 1, extension)
+        if not extension:
+            ruta += os.sep
+    _rutas_usadas.append(ruta)
+    return ruta
+
+
+def mostrar_animacion(ani, fig, interval, ruta=None):
+    """
+    plt.show() para FuncAnimation; en modo exportación guarda el archivo
+    (en ruta, si se da, en lugar de la que sigue de ROBOTICA_EXPORTAR).
+
+    fig, interval -> los mismos que se pasaron a FuncAnimation (ms).
+    """
+    medir_dibujo(fig)
+    perfilador.objetivo = perfilador.objetivo or interval / 1000.0
+    if EXPORTAR:
+        ruta = ruta or _ruta_salida()
+        salida = escritor(ruta, 1000.0 / interval)
+        envolver(salida, 'grab_frame', 'exportar')
+        ani.save(ruta, writer=salida)
+    else:
+        plt.show()
+
+
+# ------------------ Render en paralelo ------------------
+PATRON_PNG = 'fotograma_%05d.png'
+
+# Figura y función de dibujo del render en curso.  Se fijan ANTES de
+# crear el pool: con 'fork' cada proceso hereda su propia copia.
+_TRABAJO = None
+
+
+def exportar_en_paralelo():
+    """True si hay que exportar repartiendo los fotogramas entre procesos."""
+    return bool(EXPORTAR) and PROCESOS > 1 and \
+        'fork' in multiprocessing.get_all_start_methods()
+
+
+def _renderizar_tramo(inicio, fin, carpeta):
+    # Corre en un proceso hijo: dibuja los fotogramas [inicio, fin)
+    fig, dibujar = _TRABAJO
+    for i in range(inicio, fin):
+        dibujar(i)
+        fig.savefig(os.path.join(carpeta, PATRON_PNG % i), dpi=fig.dpi)
+    return fin - inicio
+
+
+def _tramos(n, partes):
+    # Tramos contiguos (así cada proceso reutiliza sus artistas)
+    bordes = np.linspace(0, n, partes + 1).astype(int)
+    return [(a, b) for a, b in zip(bordes[:-1], bordes[1:]) if b > a]
+
+
+def _ensamblar(carpeta, n, ruta, fps):
+    # Junta los PNG en orden en el archivo final (.gif con Pillow, otro con ffmpeg)
+    archivos = [os.path.join(carpeta, PATRON_PNG % i) for i in range(n)]
+    if ruta.lower().endswith('.gif'):
+        from PIL import Image
+        imagenes = [Image.open(a) for a in archivos]
+        imagenes[0].save(ruta, save_all=True, append_images=imagenes[1:],
+                         duration=int(round(1000.0 / fps)), loop=0)
+        return
+    if not animation.writers.is_available('ffmpeg'):
+        raise RuntimeError("Para exportar '%s' hace falta ffmpeg; "
+                           "use .gif o una carpeta para PNG" % ruta)
+    subprocess.run([plt.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                    '-framerate', str(fps), '-i', os.path.join(carpeta, PATRON_PNG),
+                    '-pix_fmt', 'yuv420p', ruta], check=True)
+
+
+def renderizar_paralelo(fig, dibujar, n_fotogramas, fps, procesos=None, ruta=None):
+    """
+    Exporta n_fotogramas repartiéndolos entre procesos.
+
+    fig      -> figura ya preparada (ejes, límites, elementos fijos)
+    dibujar  -> dibujar(i) deja en fig el fotograma i
+    fps      -> cuadros por segundo del archivo (ROBOTICA_FPS manda)
+    procesos -> por defecto ROBOTICA_PROCESOS
+    ruta     -> por defecto ROBOTICA_EXPORTAR
+    """
+    global _TRABAJO
+    procesos = procesos or PROCESOS
+    ruta = ruta or _ruta_salida()
+    fps = float(FPS) if FPS else min(max(fps, 1.0), 60.0)
+    es_carpeta = ruta.endswith(('/', os.sep)) or not os.path.splitext(ruta)[1]
+
+    with tempfile.TemporaryDirectory() as temporal:
+        carpeta = ruta if es_carpeta else temporal
+        os.makedirs(carpeta, exist_ok=True)
+        contexto = multiprocessing.get_context('fork')
+        # Los procesos heredan _TRABAJO al hacer fork; se limpia aunque un tramo falle
+        _TRABAJO = (fig, dibujar)
+        try:
+            with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as pool:
+                futuros = [pool.submit(_renderizar_tramo, a, b, carpeta)
+                           for a, b in _tramos(n_fotogramas, 4 * procesos)]
+                hechos = sum(f.result() for f in futuros)
+        finally:
+            _TRABAJO = None
+        if not es_carpeta:
+            _ensamblar(carpeta, hechos, ruta, fps)
+
+
+def _estilo_puntos(puntos, estilo):
+    """
+    Aplica a una colección de ax.scatter ya creada los estilos de otra
+    llamada.  s y marker tienen su propio método; lo demás va por
+    Artist.set, y lo que ésta no acepta (como c) es TypeError
+    en lugar de perderse en silencio.
+    """
+    estilo = dict(estilo)
+    if 's' in estilo:
+        puntos.set_sizes(np.atleast_1d(estilo.pop('s')))
+    if 'marker' in estilo:
+        marcador = MarkerStyle(estilo.pop('marker'))
+        puntos.set_paths([marcador.get_path().transformed(marcador.get_transform())])
+    try:
+        puntos.set(**estilo)
+    except AttributeError as error:
+        raise TypeError(f"Escena.scatter no puede cambiar ese estilo en una colección "
+                        f"reutilizada: {error}") from None
+
+
+def _mover_puntos(puntos, xs, ys, zs):
+    """
+    Cambia las posiciones 3D de una colección de ax.scatter ya creada.
+
+    mplot3d no tiene un setter público sólo para las posiciones:
+    set_offsets() + set_3d_properties() vuelve a leer tamaños y grosores
+    que do_3d_projection ya reordenó por profundidad (y los revolvería
+    si son por punto).  Por eso se escribe _offsets3d, el mismo atributo
+    que llena set_3d_properties; es el ÚNICO acceso privado del módulo.
+    """
+    puntos._offsets3d = (np.atleast_1d(xs), np.atleast_1d(ys), np.atleast_1d(zs))
+    puntos.stale = True
+
+
+class Escena:
+
+    def __init__(self, ax):
+        self.ax = ax
+        self._escritor = None
+        self._lineas = []
+        self._puntos = []
+        self._n_lineas = 0
+        self._n_puntos = 0
+        self._cajas = []
+        self._n_cajas = 0
+        medir_dibujo(ax.figure)
+
+    # ------------------ Ciclo del fotograma ------------------
+    def nuevo_fotograma(self):
+        # Reinicia el contador: los siguientes plot/scatter reutilizan artistas
+        self._n_lineas = 0
+        self._n_puntos = 0
+        self._n_cajas = 0
+        perfilador.nuevo_fotograma()
+        perfilador.abrir('artistas')
+
+    def fin_fotograma(self):
+        # Oculta los artistas que este fotograma no utilizó
+        for artista in self._lineas[self._n_lineas:]:
+            artista.set_visible(False)
+        for artista in self._puntos[self._n_puntos:]:
+            artista.set_visible(False)
+        for aristas, vertices in self._cajas[self._n_cajas:]:
+            aristas.set_visible(False)
+            vertices.set_visible(False)
+        perfilador.cerrar('artistas')
+
+    def mostrar(self, pausa=0.001):
+        # Reemplazo de plt.draw(); plt.pause(pausa)
+        self.fin_fotograma()
+        perfilador.objetivo = perfilador.objetivo or pausa
+        if EXPORTAR:
+            # Sin pantalla ni pausa: el fotograma va directo al escritor
+            if self._escritor is None:
+                self._abrir_escritor(1.0 / pausa)
+            self._escritor.grab_frame()
+            return
+        if perfilador.activo:
+            # Dibujo síncrono, para medirlo aparte de la espera
+            self.ax.figure.canvas.draw()
+        else:
+            plt.draw()
+        with perfilador.tramo('espera'):
+            plt.pause(pausa)
+
+    def _abrir_escritor(self, fps):
+        ruta = _ruta_salida()
+        self._escritor = escritor(ruta, fps)
+        self._escritor.setup(self.ax.figure, ruta)
+        envolver(self._escritor, 'grab_frame', 'exportar')
+        atexit.register(self.cerrar)
+
+    def cerrar(self):
+        # Termina el archivo exportado (se llama sola al salir del script)
+        if self._escritor is not None:
+            self._escritor.finish()
+            self._escritor = None
+
+    # ------------------ Artistas ------------------
+    def plot(self, xs, ys, zs, **estilo):
+        """Como ax.plot/ax.plot3D, reutilizando la línea del fotograma anterior."""
+        if self._n_lineas < len(self._lineas):
+            linea = self._lineas[self._n_lineas]
+            linea.set_data_3d(np.atleast_1d(xs), np.atleast_1d(ys), np.atleast_1d(zs))
+            if estilo:
+                linea.set(**estilo)
+            linea.set_visible(True)
+        else:
+            linea, = self.ax.plot(xs, ys, zs, **estilo)
+            self._lineas.append(linea)
+        self._n_lineas += 1
+        return linea
+
+    def scatter(self, xs, ys, zs, **estilo):
+        """Como ax.scatter, reutilizando la colección del fotograma anterior."""
+        if self._n_puntos < len(self._puntos):
+            puntos = self._puntos[self._n_puntos]
+            _mover_puntos(puntos, xs, ys, zs)
+            if estilo:
+                _estilo_puntos(puntos, estilo)
+            puntos.set_visible(True)
+        else:
+            puntos = self.ax.scatter(xs, ys, zs, **estilo)
+            self._puntos.append(puntos)
+        self._n_puntos += 1
+        return puntos
+
+    def caja(self, vertices, aristas=ARISTAS_CAJA, color='black', linewidth=1,
+             color_vertices=None, s=None):
+        """
+        Dibuja una o varias cajas con 2 artistas: aristas y vértices.
+
+        vertices -> (8, 3) o (K, 8, 3)
+        aristas  -> (M, 2) índices de vértice de cada arista
+        color    -> color de las aristas (uno solo o uno por caja)
+        color_vertices -> None = ciclo de colores por vértice (como antes)
+        s        -> tamaño de los vértices (None = el de ax.scatter)
+        """
+        V = np.asarray(vertices, dtype=float)
+        if V.ndim == 2:
+            V = V[None]
+        K, n = V.shape[0], V.shape[1]
+        aristas = np.asarray(aristas)
+
+        # (K, M, 2, 3) -> (K*M, 2, 3): un segmento por arista
+        segmentos = V[:, aristas].reshape(-1, 2, 3)
+        if not isinstance(color, str) and len(color) == K:
+            color = [c for c in color for _ in range(len(aristas))]
+        if color_vertices is None:
+            color_vertices = [COLORES_VERTICES[i % 8] for i in range(n)] * K
+        puntos = V.reshape(-1, 3)
+
+        if self._n_cajas < len(self._cajas):
+            lineas, marcas = self._cajas[self._n_cajas]
+            lineas.set_segments(segmentos)
+            lineas.set_color(color)
+            lineas.set_linewidth(linewidth)
+            _mover_puntos(marcas, puntos[:, 0], puntos[:, 1], puntos[:, 2])
+            marcas.set_color(color_vertices)
+            if s is not None:
+                marcas.set_sizes(np.atleast_1d(s))
+            lineas.set_visible(True)
+            marcas.set_visible(True)
+        else:
+            lineas = Line3DCollection(segmentos, colors=color, linewidths=linewidth)
+            self.ax.add_collection3d(lineas)
+            tam = {} if s is None else {'s': s}   # None: el tamaño por defecto, como drawBox
+            marcas = self.ax.scatter(puntos[:, 0], puntos[:, 1], puntos[:, 2],
+                                     color=color_vertices, marker='o', **tam)
+            self._cajas.append((lineas, marcas))
+        self._n_cajas += 1
+        return lineas, marcas
+
+
+if __name__ == "__main__":
+    # python -m robotica.render <script.py> <salida>
+    import runpy
+    if len(sys.argv) != 3:
+        sys.exit('uso: python -m robotica.render <script.py> <salida.gif|salida.mp4|carpeta/>')
+    os.environ['ROBOTICA_EXPORTAR'] = sys.argv[2]
+    sys.argv = sys.argv[1:2]
+    runpy.run_path(sys.argv[0], run_name='__main__')
@@ -0,0 +1,261 @@
+"""
+Cinemática directa del SCARA del examen (EXAMEN 3ER PARCIAL.py), por lotes.
+
+DH() y fkine() son las funciones del examen tal cual, una pose a la vez
+(el script las importa de aquí).  fkine_lote() reproduce exactamente
+fkine(), pero recibiendo arreglos de N valores articulares en lugar de
+escalares:
+
+    T01   = DH(theta1, 0, A1, 0)
+    T12   = DH(theta2, BRAZO_OFFSET_Z + (l_barra_abs - BASE_HEIGHT), A2, 0)
+    T23_R = DH(theta3, 0, 0, 0)
+
+Las tres matrices de las N poses se construyen en una sola llamada a
+cadena_dh(), de modo que 100k+ poses cuestan unas pocas operaciones de
+NumPy en vez de 3·N construcciones de np.array.
+
+Como la cadena del SCARA son sólo rotaciones en Z más un desplazamiento
+prismático en Z, también hay un modo ANALÍTICO (fkine_analitico) que
+obtiene los mismos puntos directamente con trigonometría, sin formar
+ninguna matriz 4x4:
+
+    p1 = (A1·c1,               A1·s1,               BASE_HEIGHT)
+    p2 = (A1·c1 + A2·c12,      A1·s1 + A2·s12,      BRAZO_OFFSET_Z + l_barra_abs)
+    p_barra_top = p2 + (0, 0, Lp)
+
+tests/test_scara.py compara ambos modos contra fkine().
+"""
+
+import numpy as np
+
+from .dh import cadena_dh, transformar_puntos
+from .poses import tabla
+from .trig import sincosd
+
+BASE_HEIGHT = 776.0
+LP = 322.0          # pistón fijo
+N_CIRCULO = 60      # puntos del círculo del platillo (igual que en fkine)
+
+
+# ------------------ Referencia: una pose a la vez (examen) ------------------
+def DH(theta_deg, d, a, alpha_deg=0.0):
+    """Matriz DH 4x4 de UN eslabón, a partir de escalares (la del examen)."""
+    th = np.deg2rad(theta_deg)
+    al = np.deg2rad(alpha_deg)
+    c, s = np.cos(th), np.sin(th)
+    ca, sa = np.cos(al), np.sin(al)
+    return np.array([
+        [ c, -s*ca,  s*sa, a*c],
+        [ s,  c*ca, -c*sa, a*s],
+        [ 0,    sa,    ca,   d],
+        [ 0,     0,     0,   1]
+    ], dtype=float)
+
+
+def fkine(theta1, theta2, l_barra_abs, theta3,
+          A1, A2, BASE_HEIGHT, BRAZO_OFFSET_Z, R_PLATILLO):
+    """
+    Cinemática directa del examen para UNA pose (escalares), con DH().
+
+    Es la referencia de fkine_lote() y tabla_poses(); regresa la tupla
+    (p_base, p_eje, p1, p2, p_barra_top, circ_x, circ_y, circ_z,
+    punto_x, punto_y, punto_z, pmx, pmy, pmz).
+    """
+    delta_z = float(l_barra_abs - BASE_HEIGHT)
+
+    T01 = DH(theta1, 0.0, A1, 0.0)
+    T12 = DH(theta2, BRAZO_OFFSET_Z + delta_z, A2, 0.0)
+    T23_R = DH(theta3, 0.0, 0.0, 0.0)
+
+    T02 = T01 @ T12
+    T03 = T02 @ T23_R
+
+    p_base = np.array([0,0,0])
+    p_eje  = np.array([0,0,BASE_HEIGHT])
+
+    p1 = (T01 @ np.array([0,0,BASE_HEIGHT,1]))[:3]
+    p2 = (T02 @ np.array([0,0,BASE_HEIGHT,1]))[:3]
+
+    p_piston_base = p2.copy()
+    p_barra_top = (T03 @ np.array([0,0,BASE_HEIGHT+LP,1]))[:3]
+
+    t3 = np.deg2rad(theta3)
+    angs = np.linspace(0,2*np.pi,N_CIRCULO)
+
+    circ_x = p_barra_top[0] + R_PLATILLO*np.cos(angs+t3)
+    circ_y = p_barra_top[1] + R_PLATILLO*np.sin(angs+t3)
+    circ_z = np.full_like(circ_x,p_barra_top[2])
+
+    punto_x = p_barra_top[0] + R_PLATILLO*np.cos(t3)
+    punto_y = p_barra_top[1] + R_PLATILLO*np.sin(t3)
+    punto_z = p_barra_top[2]
+
+    pmx,pmy,pmz = p_piston_base
+
+    return (p_base, p_eje, p1, p2, p_barra_top,
+            circ_x, circ_y, circ_z,
+            punto_x, punto_y, punto_z,
+            pmx, pmy, pmz)
+
+
+# ------------------ Por lotes ------------------
+def _articulaciones(theta1, theta2, l_barra_abs, theta3):
+    # Convierte las variables articulares a arreglos float de forma común
+    return np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (theta1, theta2, l_barra_abs, theta3)))
+
+
+def _platillo(p_barra_top, theta3, R_PLATILLO):
+    # Círculo del platillo y punto marcador, solidarios a la punta del pistón
+    t3 = np.deg2rad(theta3)[..., None]
+    angs = np.linspace(0, 2*np.pi, N_CIRCULO)
+
+    circ_x = p_barra_top[..., 0:1] + R_PLATILLO*np.cos(angs + t3)
+    circ_y = p_barra_top[..., 1:2] + R_PLATILLO*np.sin(angs + t3)
+    circ_z = np.broadcast_to(p_barra_top[..., 2:3], circ_x.shape).copy()
+
+    punto_x = p_barra_top[..., 0] + R_PLATILLO*np.cos(t3[..., 0])
+    punto_y = p_barra_top[..., 1] + R_PLATILLO*np.sin(t3[..., 0])
+    punto_z = p_barra_top[..., 2]
+    return circ_x, circ_y, circ_z, punto_x, punto_y, punto_z
+
+
+def fkine_lote(theta1, theta2, l_barra_abs, theta3,
+               A1, A2, BASE_HEIGHT=BASE_HEIGHT, BRAZO_OFFSET_Z=-40.0,
+               R_PLATILLO=100.0, modo='dh'):
+    """
+    fkine() vectorizado.
+
+    modo -> 'dh' (producto de matrices DH, igual que el examen) o
+            'analitico' (forma cerrada, ver fkine_analitico).
+
+    theta1, theta2, l_barra_abs, theta3 -> escalares o arreglos de N
+    elementos (se difunden entre sí).  Regresa la misma tupla que fkine()
+    pero con una dimensión extra de N poses:
+
+        (p_base (3,), p_eje (3,), p1 (N,3), p2 (N,3), p_barra_top (N,3),
+         circ_x, circ_y, circ_z (N,60),
+         punto_x, punto_y, punto_z (N,),
+         pmx, pmy, pmz (N,))
+    """
+    if modo == 'analitico':
+        return fkine_analitico(theta1, theta2, l_barra_abs, theta3,
+                               A1, A2, BASE_HEIGHT, BRAZO_OFFSET_Z, R_PLATILLO)
+    if modo != 'dh':
+        raise ValueError(f"modo desconocido: {modo!r}")
+
+    theta1, theta2, l_barra_abs, theta3 = _articulaciones(
+        theta1, theta2, l_barra_abs, theta3)
+
+    delta_z = l_barra_abs - BASE_HEIGHT
+    ceros = np.zeros_like(theta1)
+
+    # (N, 3 eslabones) -> una sola construcción de todas las matrices
+    theta = np.stack([theta1, theta2, theta3], axis=-1)
+    d = np.stack([ceros, BRAZO_OFFSET_Z + delta_z, ceros], axis=-1)
+    a = np.stack([ceros + A1, ceros + A2, ceros], axis=-1)
+    _, T0 = cadena_dh(theta, d, a, 0.0)
+
+    p_base = np.array([0, 0, 0])
+    p_eje = np.array([0, 0, BASE_HEIGHT])
+
+    p1 = transformar_puntos(T0[..., 0, :, :], [0, 0, BASE_HEIGHT])
+    p2 = transformar_puntos(T0[..., 1, :, :], [0, 0, BASE_HEIGHT])
+    p_barra_top = transformar_puntos(T0[..., 2, :, :], [0, 0, BASE_HEIGHT + LP])
+
+    circ_x, circ_y, circ_z, punto_x, punto_y, punto_z = _platillo(
+        p_barra_top, theta3, R_PLATILLO)
+
+    pmx, pmy, pmz = p2[..., 0], p2[..., 1], p2[..., 2]
+
+    return (p_base, p_eje, p1, p2, p_barra_top,
+            circ_x, circ_y, circ_z,
+            punto_x, punto_y, punto_z,
+            pmx, pmy, pmz)
+
+
+def tabla_poses(theta1, theta2, l_barra_abs, theta3,
+                A1, A2, BASE_HEIGHT=BASE_HEIGHT, BRAZO_OFFSET_Z=-40.0,
+                R_PLATILLO=100.0, modo='dh'):
+    """
+    Trayectoria completa como tabla de poses (ver robotica.poses).
+
+    Una fila por fotograma con los campos:
+        theta1, theta2, l_barra, theta3   variables articulares
+        p_base, p_eje, p1, p2, p_top      (3,) puntos del dibujo
+        circulo                           (3, N_CIRCULO) platillo (x, y, z)
+        punto                             (3,) marcador del platillo
+    (pmx, pmy, pmz de fkine() son p2.)
+    """
+    (p_base, p_eje, p1, p2, p_top,
+     cx, cy, cz, px, py, pz, _, _, _) = fkine_lote(
+        theta1, theta2, l_barra_abs, theta3, A1, A2,
+        BASE_HEIGHT, BRAZO_OFFSET_Z, R_PLATILLO, modo)
+    th1, th2, l, th3 = _articulaciones(theta1, theta2, l_barra_abs, theta3)
+    n = th1.shape[0]
+    return tabla(theta1=th1, theta2=th2, l_barra=l, theta3=th3,
+                 p_base=np.broadcast_to(p_base, (n, 3)),
+                 p_eje=np.broadcast_to(p_eje, (n, 3)),
+                 p1=p1, p2=p2, p_top=p_top,
+                 circulo=np.stack([cx, cy, cz], axis=1),
+                 punto=np.stack([px, py, pz], axis=1))
+
+
+def puntos_analiticos(theta1, theta2, l_barra_abs, A1, A2,
+                      BASE_HEIGHT=BASE_HEIGHT, BRAZO_OFFSET_Z=-40.0):
+    """
+    Sólo los puntos articulados del SCARA en forma cerrada.
+
+    Regresa (p1, p2, p_barra_top), cada uno (..., 3).  Es la parte de
+    fkine_analitico() que no depende de θ3 ni del platillo.
+    """
+    s1, c1 = sincosd(theta1)
+    s12, c12 = sincosd(np.asarray(theta1) + np.asarray(theta2))
+
+    # El BASE_HEIGHT del punto y el de delta_z se cancelan en la altura de p2
+    z2 = BRAZO_OFFSET_Z + np.asarray(l_barra_abs, dtype=float)
+
+    forma = np.broadcast(s1, s12, z2).shape
+    p1 = np.empty(forma + (3,))
+    p1[..., 0] = A1*c1
+    p1[..., 1] = A1*s1
+    p1[..., 2] = BASE_HEIGHT
+
+    p2 = np.empty_like(p1)
+    p2[..., 0] = p1[..., 0] + A2*c12
+    p2[..., 1] = p1[..., 1] + A2*s12
+    p2[..., 2] = z2
+
+    p_barra_top = p2.copy()
+    p_barra_top[..., 2] += LP
+    return p1, p2, p_barra_top
+
+
+def fkine_analitico(theta1, theta2, l_barra_abs, theta3,
+                    A1, A2, BASE_HEIGHT=BASE_HEIGHT, BRAZO_OFFSET_Z=-40.0,
+                    R_PLATILLO=100.0):
+    """
+    Cinemática directa del SCARA en forma cerrada (sin matrices).
+
+    Mismos argumentos y misma tupla de salida que fkine_lote().
+    """
+    theta1, theta2, l_barra_abs, theta3 = _articulaciones(
+        theta1, theta2, l_barra_abs, theta3)
+
+    p1, p2, p_barra_top = puntos_analiticos(theta1, theta2, l_barra_abs,
+                                            A1, A2, BASE_HEIGHT, BRAZO_OFFSET_Z)
+
+    p_base = np.array([0, 0, 0])
+    p_eje = np.array([0, 0, BASE_HEIGHT])
+
+    circ_x, circ_y, circ_z, punto_x, punto_y, punto_z = _platillo(
+        p_barra_top, theta3, R_PLATILLO)
+
+    pmx, pmy, pmz = p2[..., 0], p2[..., 1], p2[..., 2]
+
+    return (p_base, p_eje, p1, p2, p_barra_top,
+            circ_x, circ_y, circ_z,
+            punto_x, punto_y, punto_z,
+            pmx, pmy, pmz)
+
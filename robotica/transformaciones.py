@@ -0,0 +1,138 @@
+"""
+Matrices de rotación (3x3 y homogéneas 4x4) que escriben en un buffer
+reutilizable.
+
+Los scripts de las tareas construían un np.array nuevo (a partir de
+listas anidadas) en cada llamada a RotX/RotY/RotZ, y los bucles de
+animación las llaman cientos de veces por segundo.
+
+rotx/roty/rotz y sus homogéneas rotx_h/roty_h/rotz_h aceptan un
+argumento opcional 'out': si se da, la matriz se escribe ahí (sin
+reservar memoria) y se regresa el mismo arreglo; si no, se crea uno
+nuevo como antes.  El patrón de uso en un bucle es reservar el buffer
+UNA vez fuera del bucle:
+
+    R = np.empty((3, 3))
+    for n in range(steps + 1):
+        rotx(n, out=R)
+        ...
+
+Los ángulos van en GRADOS.  El seno y coseno de cada ángulo se calculan
+una sola vez con robotica.trig (exactos en múltiplos de 90° y por tabla
+para grados enteros), con floats de Python para no crear objetos numpy
+intermedios.  Para componer matrices en un
+buffer se recomienda np.dot(A, B, out=C): a diferencia de np.matmul, no
+reserva memoria temporal para matrices pequeñas.
+
+Así lo usan los bucles de la Tarea 1 y la Tarea 3 (un vector por
+fotograma).  Las cajas de la Tarea 2 no rotan fotograma a fotograma:
+usan las versiones *_lote, que reciben un ARREGLO de ángulos (...,) y
+regresan todas las rotaciones apiladas (..., 3, 3) de una sola vez, para
+precalcular la animación completa (ver robotica.cuerpos).
+"""
+
+import numpy as np
+
+from .trig import sincosd, sincosd_escalar as _sincos
+
+
+def _buffer(out, n):
+    if out is None:
+        return np.empty((n, n))
+    return out
+
+
+# ------------------ Rotaciones 3x3 ------------------
+def rotx(t, out=None):
+    # Rotación 3x3 sobre el eje X
+    s, c = _sincos(t)
+    R = _buffer(out, 3)
+    R[0, 0] = 1.0; R[0, 1] = 0.0; R[0, 2] = 0.0
+    R[1, 0] = 0.0; R[1, 1] = c;   R[1, 2] = -s
+    R[2, 0] = 0.0; R[2, 1] = s;   R[2, 2] = c
+    return R
+
+
+def roty(t, out=None):
+    # Rotación 3x3 sobre el eje Y
+    s, c = _sincos(t)
+    R = _buffer(out, 3)
+    R[0, 0] = c;   R[0, 1] = 0.0; R[0, 2] = s
+    R[1, 0] = 0.0; R[1, 1] = 1.0; R[1, 2] = 0.0
+    R[2, 0] = -s;  R[2, 1] = 0.0; R[2, 2] = c
+    return R
+
+
+def rotz(t, out=None):
+    # Rotación 3x3 sobre el eje Z
+    s, c = _sincos(t)
+    R = _buffer(out, 3)
+    R[0, 0] = c;   R[0, 1] = -s;  R[0, 2] = 0.0
+    R[1, 0] = s;   R[1, 1] = c;   R[1, 2] = 0.0
+    R[2, 0] = 0.0; R[2, 1] = 0.0; R[2, 2] = 1.0
+    return R
+
+
+# ------------------ Rotaciones 3x3 por lotes ------------------
+def _lote(t):
+    t = np.asarray(t)
+    s, c = sincosd(np.atleast_1d(t))
+    R = np.zeros(t.shape + (3, 3))
+    return R, s.reshape(t.shape), c.reshape(t.shape)
+
+
+def rotx_lote(t):
+    # Rotaciones sobre X apiladas: t (...,) -> (..., 3, 3)
+    R, s, c = _lote(t)
+    R[..., 0, 0] = 1.0
+    R[..., 1, 1] = c; R[..., 1, 2] = -s
+    R[..., 2, 1] = s; R[..., 2, 2] = c
+    return R
+
+
+def roty_lote(t):
+    # Rotaciones sobre Y apiladas: t (...,) -> (..., 3, 3)
+    R, s, c = _lote(t)
+    R[..., 0, 0] = c;  R[..., 0, 2] = s
+    R[..., 1, 1] = 1.0
+    R[..., 2, 0] = -s; R[..., 2, 2] = c
+    return R
+
+
+def rotz_lote(t):
+    # Rotaciones sobre Z apiladas: t (...,) -> (..., 3, 3)
+    R, s, c = _lote(t)
+    R[..., 0, 0] = c; R[..., 0, 1] = -s
+    R[..., 1, 0] = s; R[..., 1, 1] = c
+    R[..., 2, 2] = 1.0
+    return R
+
+
+# ------------------ Transformaciones homogéneas 4x4 ------------------
+def _homogenea(out):
+    # Completa la fila/columna homogénea alrededor de un bloque 3x3 ya escrito
+    out[0, 3] = 0.0; out[1, 3] = 0.0; out[2, 3] = 0.0
+    out[3, 0] = 0.0; out[3, 1] = 0.0; out[3, 2] = 0.0; out[3, 3] = 1.0
+    return out
+
+
+def rotx_h(t, out=None):
+    # Rotación homogénea 4x4 sobre el eje X
+    T = _buffer(out, 4)
+    rotx(t, out=T[:3, :3])
+    return _homogenea(T)
+
+
+def roty_h(t, out=None):
+    # Rotación homogénea 4x4 sobre el eje Y
+    T = _buffer(out, 4)
+    roty(t, out=T[:3, :3])
+    return _homogenea(T)
+
+
+def rotz_h(t, out=None):
+    # Rotación homogénea 4x4 sobre el eje Z
+    T = _buffer(out, 4)
+    rotz(t, out=T[:3, :3])
+    return _homogenea(T)
+
@@ -0,0 +1,94 @@
+"""
+Funciones trigonométricas en grados, compartidas por todos los scripts.
+
+Cada script definía su propio sind/cosd (t*np.pi/180 o np.deg2rad) y
+las matrices de rotación los llaman 4–8 veces con el MISMO ángulo.
+Aquí:
+
+    sincosd(t) -> (sin, cos) calculados juntos, una sola conversión
+    sind(t), cosd(t) -> reemplazo directo de las versiones de los scripts
+
+Además:
+  - Los múltiplos de 90° dan valores EXACTOS (cos(90°) = 0.0 y no 6e-17),
+    igual que los múltiplos de 30° en el seno/coseno que valen ±0.5.
+  - Los ángulos enteros (los bucles range() de rotate(final_angle) y
+    animate_rotation_sequential) se resuelven con una tabla precalculada
+    de 0° a 359° en lugar de llamar a sin/cos.
+
+Aceptan escalares (regresan float) o arreglos (regresan arreglos).
+"""
+
+import math
+
+import numpy as np
+
+
+def _tabla_entera():
+    # sin/cos de 0..359 grados, con los valores exactos conocidos
+    sin_t = [math.sin(math.radians(k)) for k in range(360)]
+    cos_t = [math.cos(math.radians(k)) for k in range(360)]
+    for k, (s, c) in {0: (0.0, 1.0), 90: (1.0, 0.0),
+                      180: (0.0, -1.0), 270: (-1.0, 0.0)}.items():
+        sin_t[k], cos_t[k] = s, c
+    for k in (30, 150):
+        sin_t[k] = 0.5
+    for k in (210, 330):
+        sin_t[k] = -0.5
+    for k in (60, 300):
+        cos_t[k] = 0.5
+    for k in (120, 240):
+        cos_t[k] = -0.5
+    return sin_t, cos_t
+
+
+_SIN_ENTERO, _COS_ENTERO = _tabla_entera()
+_SIN_ENTERO_NP = np.array(_SIN_ENTERO)
+_COS_ENTERO_NP = np.array(_COS_ENTERO)
+
+
+def sincosd_escalar(t):
+    """(sin, cos) de un ángulo escalar en grados, como floats de Python."""
+    t = float(t)
+    if t.is_integer():
+        k = int(t) % 360
+        return _SIN_ENTERO[k], _COS_ENTERO[k]
+    r = math.radians(t)
+    return math.sin(r), math.cos(r)
+
+
+def sincosd(t):
+    """
+    Seno y coseno de t (grados) calculados juntos.
+
+    t -> escalar o arreglo.  Regresa (s, c) con la misma forma que t.
+    """
+    t = np.asarray(t)
+    if t.ndim == 0:
+        return sincosd_escalar(t)
+    if t.dtype.kind in 'iub':
+        # Rejilla de grados enteros: sólo consulta de tabla
+        idx = np.mod(t, 360).astype(np.intp)
+        return _SIN_ENTERO_NP[idx], _COS_ENTERO_NP[idx]
+    t = t.astype(float, copy=False)
+
+    r = np.deg2rad(t)
+    s = np.sin(r)
+    c = np.cos(r)
+
+    k = np.round(t)
+    entero = (k == t) & np.isfinite(t)
+    if entero.any():
+        idx = np.mod(k[entero], 360).astype(np.intp)
+        s[entero] = _SIN_ENTERO_NP[idx]
+        c[entero] = _COS_ENTERO_NP[idx]
+    return s, c
+
+
+def sind(t):
+    # Seno en grados
+    return sincosd(t)[0]
+
+
+def cosd(t):
+    # Coseno en grados
+    return sincosd(t)[1]
@@ -0,0 +1,88 @@
+"""
+robotica.barrido: un barrido interrumpido (bloques ya escritos y un
+renglón a medias) se reanuda sin duplicar ni saltar variantes, y
+cambiar theta2_max o muestras no reutiliza resultados de otro barrido.
+"""
+
+import csv
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.barrido import CLAVE, COLUMNAS, barrer, leer_resultados, rejilla
+
+RANGOS = {'A1': '600:800:5', 'A2': '700:900:4', 'BAR_MIN': '400,418.5'}   # 40 variantes
+OPCIONES = dict(bloque=6, muestras=91)
+
+
+def claves(ruta):
+    with open(ruta, newline='') as f:
+        return [tuple(float(fila[c]) for c in CLAVE) for fila in csv.DictReader(f)]
+
+
+def ordenada(ruta):
+    tabla = leer_resultados(ruta)
+    return tabla[np.lexsort([tabla[c] for c in reversed(CLAVE)])]
+
+
+@pytest.fixture(scope='module')
+def completo(tmp_path_factory):
+    ruta = str(tmp_path_factory.mktemp('barrido') / 'completo.csv')
+    nuevas, hechas, _ = barrer(RANGOS, ruta, procesos=1, **OPCIONES)
+    assert (nuevas, hechas) == (len(rejilla(RANGOS)), 0)
+    return ruta
+
+
+def interrumpido(completo, ruta, renglones, corte):
+    # Encabezado + los primeros renglones + 'corte' bytes del siguiente (sin '\n')
+    with open(completo, 'rb') as f:
+        lineas = f.read().splitlines(keepends=True)
+    with open(ruta, 'wb') as f:
+        f.write(b''.join(lineas[:1 + renglones]) + lineas[1 + renglones][:corte])
+
+
+@pytest.mark.parametrize('procesos', [1, 2])
+@pytest.mark.parametrize('renglones, corte', [(0, 0), (12, 0), (13, 25), (39, 10)])
+def test_reanudar_sin_duplicar_ni_saltar(completo, tmp_path, procesos, renglones, corte):
+    ruta = str(tmp_path / 'parcial.csv')
+    interrumpido(completo, ruta, renglones, corte)
+
+    nuevas, hechas, _ = barrer(RANGOS, ruta, procesos=procesos, **OPCIONES)
+    assert (nuevas, hechas) == (40 - renglones, renglones)
+    obtenidas = claves(ruta)
+    assert len(obtenidas) == len(set(obtenidas)) == 40
+    assert set(obtenidas) == set(claves(completo))
+    # Mismos números que el barrido de una sola vez
+    np.testing.assert_array_equal(ordenada(ruta), ordenada(completo))
+
+    # Otra corrida no agrega nada
+    assert barrer(RANGOS, ruta, procesos=procesos, **OPCIONES)[:2] == (0, 40)
+    assert len(claves(ruta)) == 40
+
+
+def test_encabezado_a_medias(completo, tmp_path):
+    ruta = str(tmp_path / 'parcial.csv')
+    with open(ruta, 'w') as f:
+        f.write(','.join(COLUMNAS)[:10])
+    assert barrer(RANGOS, ruta, procesos=1, **OPCIONES)[:2] == (40, 0)
+    np.testing.assert_array_equal(ordenada(ruta), ordenada(completo))
+
+
+@pytest.mark.parametrize('cambio', [dict(muestras=181), dict(theta2_max=90.0)])
+def test_otro_muestreo_no_reutiliza(completo, tmp_path, cambio):
+    ruta = str(tmp_path / 'mezcla.csv')
+    interrumpido(completo, ruta, 40 - 1, 0)     # el barrido completo, sin el último renglón
+    opciones = {**OPCIONES, **cambio}
+    assert barrer(RANGOS, ruta, procesos=1, **opciones)[:2] == (40, 39)
+    assert len(claves(ruta)) == 79
+
+
+def test_columnas_ajenas(tmp_path):
+    ruta = str(tmp_path / 'otro.csv')
+    with open(ruta, 'w') as f:
+        f.write('a,b\n1,2\n')
+    with pytest.raises(ValueError, match="no son las de un barrido"):
+        barrer(RANGOS, ruta, procesos=1, **OPCIONES)
@@ -0,0 +1,96 @@
+"""
+robotica.cadena: los presets contra las cinemáticas por lotes de cada
+robot (scara.fkine_lote, planar.fk_planar, esferico.fk_esferico), y el
+jacobiano geométrico contra diferencias finitas centrales de fk().
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica import cadena, esferico, planar, scara
+
+N = 10000
+TOL = 1e-9
+
+
+@pytest.fixture(scope='module')
+def articulaciones():
+    rng = np.random.default_rng(0)
+    t1, t2, t3 = (rng.uniform(-180, 180, N) for _ in range(3))
+    return t1, t2, t3, rng.uniform(418.5, 880.0, N)
+
+
+def test_preset_scara(articulaciones):
+    t1, t2, t3, l = articulaciones
+    P = cadena.scara().puntos(np.stack([t1, t2, l, t3], axis=-1))
+    _, _, p1, p2, p_top, *_ = scara.fkine_lote(t1, t2, l, t3, 715.0, 850.0)
+    np.testing.assert_allclose(P[:, 1], p1, rtol=0, atol=TOL)
+    np.testing.assert_allclose(P[:, 3], p2, rtol=0, atol=TOL)      # p2: tras la prismática
+    np.testing.assert_allclose(P[:, 5], p_top, rtol=0, atol=TOL)
+
+
+def test_preset_planar(articulaciones):
+    t1, t2, _, _ = articulaciones
+    P = cadena.planar_2r().puntos(np.stack([t1, t2], axis=-1))
+    p1, p2 = planar.fk_planar(t1, t2)
+    np.testing.assert_allclose(P[:, 1], p1, rtol=0, atol=TOL)
+    np.testing.assert_allclose(P[:, 2], p2, rtol=0, atol=TOL)
+
+
+def test_preset_esferico(articulaciones):
+    t1, t2, t3, _ = articulaciones
+    P = cadena.esferico().puntos(np.stack([t1, t2, t3], axis=-1))
+    _, p1, p2 = esferico.fk_esferico(t1, t2, t3)
+    np.testing.assert_allclose(P[:, 2], p1, rtol=0, atol=TOL)
+    np.testing.assert_allclose(P[:, 3], p2, rtol=0, atol=TOL)
+
+
+PRESETS = [cadena.scara(), cadena.planar_2r(), cadena.esferico(), cadena.dh_2r(1.0, 0.8)]
+
+
+@pytest.mark.parametrize('preset', PRESETS, ids=lambda c: c.nombre)
+def test_jacobiano_diferencias_finitas(preset):
+    rng = np.random.default_rng(1)
+    q = rng.uniform(-180, 180, (500, preset.n))
+    if 'P' in preset.tipos:
+        q[:, preset.tipos.index('P')] = rng.uniform(418.5, 880.0, len(q))
+    J = preset.jacobiano(q)
+    assert J.shape == (len(q), 6, preset.n)
+
+    h = 1e-6
+    num = np.empty_like(J)
+    for j, tipo in enumerate(preset.tipos):
+        # Columnas R por radián (el paso en grados es rad2deg(h)); P por unidad de longitud
+        dq = np.zeros(preset.n)
+        dq[j] = np.rad2deg(h) if tipo == 'R' else h
+        mas, menos = preset.fk(q + dq), preset.fk(q - dq)
+        num[:, :3, j] = (mas[:, :3, 3] - menos[:, :3, 3]) / (2 * h)
+        # Velocidad angular: parte antisimétrica de Ṙ·Rᵀ
+        W = (mas[:, :3, :3] - menos[:, :3, :3]) / (2 * h) @ np.swapaxes(preset.fk(q)[:, :3, :3], -1, -2)
+        num[:, 3:, j] = np.stack([W[:, 2, 1], W[:, 0, 2], W[:, 1, 0]], axis=-1)
+
+    escala = max(np.abs(num[:, :3]).max(), 1.0)
+    np.testing.assert_allclose(J[:, :3], num[:, :3], rtol=0, atol=1e-6 * escala)
+    np.testing.assert_allclose(J[:, 3:], num[:, 3:], rtol=0, atol=1e-6)
+
+
+def test_fk_jacobiano_igual_a_llamadas_separadas():
+    preset = cadena.esferico()
+    q = np.random.default_rng(2).uniform(-180, 180, (50, preset.n))
+    T, J = preset.fk_jacobiano(q)
+    np.testing.assert_array_equal(T, preset.fk(q))
+    np.testing.assert_array_equal(J, preset.jacobiano(q))
+
+
+def test_manipulabilidad_nula_en_singularidad():
+    # Planar 2R estirado (θ2 = 0) o doblado (θ2 = 180°): sólo filas x, y
+    preset = cadena.planar_2r()
+    q = np.array([[30.0, 0.0], [-75.0, 180.0], [10.0, 90.0]])
+    w = cadena.manipulabilidad(preset.jacobiano(q), filas=[0, 1])
+    np.testing.assert_allclose(w[:2], 0.0, atol=1e-9)
+    # Lejos de la singularidad w = L1·L2·|sin θ2|
+    np.testing.assert_allclose(w[2], 15.0 * 10.0, rtol=1e-12)
@@ -0,0 +1,100 @@
+"""
+robotica.cartesiano: linea() da puntos colineales, equiespaciados y con
+los extremos exactos; arco() se queda sobre su círculo; y la IK de un
+camino (planar y esférico) regresa al mismo camino por la cinemática
+directa, sin saltos de rama ni de ±360° entre muestras.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica import esferico, planar
+from robotica.cartesiano import arco, ik_camino_esferico, ik_camino_planar, linea
+
+N = 501
+S = np.linspace(0, 1, N)
+TOL = 1e-9
+
+
+@pytest.mark.parametrize('p0, pf', [([28.0, 0.0, 0.0], [-3.0, 12.5, 9.0]),
+                                    ([880.0, 0.0], [418.5, -90.0]),
+                                    ([1.0, 2.0, 3.0], [1.0, 2.0, 3.0])])
+def test_linea_extremos_colineales_y_equiespaciados(p0, pf):
+    p = linea(p0, pf, S)
+    assert p.shape == (N, len(p0))
+    # Extremos exactos (s = 0 y s = 1), no sólo cercanos
+    np.testing.assert_array_equal(p[0], p0)
+    np.testing.assert_array_equal(p[-1], pf)
+    # Colineales: cada punto es p0 + s·(pf - p0), sin componente fuera de la recta
+    d = np.subtract(pf, p0)
+    rel = p - p0
+    fuera = rel - np.outer(rel @ d / max(d @ d, 1e-300), d)
+    np.testing.assert_allclose(fuera, 0.0, rtol=0, atol=TOL)
+    # Pasos iguales de longitud |pf - p0| / (N - 1)
+    paso = np.linalg.norm(np.diff(p, axis=0), axis=1)
+    np.testing.assert_allclose(paso, np.linalg.norm(d) / (N - 1), rtol=0, atol=TOL)
+
+
+def test_linea_escalar():
+    np.testing.assert_allclose(linea([0, 0, 0], [2, 4, 6], 0.5), [[1, 2, 3]])
+
+
+def test_arco_sobre_el_circulo():
+    centro, inicio = np.array([1.0, -2.0, 3.0]), np.array([6.0, -2.0, 3.0])
+    p = arco(centro, inicio, 90.0, S)
+    np.testing.assert_allclose(np.linalg.norm(p - centro, axis=1), 5.0, rtol=0, atol=TOL)
+    np.testing.assert_allclose(p[0], inicio, rtol=0, atol=TOL)
+    np.testing.assert_allclose(p[-1], [1.0, 3.0, 3.0], rtol=0, atol=TOL)    # +90° sobre z
+    np.testing.assert_allclose(p[:, 2], 3.0, rtol=0, atol=TOL)
+    # Pasos iguales sobre el arco
+    paso = np.linalg.norm(np.diff(p, axis=0), axis=1)
+    np.testing.assert_allclose(paso, paso[0], rtol=1e-9)
+
+
+@pytest.mark.parametrize('rama', ['arriba', 'abajo'])
+def test_ik_camino_planar_ida_y_vuelta(rama):
+    # Cruza el eje -x (atan2 salta de +180 a -180): θ1 debe seguir continuo
+    puntos = linea([-20.0, 8.0, 0.0], [-12.0, -15.0, 0.0], S)
+    q, alcanzable = ik_camino_planar(puntos, rama)
+    assert alcanzable.all()
+    _, p2 = planar.fk_planar(q[:, 0], q[:, 1])
+    np.testing.assert_allclose(p2, puntos, rtol=0, atol=TOL)
+    assert np.all(q[:, 1] >= 0) if rama == 'arriba' else np.all(q[:, 1] <= 0)
+    assert np.abs(np.diff(q, axis=0)).max() < 2.0
+
+
+@pytest.mark.parametrize('rama', esferico.RAMAS)
+def test_ik_camino_esferico_ida_y_vuelta(rama):
+    # Hasta un objetivo detrás y arriba; se arranca con el codo doblado porque junto al
+    # brazo estirado (singular) θ3 crece como la raíz de la distancia recorrida
+    puntos = linea([20.0, -4.0, -3.0], [-8.0, 10.0, 12.0], S)
+    q, alcanzable = ik_camino_esferico(puntos, rama)
+    assert alcanzable.all()
+    _, _, p2 = esferico.fk_esferico(q[:, 0], q[:, 1], q[:, 2])
+    np.testing.assert_allclose(p2, puntos, rtol=0, atol=1e-8)
+    # La rama pedida es la postura en el objetivo (última muestra)
+    sol, _ = esferico.ik_esferico(puntos[-1:])
+    np.testing.assert_allclose(np.mod(q[-1] - sol[0, esferico.RAMAS.index(rama)] + 180, 360) - 180,
+                               0.0, rtol=0, atol=1e-6)
+    # Misma familia todo el camino: sin saltos entre muestras consecutivas
+    assert np.abs(np.diff(q, axis=0)).max() < 2.0
+
+
+def test_ik_camino_fuera_de_alcance():
+    # Planar de alcance 25: la mitad final de la línea queda fuera
+    puntos = linea([10.0, 0.0, 0.0], [40.0, 0.0, 0.0], S)
+    _, alcanzable = ik_camino_planar(puntos)
+    np.testing.assert_array_equal(alcanzable, np.linalg.norm(puntos, axis=1) <= 25.0 + TOL)
+    _, alcanzable = ik_camino_esferico(puntos)
+    np.testing.assert_array_equal(alcanzable, np.linalg.norm(puntos, axis=1) <= 28.0 + TOL)
+
+
+def test_rama_desconocida():
+    with pytest.raises(ValueError, match="rama desconocida"):
+        ik_camino_planar([[1.0, 2.0]], 'lado')
+    with pytest.raises(ValueError, match="rama desconocida"):
+        ik_camino_esferico([[1.0, 2.0, 3.0]], 'arriba')
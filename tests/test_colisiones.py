@@ -0,0 +1,121 @@
+"""
+robotica.colisiones: distancias exactas contra un muestreo denso de los
+segmentos, el BVH contra la revisión de todas las cajas, y las banderas
+de choque en poses armadas a mano.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cadena import CadenaSerial, planar_2r
+from robotica.colisiones import (BVH, ModeloColision, Obstaculos, cajas_desde_vertices,
+                                 distancia_segmento_caja, distancia_segmentos, modelo_scara)
+from robotica.cuerpos import CAJA
+
+MUESTRAS = 2001
+
+
+@pytest.fixture(scope='module')
+def segmentos():
+    rng = np.random.default_rng(0)
+    return tuple(rng.uniform(-5, 5, (2000, 3)) for _ in range(4))
+
+
+def muestreo(p, q):
+    # MUESTRAS puntos a lo largo de cada segmento, (n, MUESTRAS, 3)
+    t = np.linspace(0, 1, MUESTRAS)[:, None]
+    return p[:, None] + t * (q - p)[:, None]
+
+
+def test_distancia_segmentos_contra_muestreo(segmentos):
+    p1, q1, p2, q2 = segmentos
+    exacta = distancia_segmentos(p1, q1, p2, q2)
+    # Cada punto muestreado del segmento 1 contra el segmento 2 (punto = segmento degenerado)
+    s1 = muestreo(p1, q1)
+    aprox = distancia_segmentos(s1, s1, p2[:, None], q2[:, None]).min(axis=1)
+    assert np.all(exacta <= aprox + 1e-12)
+    np.testing.assert_allclose(exacta, aprox, atol=1e-3)
+
+
+def test_distancia_segmento_caja_contra_muestreo(segmentos):
+    p1, q1, _, _ = segmentos
+    centros, R, semi = cajas_desde_vertices(CAJA)
+    exacta = distancia_segmento_caja(p1, q1, centros[0], R[0], semi[0])
+    local = np.einsum('ji,nsj->nsi', R[0], muestreo(p1, q1) - centros[0])
+    aprox = np.sqrt((np.maximum(np.abs(local) - semi[0], 0.0)**2).sum(-1)).min(axis=1)
+    assert np.all(exacta <= aprox + 1e-12)
+    np.testing.assert_allclose(exacta, aprox, atol=1e-3)
+    # Segmentos que atraviesan la caja: distancia 0
+    assert np.all(exacta[aprox == 0.0] == 0.0)
+
+
+def cajas_al_azar(M, rng):
+    # Cajas rotadas y escaladas alrededor del robot planar
+    tam = rng.uniform(0.5, 4.0, (M, 1, 3))
+    phi = rng.uniform(-np.pi, np.pi, M)
+    c, s = np.cos(phi), np.sin(phi)
+    R = np.zeros((M, 3, 3))
+    R[:, 0, 0], R[:, 0, 1], R[:, 1, 0], R[:, 1, 1], R[:, 2, 2] = c, -s, s, c, 1.0
+    V = (CAJA / [7.0, 2.0, 3.0] * tam) @ np.swapaxes(R, -1, -2)
+    return V + rng.uniform(-30, 30, (M, 1, 3)) * [1, 1, 0.2]
+
+
+def test_bvh_igual_a_fuerza_bruta():
+    rng = np.random.default_rng(1)
+    modelo = ModeloColision(planar_2r(), {'eslabon1': (0, 1, 1.0), 'eslabon2': (1, 2, 0.8)})
+    obst = Obstaculos.desde_vertices(cajas_al_azar(30, rng))
+    q = rng.uniform(-180, 180, (40, 50, 2))
+
+    choque, propio, contra = modelo.verificar(q, obst, margen=0.25)
+
+    a, b = modelo.segmentos(q)
+    d = distancia_segmento_caja(a[..., None, :], b[..., None, :], obst.centros, obst.R, obst.semiejes)
+    bruta = np.any(d < (modelo.radios + 0.25)[:, None], axis=(-1, -2))
+    assert 0 < bruta.sum() < bruta.size      # hay poses con y sin choque
+    np.testing.assert_array_equal(contra, bruta)
+    np.testing.assert_array_equal(choque, propio | contra)
+
+
+def test_bvh_pares_completos():
+    # Todo par (consulta, objeto) cuyas AABB se tocan aparece exactamente una vez
+    rng = np.random.default_rng(2)
+    lo = rng.uniform(-50, 50, (300, 3))
+    hi = lo + rng.uniform(0.1, 8, (300, 3))
+    qlo = rng.uniform(-50, 50, (200, 3))
+    qhi = qlo + rng.uniform(0.1, 8, (200, 3))
+    ic, io = BVH(lo, hi, hoja=3).pares(qlo, qhi)
+    toca = np.all((qlo[:, None] <= hi[None]) & (qhi[:, None] >= lo[None]), axis=-1)
+    assert sorted(zip(ic.tolist(), io.tolist())) == sorted(zip(*np.nonzero(toca)))
+
+
+def test_choque_propio():
+    # 3R planar de eslabones iguales: estirado no choca; doblado dos veces,
+    # el eslabón 3 vuelve sobre el 1 (no contiguos)
+    cadena = CadenaSerial([[0, 0, 10, 0]] * 3, 'RRR')
+    modelo = ModeloColision(cadena, {'e1': (0, 1, 0.5), 'e2': (1, 2, 0.5), 'e3': (2, 3, 0.5)})
+    choque, propio, contra = modelo.verificar(np.array([[0.0, 0.0, 0.0], [0.0, 180.0, 180.0]]))
+    np.testing.assert_array_equal(propio, [False, True])
+    np.testing.assert_array_equal(contra, [False, False])
+    np.testing.assert_array_equal(choque, propio)
+
+
+def test_choque_contra_caja_y_margen():
+    # Planar 2R estirado sobre +x (de 0 a 25), radio del eslabón 2 = 0.8
+    modelo = ModeloColision(planar_2r(), {'eslabon1': (0, 1, 1.0), 'eslabon2': (1, 2, 0.8)})
+    q = np.zeros(2)
+    encima = Obstaculos.desde_vertices(CAJA + [17.0, -1.0, -1.5])   # atraviesa el eslabón 2
+    al_lado = Obstaculos.desde_vertices(CAJA + [17.0, 2.0, -1.5])   # a 2 del eje x
+    assert modelo.verificar(q, encima)[2]
+    assert not modelo.verificar(q, al_lado)[2]
+    assert modelo.verificar(q, al_lado, margen=1.5)[2]
+
+
+def test_modelo_scara_en_reposo():
+    # Brazos estirados a la altura de la base, sin obstáculos: sin choque propio
+    modelo = modelo_scara()
+    choque, propio, contra = modelo.verificar(np.array([0.0, 0.0, 880.0, 0.0]))
+    assert not choque and not propio and not contra
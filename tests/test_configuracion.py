@@ -0,0 +1,95 @@
+"""
+robotica.configuracion: desde_argv() con CLAVE=valor y archivos
+.json/.jsonl/.csv, conversión de tipos, errores con el nombre de la
+variante, y ruta_variante() para las salidas de cada variante.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.configuracion import DH_2R, SCARA, cargar, desde_argv, ruta_variante
+
+
+def test_sin_argumentos_pregunta():
+    assert desde_argv([], SCARA) is None
+
+
+def test_clave_valor_con_defectos():
+    (v,) = desde_argv(['A1=700', 'frames=60', 'theta2_final=45,5'], SCARA)
+    assert v == {**SCARA, 'A1': 700.0, 'frames': 60, 'theta2_final': 45.5, 'nombre': None}
+    assert isinstance(v['frames'], int) and isinstance(v['A1'], float)
+
+
+@pytest.mark.parametrize('argv, mensaje', [
+    (['A3=1'], "parámetro desconocido 'A3'"),
+    (['A1=abc'], "A1='abc' no es un número válido"),
+    (['frames=2.5'], "frames='2.5' no es un número válido"),
+    (['variantes.txt'], "argumento no reconocido 'variantes.txt'"),
+])
+def test_errores_de_linea_de_comandos(argv, mensaje):
+    with pytest.raises(ValueError, match=mensaje):
+        desde_argv(argv, SCARA)
+
+
+def test_obligatorios():
+    with pytest.raises(ValueError, match="parámetros: faltan a1, a2"):
+        desde_argv(['theta1=30', 'theta2=45'], DH_2R)
+    (v,) = desde_argv(['theta1=30', 'theta2=45', 'a1=1', 'a2=2'], DH_2R)
+    assert v == {'theta1': 30.0, 'theta2': 45.0, 'a1': 1.0, 'a2': 2.0, 'nombre': None}
+
+
+def escribir(ruta, texto):
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(texto)
+    return str(ruta)
+
+
+def test_json_comun_y_variantes(tmp_path):
+    ruta = escribir(tmp_path / 'v.json', json.dumps(
+        {'comun': {'frames': 30}, 'variantes': [{'nombre': 'corto', 'A1': 600}, {'A2': 900}]}))
+    a, b = desde_argv([ruta, 'theta3_total=720'], SCARA)
+    assert (a['nombre'], a['A1'], a['frames'], a['theta3_total']) == ('corto', 600.0, 30, 720.0)
+    assert (b['nombre'], b['A2'], b['frames'], b['theta3_total']) == ('001', 900.0, 30, 720.0)
+
+
+def test_json_objeto_y_lista(tmp_path):
+    uno = escribir(tmp_path / 'uno.json', json.dumps({'A1': 650}))
+    lista = escribir(tmp_path / 'lista.json', json.dumps([{'A1': 1}, {'A1': 2}]))
+    assert [v['A1'] for v in cargar(uno, SCARA)] == [650.0]
+    # Varios archivos se concatenan; los nombres siguen la posición global
+    variantes = cargar([uno, lista], SCARA)
+    assert [(v['nombre'], v['A1']) for v in variantes] == [('000', 650.0), ('001', 1.0), ('002', 2.0)]
+
+
+def test_jsonl_y_csv(tmp_path):
+    jsonl = escribir(tmp_path / 'v.jsonl', '{"theta1": 10, "theta2": 20, "a1": 1, "a2": 1}\n\n'
+                                           '{"theta1": 30, "theta2": 40, "a1": 2, "a2": 2}\n')
+    assert [v['theta1'] for v in desde_argv([jsonl], DH_2R)] == [10.0, 30.0]
+
+    # Celdas vacías toman el valor por defecto; coma decimal entre comillas
+    csv = escribir(tmp_path / 'v.csv', 'nombre,A1,frames,R_PLATILLO\nx,700,,"120,5"\n,,10,\n')
+    x, y = desde_argv([csv], SCARA)
+    assert (x['nombre'], x['A1'], x['frames'], x['R_PLATILLO']) == ('x', 700.0, 240, 120.5)
+    assert (y['nombre'], y['A1'], y['frames']) == ('001', 715.0, 10)
+
+
+def test_error_lleva_el_nombre_de_la_variante(tmp_path):
+    ruta = escribir(tmp_path / 'v.jsonl', '{"A1": 1}\n{"nombre": "mala", "A1": "x"}\n')
+    with pytest.raises(ValueError, match="variante mala: A1='x'"):
+        desde_argv([ruta], SCARA)
+
+
+@pytest.mark.parametrize('base, nombre, esperado', [
+    ('salida.gif', '003', 'salida_003.gif'),
+    ('dir/salida.rtray', 'a', 'dir/salida_a.rtray'),
+    ('fotogramas/', '003', os.path.join('fotogramas', '003') + os.sep),
+    ('fotogramas', 'b', os.path.join('fotogramas', 'b') + os.sep),
+    ('salida.gif', None, 'salida.gif'),
+    (None, '003', None),
+])
+def test_ruta_variante(base, nombre, esperado):
+    assert ruta_variante(base, nombre) == esperado
@@ -0,0 +1,107 @@
+"""
+robotica.esferico contra la cinemática directa original del script
+(Animación de robot esférico.py): T1 = Rz(θ1)·Ry(θ2)·Tx(L1),
+T2 = T1·Ry(-θ3)·Tx(L2) con matrices 4x4, una pose a la vez; y la ida
+y vuelta ik_esferico -> fk_esferico en las cuatro ramas.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.esferico import L1, L2, RAMAS, fk_esferico, ik_esferico, tabla_poses
+
+TOL = 1e-12
+
+
+def rot_z(angulo):
+    c, s = np.cos(np.deg2rad(angulo)), np.sin(np.deg2rad(angulo))
+    return np.array([[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+
+
+def rot_y(angulo):
+    c, s = np.cos(np.deg2rad(angulo)), np.sin(np.deg2rad(angulo))
+    return np.array([[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]])
+
+
+def trasl_x(L):
+    T = np.eye(4)
+    T[0, 3] = L
+    return T
+
+
+def forward_kinematics(theta1, theta2, theta3):
+    # Cinemática directa del script original (matrices 4x4, sin vectorizar)
+    T1 = rot_z(theta1) @ rot_y(theta2) @ trasl_x(L1)
+    T2 = T1 @ rot_y(-theta3) @ trasl_x(L2)
+    origen = np.array([0, 0, 0, 1])
+    return origen[:3], (T1 @ origen)[:3], (T2 @ origen)[:3]
+
+
+@pytest.fixture
+def angulos():
+    rng = np.random.default_rng(0)
+    aleatorios = rng.uniform(-360, 360, (500, 3))
+    # Múltiplos de 90°, donde sincosd es exacta y np.cos/np.sin no
+    rejilla = range(-180, 181, 90)
+    exactos = np.array([[a, b, c] for a in rejilla for b in rejilla for c in rejilla])
+    return np.vstack([aleatorios, exactos])
+
+
+def test_tabla_igual_a_matrices(angulos):
+    poses = tabla_poses(angulos[:, 0], angulos[:, 1], angulos[:, 2])
+    for fila, q in zip(poses, angulos):
+        for campo, esperado in zip(('p0', 'p1', 'p2'), forward_kinematics(*q)):
+            np.testing.assert_allclose(fila[campo], esperado, rtol=0, atol=TOL)
+
+
+
+def objetivos_alcanzables(n, semilla=1):
+    # Direcciones al azar y distancias dentro del anillo |L1 - L2| < r < L1 + L2
+    rng = np.random.default_rng(semilla)
+    direccion = rng.normal(size=(n, 3))
+    direccion /= np.linalg.norm(direccion, axis=1, keepdims=True)
+    return direccion * rng.uniform(abs(L1 - L2) + 1e-3, L1 + L2 - 1e-3, (n, 1))
+
+
+def test_ik_ida_y_vuelta_cuatro_ramas():
+    objetivos = objetivos_alcanzables(5000)
+    sol, validas = ik_esferico(objetivos)
+    assert sol.shape == (len(objetivos), len(RAMAS), 3)
+    assert validas.all()
+    for k, rama in enumerate(RAMAS):
+        _, p1, p2 = fk_esferico(sol[:, k, 0], sol[:, k, 1], sol[:, k, 2])
+        np.testing.assert_allclose(p2, objetivos, rtol=0, atol=1e-9, err_msg=rama)
+        if rama.endswith('arriba'):
+            # El codo de la rama "arriba" nunca queda más bajo que el de su pareja
+            _, p1_abajo, _ = fk_esferico(*sol[:, k + 1].T)
+            assert np.all(p1[:, 2] >= p1_abajo[:, 2] - 1e-9)
+
+
+def test_ik_hombro_atras_gira_180():
+    sol, _ = ik_esferico(objetivos_alcanzables(500))
+    giro = np.mod(sol[:, RAMAS.index('atras-abajo'), 0] - sol[:, RAMAS.index('frente-abajo'), 0], 360.0)
+    np.testing.assert_allclose(giro, 180.0, atol=1e-9)
+
+
+def test_ik_fuera_de_alcance():
+    rng = np.random.default_rng(2)
+    direccion = rng.normal(size=(200, 3))
+    direccion /= np.linalg.norm(direccion, axis=1, keepdims=True)
+    lejos = direccion * rng.uniform(L1 + L2 + 0.1, 3 * (L1 + L2), (200, 1))
+    cerca = direccion * rng.uniform(0.0, abs(L1 - L2) - 0.1, (200, 1))
+    objetivos = np.vstack([lejos, cerca, objetivos_alcanzables(200)])
+
+    sol, validas = ik_esferico(objetivos)
+    assert not validas[:400].any()
+    assert validas[400:].all()
+    # Fuera de alcance cada rama es la postura más cercana: brazo estirado
+    # hacia el objetivo lejano, o doblado sobre sí mismo hacia el cercano
+    assert np.isfinite(sol).all()
+    for k in range(len(RAMAS)):
+        _, _, p2 = fk_esferico(*sol[:, k].T)
+        np.testing.assert_allclose(p2[:200], direccion * (L1 + L2), atol=1e-9)
+        np.testing.assert_allclose(np.linalg.norm(p2[200:400], axis=1), abs(L1 - L2), atol=1e-9)
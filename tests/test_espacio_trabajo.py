@@ -0,0 +1,161 @@
+"""
+robotica.espacio_trabajo: el mapa de alcance contiene toda punta que la
+cinemática directa puede alcanzar y coincide con la forma cerrada del
+espacio de trabajo (corona, cascarón, cilindro hueco) lejos del borde;
+la caché en disco se escribe en el primer uso, se reutiliza después y
+se invalida al cambiar los parámetros.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RAIZ)
+from robotica import esferico, espacio_trabajo, planar, scara
+from robotica.espacio_trabajo import barrer, clave_cache, mapa_alcance
+
+N = 20000
+
+# robot -> (tamaño de vóxel para el test, punta(q) de referencia, rangos articulares)
+CASOS = {
+    'planar': (0.25, lambda q: planar.fk_planar(q[:, 0], q[:, 1])[1],
+               [(-180, 180), (-180, 180)]),
+    'esferico': (1.0, lambda q: esferico.fk_esferico(q[:, 0], q[:, 1], q[:, 2])[2],
+                 [(-180, 180), (-180, 180), (-180, 180)]),
+    'scara': (40.0, lambda q: scara.puntos_analiticos(q[:, 0], q[:, 1], q[:, 2], 715.0, 850.0)[2],
+              [(-180, 180), (-180, 180), (418.5, 880.0)]),
+}
+
+
+@pytest.fixture(scope='module', params=sorted(CASOS))
+def caso(request):
+    robot = request.param
+    tam_voxel, punta, rangos = CASOS[robot]
+    return robot, barrer(robot, tam_voxel=tam_voxel), punta, rangos
+
+
+def distancia_borde(robot, p):
+    # Distancia de cada punto al borde de la forma cerrada: > 0 dentro, < 0 fuera
+    if robot == 'planar':
+        r = np.hypot(p[:, 0], p[:, 1])
+        return np.minimum(r - 5.0, 25.0 - r)
+    if robot == 'esferico':
+        r = np.linalg.norm(p, axis=1)
+        return np.minimum(r - 2.0, 28.0 - r)
+    r = np.hypot(p[:, 0], p[:, 1])
+    z_min, z_max = -40.0 + 418.5 + scara.LP, -40.0 + 880.0 + scara.LP
+    return np.minimum.reduce([r - 135.0, 1565.0 - r, p[:, 2] - z_min, z_max - p[:, 2]])
+
+
+def puntos_al_azar(robot, rng):
+    # Puntos en la caja envolvente de cada robot (un poco más grande que su alcance)
+    if robot == 'planar':
+        return np.column_stack([rng.uniform(-30, 30, (N, 2)), np.zeros(N)])
+    if robot == 'esferico':
+        return rng.uniform(-32, 32, (N, 3))
+    return np.column_stack([rng.uniform(-1700, 1700, (N, 2)), rng.uniform(600, 1260, N)])
+
+
+def test_contiene_las_puntas_alcanzadas(caso):
+    # Poses al azar (no las de la rejilla articular): su punta cae en un vóxel ocupado,
+    # salvo vóxeles del borde que el espacio de trabajo apenas roza
+    robot, mapa, punta, rangos = caso
+    rng = np.random.default_rng(0)
+    q = np.column_stack([rng.uniform(lo, hi, N) for lo, hi in rangos])
+    p = punta(q)
+    dentro = distancia_borde(robot, p)
+    alcanzable = mapa.alcanzable(p)
+    assert alcanzable[dentro > mapa.tam_voxel / 2].all()
+    assert alcanzable.mean() > 0.99
+    # Los extremos de cada rango articular también
+    assert mapa.alcanzable(punta(np.array(rangos, dtype=float).T)).all()
+
+
+def test_igual_a_la_forma_cerrada(caso):
+    # A más de dos diagonales de vóxel del borde, el mapa y la forma cerrada coinciden
+    robot, mapa, _, _ = caso
+    p = puntos_al_azar(robot, np.random.default_rng(1))
+    dentro = distancia_borde(robot, p)
+    margen = 2 * np.sqrt(3) * mapa.tam_voxel
+    alcanzable = mapa.alcanzable(p)
+    assert alcanzable[dentro > margen].all()
+    assert not alcanzable[dentro < -margen].any()
+    assert (dentro > margen).any() and (dentro < -margen).any()
+
+
+def test_fuera_de_la_rejilla(caso):
+    _, mapa, _, _ = caso
+    assert not mapa.alcanzable([[1e6, 0.0, 0.0], [0.0, -1e6, 0.0], [0.0, 0.0, 1e6]]).any()
+    assert mapa.alcanzable(np.zeros((4, 5, 3))).shape == (4, 5)
+
+
+@pytest.fixture
+def conteo(monkeypatch, tmp_path):
+    # DIRECTORIO_CACHE en tmp_path y cuántas veces se barre de verdad
+    monkeypatch.setattr(espacio_trabajo, 'DIRECTORIO_CACHE', str(tmp_path))
+    llamadas = []
+    original = espacio_trabajo.barrer
+
+    def barrer_contando(*args, **kwargs):
+        llamadas.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(espacio_trabajo, 'barrer', barrer_contando)
+    return llamadas
+
+
+def test_cache_fallo_y_acierto(conteo, tmp_path):
+    nombre, _ = clave_cache('planar', {'L1': 12.0}, 0.5)
+    primero = mapa_alcance('planar', {'L1': 12.0}, 0.5)
+    assert len(conteo) == 1
+    assert sorted(os.listdir(tmp_path)) == [nombre + '.json', nombre + '.npy']
+
+    segundo = mapa_alcance('planar', {'L1': 12.0}, 0.5)
+    assert len(conteo) == 1                       # acierto: no se barre otra vez
+    assert isinstance(segundo.ocupacion, np.memmap)
+    np.testing.assert_array_equal(segundo.ocupacion, primero.ocupacion)
+    np.testing.assert_array_equal(segundo.origen, primero.origen)
+    assert segundo.tam_voxel == primero.tam_voxel
+    np.testing.assert_array_equal(segundo.ocupacion, barrer('planar', {'L1': 12.0}, 0.5).ocupacion)
+
+
+def test_cache_se_invalida_con_los_parametros(conteo, tmp_path):
+    mapa_alcance('planar', {'L1': 12.0}, 0.5)
+    # Otro eslabón, otro vóxel u otros rangos: otra clave, se barre de nuevo
+    mapa_alcance('planar', {'L1': 13.0}, 0.5)
+    mapa_alcance('planar', {'L1': 12.0}, 1.0)
+    mapa_alcance('planar', {'L1': 12.0}, 0.5, rangos=[(-90, 90), (-180, 180)])
+    assert len(conteo) == 4
+    assert len(os.listdir(tmp_path)) == 8
+    # Los valores por defecto explícitos dan la misma clave que omitirlos
+    mapa_alcance('planar', {'L1': 12.0, 'L2': planar.L2}, 0.5)
+    assert len(conteo) == 4
+    # recalcular=True ignora la caché y la reescribe
+    mapa_alcance('planar', {'L1': 12.0}, 0.5, recalcular=True)
+    assert len(conteo) == 5 and len(os.listdir(tmp_path)) == 8
+
+
+def test_cache_incompleta_se_recalcula(conteo, tmp_path):
+    # Sin el .json (p. ej. una escritura interrumpida) el .npy no se usa
+    nombre, _ = clave_cache('planar', None, 0.5)
+    mapa_alcance('planar', tam_voxel=0.5)
+    os.remove(tmp_path / (nombre + '.json'))
+    mapa_alcance('planar', tam_voxel=0.5)
+    assert len(conteo) == 2
+    assert (tmp_path / (nombre + '.json')).exists()
+
+
+def test_variable_de_entorno(tmp_path):
+    # ROBOTICA_CACHE fija el directorio al importar el módulo
+    codigo = ("from robotica import espacio_trabajo as e; "
+              "print(e.DIRECTORIO_CACHE); e.mapa_alcance('planar', tam_voxel=1.0)")
+    entorno = dict(os.environ, ROBOTICA_CACHE=str(tmp_path / 'cache'))
+    salida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, env=entorno,
+                            capture_output=True, text=True, check=True).stdout
+    assert salida.strip() == str(tmp_path / 'cache')
+    nombre, _ = clave_cache('planar', None, 1.0)
+    assert (tmp_path / 'cache' / (nombre + '.npy')).exists()
@@ -0,0 +1,79 @@
+"""
+robotica.estela: el rastro crece hasta su largo y desde ahí los puntos
+más viejos se van descartando (la cola se desvanece) mientras la vista
+sigue siendo los últimos puntos en orden, sin copiar el buffer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica import estela as modulo
+from robotica.estela import Estela, largo_estela
+
+
+@pytest.fixture
+def puntos():
+    return np.random.default_rng(0).uniform(-10, 10, (250, 3))
+
+
+@pytest.mark.parametrize('largo', [1, 7, 100, 250, 400])
+def test_largo_y_orden(puntos, largo):
+    estela = Estela(largo)
+    for k, p in enumerate(puntos, start=1):
+        estela.agregar(p)
+        n = min(k, largo)
+        assert len(estela) == n
+        # Los últimos n puntos, del más viejo al más nuevo
+        np.testing.assert_array_equal(estela.vista(), puntos[k - n:k].T)
+
+
+def test_los_viejos_se_descartan(puntos):
+    estela = Estela(50)
+    for p in puntos:
+        estela.agregar(p)
+    vista = estela.vista()
+    assert vista.shape == (3, 50)
+    # Ningún punto anterior a la ventana queda en el rastro
+    fuera = puntos[:-50]
+    assert not np.any(np.all(vista.T[:, None] == fuera[None], axis=-1))
+
+
+def test_vista_sin_copia(puntos):
+    estela = Estela(10)
+    for p in puntos[:25]:
+        estela.agregar(p)
+    antes = estela.vista()
+    estela.agregar(puntos[25])
+    despues = estela.vista()
+    # Ambas son ventanas del mismo buffer, no copias
+    assert antes.base is not None and np.shares_memory(antes, despues)
+    np.testing.assert_array_equal(despues, puntos[16:26].T)
+
+
+def test_vaciar_reinicia_el_rastro(puntos):
+    estela = Estela(10)
+    for p in puntos[:15]:
+        estela.agregar(p)
+    estela.vaciar()
+    assert len(estela) == 0 and estela.vista().shape == (3, 0)
+    estela.agregar(puntos[20])
+    np.testing.assert_array_equal(estela.vista(), puntos[20:21].T)
+
+
+def test_dim_y_largo_invalido():
+    estela = Estela(4, dim=2)
+    estela.agregar([1.0, 2.0])
+    assert estela.vista().shape == (2, 1)
+    with pytest.raises(ValueError, match=">= 1"):
+        Estela(0)
+
+
+def test_largo_desde_el_entorno(monkeypatch):
+    monkeypatch.setattr(modulo, 'LARGO', None)
+    assert largo_estela(200) == 200
+    monkeypatch.setattr(modulo, 'LARGO', 30)     # ROBOTICA_ESTELA=30
+    assert largo_estela(200) == 30
@@ -0,0 +1,96 @@
+"""
+robotica.ik_numerica: ik_dls converge a objetivos alcanzables (posición
+y pose), ik_camino arranca cada muestra de la anterior (pocas
+iteraciones, sin saltos de rama) y, fuera del alcance, el residuo
+reportado es la distancia real que queda.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.cadena import planar_2r, scara
+from robotica.cartesiano import linea
+from robotica.ik_numerica import MAX_ITER, TOLERANCIA, ik_camino, ik_dls
+
+LIMITES = [[-360, 360], [-360, 360], [418.5, 880.0], [-360, 360]]
+Q0 = np.array([30.0, 45.0, 700.0, 0.0])
+N = 300
+
+
+@pytest.fixture(scope='module')
+def robot():
+    return scara()
+
+
+@pytest.fixture(scope='module')
+def poses():
+    # Poses conocidas y semillas a ±20° (±100 mm en la prismática) de ellas
+    rng = np.random.default_rng(0)
+    q = np.column_stack([rng.uniform(-150, 150, (N, 2)), rng.uniform(450, 850, N),
+                         rng.uniform(-150, 150, N)])
+    return q, q + rng.uniform(-20, 20, q.shape) * [1, 1, 5, 1]
+
+
+def test_converge_a_posiciones(robot, poses):
+    q_real, semillas = poses
+    objetivos = robot.fk(q_real)[:, :3, 3]
+    q, it, res, ok = ik_dls(robot, objetivos, semillas, limites=LIMITES)
+    assert ok.all() and it.max() < MAX_ITER
+    assert np.all(res <= TOLERANCIA)
+    np.testing.assert_allclose(robot.fk(q)[:, :3, 3], objetivos, rtol=0, atol=1e-5)
+    assert np.all((q[:, 2] >= 418.5) & (q[:, 2] <= 880.0))
+
+
+def test_converge_a_poses_scara(robot, poses):
+    # Pose completa con las filas que el SCARA puede controlar: x, y, z y giro en z
+    q_real, semillas = poses
+    objetivos = robot.fk(q_real)
+    q, it, res, ok = ik_dls(robot, objetivos, semillas, filas=(0, 1, 2, 5), limites=LIMITES)
+    assert ok.all()
+    np.testing.assert_allclose(robot.fk(q), objetivos, rtol=0, atol=1e-5)
+
+
+@pytest.fixture(scope='module')
+def camino(robot):
+    return linea(robot.fk(Q0)[:3, 3], [900.0, 600.0, 1000.0], np.linspace(0, 1, 400))
+
+
+@pytest.mark.parametrize('cada, max_it', [(1, 2), (16, 3)])
+def test_camino_warm_start(robot, camino, cada, max_it):
+    q, it, res, ok = ik_camino(robot, camino, Q0, limites=LIMITES, cada=cada)
+    assert ok.all()
+    np.testing.assert_allclose(robot.fk(q)[:, :3, 3], camino, rtol=0, atol=1e-5)
+    # Cada muestra arranca junto a su solución: pocas iteraciones
+    assert it[1:].max() <= max_it
+    # Misma rama a lo largo del camino: sin saltos entre muestras consecutivas
+    assert np.abs(np.diff(q[:, :2], axis=0)).max() < 1.0
+
+
+def test_camino_menos_iteraciones_que_en_frio(robot, camino):
+    _, it_frio, _, _ = ik_dls(robot, camino, Q0, limites=LIMITES)
+    _, it_warm, _, _ = ik_camino(robot, camino, Q0, limites=LIMITES)
+    assert it_warm.sum() < it_frio.sum()
+
+
+def test_residuo_fuera_de_alcance():
+    # Planar 2R (alcance 25): objetivos a 30–60 del origen
+    robot = planar_2r()
+    rng = np.random.default_rng(1)
+    angulo = rng.uniform(-180, 180, 50)
+    d = rng.uniform(30, 60, 50)
+    objetivos = np.column_stack([d * np.cos(np.deg2rad(angulo)), d * np.sin(np.deg2rad(angulo)),
+                                 np.zeros(50)])
+    semillas = np.column_stack([angulo + rng.uniform(-60, 60, 50), rng.uniform(10, 60, 50)])
+    q, it, res, ok = ik_dls(robot, objetivos, semillas)
+
+    assert not ok.any() and np.all(it == MAX_ITER)
+    # El residuo es el error de la q que se regresa...
+    np.testing.assert_allclose(res, np.linalg.norm(objetivos - robot.fk(q)[:, :3, 3], axis=-1),
+                               rtol=1e-12)
+    # ...nunca menor que la distancia al espacio de trabajo, y el brazo queda casi estirado hacia el objetivo
+    assert np.all(res >= d - 25.0 - 1e-9)
+    np.testing.assert_allclose(res, d - 25.0, rtol=0, atol=0.5)
@@ -0,0 +1,107 @@
+"""
+robotica.perfiles: los perfiles trapezoidal y triangular respetan los
+límites de velocidad y aceleración de cada articulación, llegan juntos
+al punto final y sus q', q'' son las derivadas de q; los perfiles
+normalizados empiezan y terminan donde deben.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.perfiles import TIPOS, duracion_trapezoidal, muestras, perfil, rampa, trapezoidal
+
+EPS = 1e-9
+N = 20001
+
+
+def comprobar_limites(q0, qf, vmax, amax):
+    T = duracion_trapezoidal(q0, qf, vmax, amax)
+    t = np.linspace(0.0, T, N)
+    q, qd, qdd, T2 = trapezoidal(q0, qf, t, vmax, amax)
+    assert T2 == T
+    vmax, amax = np.broadcast_to(vmax, q.shape[1:]), np.broadcast_to(amax, q.shape[1:])
+    assert np.all(np.abs(qd) <= vmax + EPS)
+    assert np.all(np.abs(qdd) <= amax + EPS)
+    # Extremos: posición exacta y reposo
+    np.testing.assert_allclose(q[0], q0, rtol=0, atol=EPS)
+    np.testing.assert_allclose(q[-1], qf, rtol=0, atol=1e-9 * max(1.0, np.abs(qf).max()))
+    np.testing.assert_allclose(qd[[0, -1]], 0.0, atol=1e-9 * vmax.max())
+    # q' y q'' son las derivadas numéricas de q y q'
+    dt = t[1] - t[0]
+    np.testing.assert_allclose(np.gradient(q, dt, axis=0)[1:-1], qd[1:-1], rtol=0,
+                               atol=2 * amax.max() * dt)
+    return T, q, qd, qdd
+
+
+def test_trapezoidal_alcanza_crucero():
+    # D = 180 con vmax = 60, amax = 120: acelera 0.5 s, crucero 2.5 s, frena 0.5 s
+    T, q, qd, qdd = comprobar_limites([0.0], [180.0], 60.0, 120.0)
+    assert T == pytest.approx(180 / 60 + 60 / 120)
+    assert np.abs(qd).max() == pytest.approx(60.0)
+    assert np.count_nonzero(qdd == 0) > N / 2       # tramo de crucero
+
+
+def test_triangular_no_alcanza_vmax():
+    # D = 10 < vmax²/amax = 30: triángulo, pico sqrt(D·a) < vmax
+    T, q, qd, qdd = comprobar_limites([5.0], [-5.0], 60.0, 120.0)
+    assert T == pytest.approx(2 * np.sqrt(10 / 120))
+    assert np.abs(qd).max() == pytest.approx(np.sqrt(10 * 120), rel=1e-3)
+    assert np.abs(qd).max() < 60.0
+    # Sin crucero: acelera o frena a amax en todo instante salvo el pico
+    assert np.count_nonzero(np.abs(qdd) != 120.0) <= 1
+
+
+def test_varias_articulaciones_sincronizadas():
+    # Una larga (trapecio), una corta (más lenta de lo que podría), una que no se mueve
+    q0, qf = np.array([0.0, 10.0, 3.0]), np.array([270.0, 25.0, 3.0])
+    vmax, amax = np.array([90.0, 30.0, 10.0]), np.array([180.0, 60.0, 10.0])
+    T, q, qd, qdd = comprobar_limites(q0, qf, vmax, amax)
+    assert T == pytest.approx(270 / 90 + 90 / 180)       # manda la articulación 0
+    np.testing.assert_array_equal(q[:, 2], 3.0)
+    # Cada articulación sigue a su aceleración máxima y sólo la más lenta llega a vmax
+    assert np.abs(qd[:, 0]).max() == pytest.approx(90.0)
+    assert np.abs(qd[:, 1]).max() < 30.0
+    np.testing.assert_allclose(np.abs(qdd[:, :2]).max(axis=0), amax[:2])
+
+
+def test_sin_movimiento():
+    q, qd, qdd, T = trapezoidal([1.0, 2.0], [1.0, 2.0], np.linspace(0, 1, 5), 10.0, 10.0)
+    assert T == 0
+    np.testing.assert_array_equal(q, [[1.0, 2.0]] * 5)
+    assert not qd.any() and not qdd.any()
+
+
+def test_satura_fuera_del_intervalo():
+    T = duracion_trapezoidal(0.0, 90.0, 60.0, 120.0)
+    q, qd, _, _ = trapezoidal(0.0, 90.0, [-1.0, T + 1.0], 60.0, 120.0)
+    np.testing.assert_allclose(q[:, 0], [0.0, 90.0], atol=EPS)
+    np.testing.assert_allclose(qd, 0.0, atol=EPS)
+
+
+@pytest.mark.parametrize('tipo', TIPOS)
+def test_perfiles_extremos(tipo):
+    q0, qf = np.array([0.0, 880.0]), np.array([90.0, 418.5])
+    q, qd, qdd = perfil(q0, qf, np.linspace(0, 2.0, 401), 2.0, tipo)
+    np.testing.assert_allclose(q[0], q0, atol=EPS)
+    np.testing.assert_allclose(q[-1], qf, atol=EPS)
+    if tipo != 'lineal':
+        np.testing.assert_allclose(qd[[0, -1]], 0.0, atol=EPS)
+    if tipo == 'quintico':
+        np.testing.assert_allclose(qdd[[0, -1]], 0.0, atol=EPS)
+
+
+def test_rampa_lineal_es_linspace():
+    np.testing.assert_array_equal(rampa([880, 0, 0], [418.5, 90, 360], 240, 'lineal'),
+                                  np.linspace([880, 0, 0], [418.5, 90, 360], 240))
+    assert rampa([0.0], [1.0], 7, 'quintico').shape == (7, 1)
+    with pytest.raises(ValueError, match="perfil desconocido"):
+        perfil(0.0, 1.0, [0.0], 1.0, 'escalon')
+
+
+def test_muestras():
+    t = muestras(2.0, 25)
+    assert t[0] == 0.0 and t[-1] == 2.0 and len(t) == 51
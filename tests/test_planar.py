@@ -0,0 +1,84 @@
+"""
+robotica.planar contra la cinemática directa original del script
+(Animación de robot planar.py): producto T1 · T2 de matrices homogéneas
+4x4, una pose a la vez; e ik_planar contra fk_planar (ida y vuelta).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.planar import L1, L2, fk_planar, ik_planar, tabla_poses
+
+TOL = 1e-12
+
+
+def forward_kinematics(theta1, theta2):
+    # Cinemática directa del script original (matrices 4x4, sin vectorizar)
+    c1, s1 = np.cos(np.deg2rad(theta1)), np.sin(np.deg2rad(theta1))
+    c2, s2 = np.cos(np.deg2rad(theta2)), np.sin(np.deg2rad(theta2))
+    T1 = np.array([[c1, -s1, 0, L1*c1],
+                   [s1,  c1, 0, L1*s1],
+                   [0,   0,  1, 0],
+                   [0,   0,  0, 1]])
+    T2 = np.array([[c2, -s2, 0, L2*c2],
+                   [s2,  c2, 0, L2*s2],
+                   [0,   0,  1, 0],
+                   [0,   0,  0, 1]])
+    origen = np.array([0, 0, 0, 1])
+    return origen[:3], (T1 @ origen)[:3], (T1 @ T2 @ origen)[:3]
+
+
+@pytest.fixture
+def angulos():
+    rng = np.random.default_rng(0)
+    aleatorios = rng.uniform(-360, 360, (500, 2))
+    # Múltiplos de 90°, donde sincosd es exacta y np.cos/np.sin no
+    exactos = np.array([[a, b] for a in range(-180, 181, 90) for b in range(-180, 181, 90)])
+    return np.vstack([aleatorios, exactos])
+
+
+def test_tabla_igual_a_matrices(angulos):
+    poses = tabla_poses(angulos[:, 0], angulos[:, 1])
+    for fila, (t1, t2) in zip(poses, angulos):
+        for campo, esperado in zip(('p0', 'p1', 'p2'), forward_kinematics(t1, t2)):
+            np.testing.assert_allclose(fila[campo], esperado, rtol=0, atol=TOL)
+
+
+
+def objetivos_alcanzables(n, semilla):
+    # Puntos en el anillo L1 - L2 <= r <= L1 + L2, incluidos los bordes
+    rng = np.random.default_rng(semilla)
+    r = rng.uniform(L1 - L2, L1 + L2, n)
+    r[:2] = L1 - L2, L1 + L2
+    phi = rng.uniform(-np.pi, np.pi, n)
+    return r*np.cos(phi), r*np.sin(phi)
+
+
+def test_ik_ida_y_vuelta_dos_ramas():
+    x, y = objetivos_alcanzables(2000, 1)
+    arriba, abajo, alcanzable = ik_planar(x, y)
+    assert alcanzable.all()
+    assert np.all(arriba[:, 1] >= 0) and np.all(abajo[:, 1] <= 0)
+    objetivo = np.column_stack([x, y, np.zeros_like(x)])
+    for sol in (arriba, abajo):
+        _, p2 = fk_planar(sol[:, 0], sol[:, 1])
+        np.testing.assert_allclose(p2, objetivo, rtol=0, atol=1e-9)
+
+
+def test_ik_fuera_del_espacio_de_trabajo():
+    rng = np.random.default_rng(2)
+    r = np.r_[rng.uniform(0, L1 - L2 - 1e-3, 200), rng.uniform(L1 + L2 + 1e-3, 60, 200)]
+    phi = rng.uniform(-np.pi, np.pi, r.size)
+    arriba, abajo, alcanzable = ik_planar(r*np.cos(phi), r*np.sin(phi))
+    assert not alcanzable.any()
+    # Postura más cercana: el brazo estirado o doblado en la dirección del objetivo
+    for sol in (arriba, abajo):
+        _, p2 = fk_planar(sol[:, 0], sol[:, 1])
+        borde = np.where(r > L1, L1 + L2, L1 - L2)
+        np.testing.assert_allclose(np.linalg.norm(p2, axis=-1), borde, rtol=0, atol=1e-9)
+        direccion = p2[:, :2] / np.linalg.norm(p2[:, :2], axis=-1, keepdims=True)
+        np.testing.assert_allclose(direccion, np.column_stack([np.cos(phi), np.sin(phi)]), rtol=0, atol=1e-9)
@@ -0,0 +1,101 @@
+"""
+robotica.registro: escribir por partes y reabrir para anexar, descartar
+una fila incompleta al final (corrida interrumpida), y escribir de una
+vez una tabla de poses con sus campos vectoriales.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.planar import tabla_poses
+from robotica.registro import (ALINEACION, EscritorTrayectoria, escribir_trayectoria,
+                               leer_cabecera, leer_trayectoria)
+
+COLUMNAS = ['theta1', 'theta2']
+
+
+@pytest.fixture
+def angulos():
+    rng = np.random.default_rng(0)
+    return rng.uniform(-180, 180, (100, 2))
+
+
+def test_escribir_por_partes(tmp_path, angulos):
+    ruta = str(tmp_path / 'c.rtray')
+    with EscritorTrayectoria(ruta, COLUMNAS, robot='planar', parametros={'L1': 15.0}) as esc:
+        esc.escribir({'theta1': angulos[:40, 0], 'theta2': angulos[:40, 1]})   # bloque
+        for t1, t2 in angulos[40:50]:
+            esc.escribir({'theta1': t1, 'theta2': t2})                          # fila por fila
+        assert esc.filas == 50
+
+    datos, cabecera = leer_trayectoria(ruta)
+    assert isinstance(datos, np.memmap) and len(datos) == 50
+    assert cabecera['robot'] == 'planar' and cabecera['parametros'] == {'L1': 15.0}
+    np.testing.assert_array_equal(datos['theta1'], angulos[:50, 0])
+    np.testing.assert_array_equal(datos['theta2'], angulos[:50, 1])
+    # Los datos empiezan alineados
+    assert leer_cabecera(ruta)[2] % ALINEACION == 0
+
+
+def test_reabrir_anexa(tmp_path, angulos):
+    ruta = str(tmp_path / 'c.rtray')
+    for inicio in range(0, 100, 25):
+        with EscritorTrayectoria(ruta, COLUMNAS) as esc:
+            esc.escribir({'theta1': angulos[inicio:inicio + 25, 0],
+                          'theta2': angulos[inicio:inicio + 25, 1]})
+    datos, _ = leer_trayectoria(ruta)
+    np.testing.assert_array_equal(np.column_stack([datos['theta1'], datos['theta2']]), angulos)
+
+
+def test_fila_incompleta_se_trunca(tmp_path, angulos):
+    ruta = str(tmp_path / 'c.rtray')
+    with EscritorTrayectoria(ruta, COLUMNAS) as esc:
+        esc.escribir({'theta1': angulos[:30, 0], 'theta2': angulos[:30, 1]})
+    completo = os.path.getsize(ruta)
+    with open(ruta, 'ab') as f:
+        f.write(b'\x00' * 5)            # media fila de una corrida interrumpida
+
+    # La lectura ignora los bytes sobrantes...
+    assert len(leer_trayectoria(ruta)[0]) == 30
+    # ...y al reabrir para anexar se descartan antes de seguir
+    with EscritorTrayectoria(ruta, COLUMNAS) as esc:
+        esc.escribir({'theta1': angulos[30:, 0], 'theta2': angulos[30:, 1]})
+    assert os.path.getsize(ruta) == completo + 70 * 16
+    datos, _ = leer_trayectoria(ruta)
+    np.testing.assert_array_equal(datos['theta2'], angulos[:, 1])
+
+
+def test_otras_columnas_no_se_mezclan(tmp_path, angulos):
+    ruta = str(tmp_path / 'c.rtray')
+    with EscritorTrayectoria(ruta, COLUMNAS) as esc:
+        esc.escribir({'theta1': angulos[:, 0], 'theta2': angulos[:, 1]})
+    with pytest.raises(ValueError, match="ya tiene otras columnas"):
+        EscritorTrayectoria(ruta, COLUMNAS, tipo='f4')
+
+
+def test_escribir_tabla_reemplaza(tmp_path, angulos):
+    ruta = str(tmp_path / 'p.rtray')
+    escribir_trayectoria(ruta, {'theta1': np.zeros(7)})
+    poses = tabla_poses(angulos[:, 0], angulos[:, 1])
+    escribir_trayectoria(ruta, poses, robot='planar', columnas=['theta1', 'p2'], tipo='f4')
+
+    datos, cabecera = leer_trayectoria(ruta)
+    assert len(datos) == 100 and datos.dtype.names == ('theta1', 'p2')
+    assert cabecera['columnas'] == [['theta1', '<f4', []], ['p2', '<f4', [3]]]
+    np.testing.assert_array_equal(datos['p2'], poses['p2'].astype(np.float32))
+
+
+def test_vacia_y_archivo_ajeno(tmp_path):
+    ruta = str(tmp_path / 'v.rtray')
+    EscritorTrayectoria(ruta, COLUMNAS).cerrar()
+    datos, _ = leer_trayectoria(ruta)
+    assert len(datos) == 0 and datos.dtype.names == tuple(COLUMNAS)
+
+    ajeno = tmp_path / 'x.rtray'
+    ajeno.write_bytes(b'no es una trayectoria')
+    with pytest.raises(ValueError, match="no es un archivo de trayectoria"):
+        leer_trayectoria(str(ajeno))
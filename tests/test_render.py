@@ -0,0 +1,86 @@
+"""
+robotica.render: Escena reutiliza los artistas de scatter/caja y los
+mueve a las posiciones nuevas, y renderizar_paralelo exporta todos los
+fotogramas y limpia el trabajo heredado aunque un fotograma falle.
+"""
+
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica import render
+from robotica.cuerpos import CAJA
+from robotica.render import PATRON_PNG, Escena, renderizar_paralelo
+
+
+@pytest.fixture
+def escena():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='3d')
+    ax.set_xlim3d(-10, 10); ax.set_ylim3d(-10, 10); ax.set_zlim3d(-10, 10)
+    yield Escena(ax)
+    plt.close(fig)
+
+
+def proyectados(escena, artista):
+    # Posiciones en pantalla tras dibujar (API pública de la colección)
+    escena.ax.figure.canvas.draw()
+    return np.array(artista.get_offsets())
+
+
+def test_scatter_reutiliza_y_mueve(escena):
+    x, y, z = np.array([1.0, -2.0, 3.0]), np.array([0.0, 4.0, -1.0]), np.array([2.0, 2.0, -5.0])
+    escena.nuevo_fotograma()
+    primero = escena.scatter(x, y, z, color='red')
+    escena.fin_fotograma()
+    escena.nuevo_fotograma()
+    segundo = escena.scatter(x + 1, y, z - 2)
+    escena.fin_fotograma()
+    assert segundo is primero
+
+    referencia = escena.ax.scatter(x + 1, y, z - 2, color='red')
+    np.testing.assert_allclose(proyectados(escena, segundo), proyectados(escena, referencia))
+
+
+def test_caja_reutiliza_y_mueve(escena):
+    escena.nuevo_fotograma()
+    lineas, marcas = escena.caja(CAJA)
+    escena.fin_fotograma()
+    escena.nuevo_fotograma()
+    assert escena.caja(CAJA - 5.0) == (lineas, marcas)
+    escena.fin_fotograma()
+
+    referencia = escena.ax.scatter(*(CAJA - 5.0).T)
+    np.testing.assert_allclose(proyectados(escena, marcas), proyectados(escena, referencia))
+
+
+def dibujar_en(escena, cajas):
+    def dibujar(i):
+        escena.nuevo_fotograma()
+        escena.caja(cajas[i])
+        escena.fin_fotograma()
+    return dibujar
+
+
+def test_renderizar_paralelo_png(escena, tmp_path):
+    cajas = CAJA + np.arange(6)[:, None, None] * [0.5, 0, 0]
+    renderizar_paralelo(escena.ax.figure, dibujar_en(escena, cajas), len(cajas), fps=10,
+                        procesos=2, ruta=str(tmp_path) + os.sep)
+    assert sorted(os.listdir(tmp_path)) == [PATRON_PNG % i for i in range(len(cajas))]
+    assert render._TRABAJO is None
+
+
+def test_renderizar_paralelo_limpia_si_falla(escena, tmp_path):
+    def dibujar(i):
+        if i == 3:
+            raise ValueError("fotograma 3")
+    with pytest.raises(ValueError, match="fotograma 3"):
+        renderizar_paralelo(escena.ax.figure, dibujar, 6, fps=10, procesos=2,
+                            ruta=str(tmp_path) + os.sep)
+    assert render._TRABAJO is None
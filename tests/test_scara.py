@@ -0,0 +1,47 @@
+"""
+robotica.scara.fkine_lote (modos 'dh' y 'analitico') contra fkine(), la
+función del examen que arma las matrices DH una pose a la vez.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.scara import BASE_HEIGHT, fkine, fkine_lote
+
+N = 2000
+TOL = 1e-9     # mm, con coordenadas de hasta ~2000 mm
+PARAMETROS = (715.0, 850.0, BASE_HEIGHT, -40.0, 100.0)   # A1, A2, BASE_HEIGHT, offset, R_PLATILLO
+
+
+@pytest.fixture(scope='module')
+def poses():
+    rng = np.random.default_rng(0)
+    theta1 = rng.uniform(-180, 180, N)
+    theta2 = rng.uniform(-180, 180, N)
+    l_barra_abs = rng.uniform(418.5, 880.0, N)
+    theta3 = rng.uniform(-360, 360, N)
+    # Múltiplos de 90° en θ1, θ2, donde sincosd es exacta
+    theta1[:16] = np.repeat([-180, -90, 0, 90], 4)
+    theta2[:16] = np.tile([-180, -90, 0, 90], 4)
+    return theta1, theta2, l_barra_abs, theta3
+
+
+@pytest.fixture(scope='module')
+def referencia(poses):
+    # Una llamada a fkine() por pose; cada salida apilada en N filas
+    salidas = [fkine(*q, *PARAMETROS) for q in zip(*poses)]
+    return [np.array(campo) for campo in zip(*salidas)]
+
+
+@pytest.mark.parametrize('modo', ['dh', 'analitico'])
+def test_fkine_lote_igual_a_fkine(poses, referencia, modo):
+    lote = fkine_lote(*poses, *PARAMETROS, modo=modo)
+    assert len(lote) == len(referencia)
+    for k, (obtenido, esperado) in enumerate(zip(lote, referencia)):
+        obtenido = np.broadcast_to(obtenido, esperado.shape)
+        np.testing.assert_allclose(obtenido, esperado, rtol=0, atol=TOL,
+                                   err_msg=f"salida {k} de fkine, modo {modo}")
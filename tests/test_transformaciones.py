@@ -0,0 +1,56 @@
+"""
+robotica.transformaciones: el camino con buffer (out=) da las mismas
+matrices que el que reserva memoria, escribe en el buffer que se le pasa
+y no arrastra valores de la llamada anterior; las versiones *_lote
+coinciden con la rotación de un ángulo a la vez.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.transformaciones import (rotx, rotx_h, rotx_lote, roty, roty_h, roty_lote,
+                                       rotz, rotz_h, rotz_lote)
+
+ANGULOS = np.r_[np.arange(-360, 361, 15), np.random.default_rng(0).uniform(-720, 720, 200)]
+
+
+@pytest.mark.parametrize('rot, n', [(rotx, 3), (roty, 3), (rotz, 3),
+                                    (rotx_h, 4), (roty_h, 4), (rotz_h, 4)],
+                         ids=lambda v: getattr(v, '__name__', str(v)))
+def test_out_igual_a_sin_buffer(rot, n):
+    # Buffer lleno de basura y reutilizado entre ángulos, como en los bucles de las tareas
+    buf = np.full((n, n), np.nan)
+    for t in ANGULOS:
+        esperado = rot(t)
+        obtenido = rot(t, out=buf)
+        assert obtenido is buf
+        np.testing.assert_array_equal(buf, esperado)
+
+
+def test_out_en_vista_de_homogenea():
+    # rot*_h escribe el bloque 3x3 en una vista del buffer 4x4
+    T = np.full((4, 4), np.nan)
+    rotz_h(30.0, out=T)
+    np.testing.assert_array_equal(T[:3, :3], rotz(30.0))
+    np.testing.assert_array_equal(T[3], [0, 0, 0, 1])
+    np.testing.assert_array_equal(T[:3, 3], 0)
+
+
+@pytest.mark.parametrize('rot, lote', [(rotx, rotx_lote), (roty, roty_lote), (rotz, rotz_lote)],
+                         ids=['x', 'y', 'z'])
+def test_lote_igual_a_uno_por_uno(rot, lote):
+    R = lote(ANGULOS.reshape(-1, 3))
+    assert R.shape == (len(ANGULOS) // 3, 3, 3, 3)
+    np.testing.assert_allclose(R.reshape(-1, 3, 3), [rot(t) for t in ANGULOS], rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize('rot', [rotx, roty, rotz], ids=['x', 'y', 'z'])
+def test_ortonormales(rot):
+    for t in ANGULOS[::10]:
+        R = rot(t)
+        np.testing.assert_allclose(R @ R.T, np.eye(3), rtol=0, atol=1e-15)
+        assert np.isclose(np.linalg.det(R), 1.0, rtol=0, atol=1e-15)
@@ -0,0 +1,70 @@
+"""
+robotica.trig: los múltiplos de 90° dan 0 y ±1 exactos (escalares,
+arreglos de enteros y de floats), y la tabla de grados enteros coincide
+con np.sin/np.cos.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from robotica.trig import cosd, sincosd, sincosd_escalar, sind
+
+MULTIPLOS_90 = np.arange(-1440, 1441, 90)
+ESPERADO = {0: (0.0, 1.0), 90: (1.0, 0.0), 180: (0.0, -1.0), 270: (-1.0, 0.0)}
+
+
+@pytest.mark.parametrize('forma', ['int', 'float', 'escalar'])
+def test_multiplos_de_90_exactos(forma):
+    for t in MULTIPLOS_90:
+        s, c = ESPERADO[t % 360]
+        if forma == 'escalar':
+            obtenido = sincosd(float(t))
+        else:
+            obtenido = tuple(v[0] for v in sincosd(np.array([t], dtype=forma)))
+        assert obtenido == (s, c), (forma, t)
+
+
+def test_multiplos_de_90_exactos_en_arreglo_mixto():
+    # Los enteros exactos siguen exactos aunque el arreglo tenga ángulos fraccionarios
+    t = np.r_[MULTIPLOS_90 + 0.0, 0.5, -45.25]
+    s, c = sincosd(t)
+    esperado = np.array([ESPERADO[k % 360] for k in MULTIPLOS_90])
+    np.testing.assert_array_equal(s[:-2], esperado[:, 0])
+    np.testing.assert_array_equal(c[:-2], esperado[:, 1])
+
+
+def test_tabla_igual_a_numpy():
+    # Una vuelta: la tabla difiere de np.sin/np.cos sólo en los últimos bits
+    t = np.arange(360)
+    s, c = sincosd(t)
+    np.testing.assert_allclose(s, np.sin(np.deg2rad(t)), rtol=0, atol=5e-16)
+    np.testing.assert_allclose(c, np.cos(np.deg2rad(t)), rtol=0, atol=5e-16)
+    # Varias vueltas, enteros y floats: la tabla reduce a [0, 360) antes de
+    # convertir, np.sin arrastra el redondeo de deg2rad de ángulos grandes
+    t = np.arange(-720, 721)
+    r = np.deg2rad(t)
+    for entrada in (t, t.astype(float)):
+        s, c = sincosd(entrada)
+        np.testing.assert_allclose(s, np.sin(r), rtol=0, atol=2e-15)
+        np.testing.assert_allclose(c, np.cos(r), rtol=0, atol=2e-15)
+    for k in t[::7]:
+        s, c = sincosd_escalar(k)
+        assert abs(s - np.sin(np.deg2rad(k))) <= 2e-15
+        assert abs(c - np.cos(np.deg2rad(k))) <= 2e-15
+
+
+def test_angulos_fraccionarios_igual_a_numpy():
+    t = np.random.default_rng(0).uniform(-720, 720, 1000)
+    np.testing.assert_array_equal(sind(t), np.sin(np.deg2rad(t)))
+    np.testing.assert_array_equal(cosd(t), np.cos(np.deg2rad(t)))
+    assert isinstance(sind(12.5), float) and sind(12.5) == np.sin(np.deg2rad(12.5))
+
+
+def test_misma_forma_que_la_entrada():
+    t = np.zeros((4, 5))
+    s, c = sincosd(t)
+    assert s.shape == c.shape == (4, 5)